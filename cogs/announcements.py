@@ -7,22 +7,62 @@ Features:
 - Professional embed formatting
 - Image attachment support
 - Admin-only access
-- Announcement channel protection
+- Announcement channel protection with batched bulk deletes
+- Temporary channel lock when unauthorized messages flood in
+- Scheduled and repeating announcements that survive restarts
+- Concurrent fan-out to extra channels and partner guilds, crossposted on news channels
 - News command with title and message
 """
 
 import discord
 from discord.ext import commands
+import asyncio
+import json
 import logging
+import os
+import re
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
 import config
+from utils.raid import SlidingWindowCounter
+from utils.ratelimit import RouteLimiter
+from utils.settings import can_target_channel
 
 logger = logging.getLogger(__name__)
 
+# Intervals like 45m, 2h30m, 1d
+INTERVAL_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+INTERVAL_PART = re.compile(r'(\d+)([smhdw])')
+INTERVAL_PATTERN = re.compile(r'(?:\d+[smhdw])+')
+
 class Announcements(commands.Cog):
     """Professional announcement system"""
     
     def __init__(self, bot):
         self.bot = bot
+        self.pending_violations = {}  # channel_id -> unauthorized messages awaiting the next purge
+        self.purge_tasks = {}  # channel_id -> scheduled purge task
+        self.violation_rates = {}  # channel_id -> SlidingWindowCounter of unauthorized messages
+        self.locked_channels = set()  # channel_ids currently locked for spam
+        self.locking_channels = set()  # channel_ids with a lock in progress
+        
+        self.settings = bot.settings
+        self.migrate_targets_file('announcement_targets.json')
+        fanout = config.ANNOUNCEMENT_FANOUT
+        self.send_limiter = RouteLimiter(fanout['sends_per_second'], fanout['send_burst'])
+        self.publish_limiter = RouteLimiter(fanout['publishes_per_hour'] / 3600, fanout['publishes_per_hour'])
+        
+        # Channel unlocks and timed posts survive restarts via the job scheduler
+        self.bot.scheduler.register('announcement_unlock', self._unlock_channel_job)
+        self.bot.scheduler.register('scheduled_announcement', self._scheduled_announcement_job)
+    
+    def cog_unload(self):
+        """Stop pending purges"""
+        self.bot.scheduler.unregister('announcement_unlock')
+        self.bot.scheduler.unregister('scheduled_announcement')
+        for task in self.purge_tasks.values():
+            task.cancel()
     
     @commands.Cog.listener()
     async def on_message(self, message):
@@ -32,98 +72,228 @@ class Announcements(commands.Cog):
             return
         
         # Check if message is in announcements channel
-        if message.channel.id == config.ANNOUNCEMENTS_CHANNEL_ID:
+        if message.guild and message.channel.id == self.settings.get(message.guild.id, 'announcements_channel'):
             # Check if message is an !announce or !addnews command
             if not message.content.startswith(('!announce', '!addnews')):
-                # Delete the message
                 try:
-                    await message.delete()
-                    
-                    # Send warning as DM to the user
-                    warning_embed = discord.Embed(
-                        title="⚠️ Announcement Channel Warning",
-                        description=(
-                            f"Your message in {message.channel.mention} was deleted.\n\n"
-                            "This is an **announcement-only** channel. "
-                            "Only messages created with the `!announce` or `!addnews` commands are allowed.\n\n"
-                            "**To post an announcement:**\n"
-                            "• Use `!announce <message>` for general announcements\n"
-                            "• Use `!addnews <title> | <message>` for news updates"
-                        ),
-                        color=config.EMBED_COLORS['warning']
-                    )
-                    warning_embed.set_footer(text=config.BOT_FOOTER)
-                    
-                    # Try to send DM to the user
-                    try:
-                        await message.author.send(embed=warning_embed)
-                    except discord.Forbidden:
-                        # If DM fails, send a brief message in channel that auto-deletes
-                        temp_msg = await message.channel.send(
-                            f"⚠️ {message.author.mention} - Your message was deleted. "
-                            "Only `!announce` and `!addnews` commands are allowed here."
-                        )
-                        await temp_msg.delete(delay=5)
-                    
-                    logger.info(f"🚫 Deleted unauthorized message from {message.author.name} in announcements channel")
+                    await self.queue_violation(message)
                 except discord.Forbidden:
-                    logger.error(f"Missing permissions to delete messages in announcements channel")
+                    logger.error(f"Missing permissions to lock the announcements channel")
                 except Exception as e:
                     logger.error(f"Error handling announcement channel protection: {e}")
     
-    @commands.command(name='announce')
-    async def post_announcement(self, ctx, *, message):
-        """Post an announcement to the announcements channel
+    async def queue_violation(self, message):
+        """Collect an unauthorized message for the next bulk delete, locking the channel on a flood"""
+        channel = message.channel
+        self.pending_violations.setdefault(channel.id, []).append(message)
+        if channel.id not in self.purge_tasks:
+            self.purge_tasks[channel.id] = asyncio.create_task(self._purge_later(channel))
         
-        Usage: !announce Your message here
-        Note: You can attach images to your message and they will be included!
-        """
+        rate = self.violation_rates.get(channel.id)
+        if rate is None:
+            rate = self.violation_rates[channel.id] = SlidingWindowCounter(config.ANNOUNCEMENT_PROTECTION['lock_window'])
+        if rate.add() >= config.ANNOUNCEMENT_PROTECTION['lock_threshold'] and channel.id not in self.locked_channels:
+            await self.lock_channel(channel)
+    
+    async def _purge_later(self, channel):
+        """Bulk delete the channel's collected messages after the purge window"""
+        try:
+            await asyncio.sleep(config.ANNOUNCEMENT_PROTECTION['purge_window'])
+        except asyncio.CancelledError:
+            return
         
-        # Check if user has permission (admin or announcement role)
-        has_permission = (
-            ctx.author.guild_permissions.administrator or
-            any(role.id == config.ANNOUNCEMENT_ROLE_ID for role in ctx.author.roles)
+        # Take the batch before deleting so new violations start a new one
+        self.purge_tasks.pop(channel.id, None)
+        messages = self.pending_violations.pop(channel.id, [])
+        if not messages:
+            return
+        
+        try:
+            await self.purge_messages(channel, messages)
+            await self.warn_authors(channel, messages)
+        except discord.Forbidden:
+            logger.error(f"Missing permissions to delete messages in announcements channel")
+        except Exception as e:
+            logger.error(f"Error handling announcement channel protection: {e}")
+    
+    async def purge_messages(self, channel, messages):
+        """Delete messages 100 at a time (the bulk delete limit)"""
+        for start in range(0, len(messages), 100):
+            chunk = messages[start:start + 100]
+            try:
+                await channel.delete_messages(chunk, reason="Unauthorized messages in announcements channel")
+            except discord.NotFound:
+                # Some were already deleted; remove the rest one by one
+                for message in chunk:
+                    try:
+                        await message.delete()
+                    except discord.NotFound:
+                        pass
+        
+        logger.info(f"🚫 Deleted {len(messages)} unauthorized message(s) in announcements channel")
+    
+    async def warn_authors(self, channel, messages):
+        """Warn each author once per purge, by DM or a short-lived channel notice"""
+        authors = list({message.author.id: message.author for message in messages}.values())
+        
+        # Send warning as DM to the user
+        warning_embed = discord.Embed(
+            title="⚠️ Announcement Channel Warning",
+            description=(
+                f"Your message in {channel.mention} was deleted.\n\n"
+                "This is an **announcement-only** channel. "
+                "Only messages created with the `!announce` or `!addnews` commands are allowed.\n\n"
+                "**To post an announcement:**\n"
+                "• Use `!announce <message>` for general announcements\n"
+                "• Use `!addnews <title> | <message>` for news updates"
+            ),
+            color=config.EMBED_COLORS['warning']
         )
+        warning_embed.set_footer(text=config.BOT_FOOTER)
         
-        if not has_permission:
-            await ctx.send("❌ You don't have permission to post announcements!")
+        # Try to send DM to each user (one warning per dedupe window)
+        results = await asyncio.gather(*(
+            self.bot.dm.send(author, warning_embed, key=f"announcement-warning:{channel.id}")
+            for author in authors
+        ))
+        
+        # If DMs fail, send one brief message in channel that auto-deletes
+        undelivered = [author for author, delivered in zip(authors, results) if not delivered]
+        if undelivered and channel.id not in self.locked_channels:
+            temp_msg = await channel.send(
+                f"⚠️ {' '.join(author.mention for author in undelivered[:20])} - Your messages were deleted. "
+                "Only `!announce` and `!addnews` commands are allowed here."
+            )
+            await temp_msg.delete(delay=5)
+    
+    async def lock_channel(self, channel):
+        """Stop @everyone from posting for a while and schedule the unlock"""
+        if channel.id in self.locking_channels:
             return
+        self.locking_channels.add(channel.id)
+        try:
+            default_role = channel.guild.default_role
+            overwrite = channel.overwrites_for(default_role)
+            previous = overwrite.send_messages
+            if previous is False:
+                # Already read-only for @everyone; it's our lock only if locked before a restart
+                if any(payload['channel_id'] == channel.id for _, _, _, payload in self.bot.scheduler.pending('announcement_unlock')):
+                    self.locked_channels.add(channel.id)
+                return
+            overwrite.send_messages = False
+            
+            await channel.set_permissions(default_role, overwrite=overwrite, reason="Spam flood in announcements channel")
+            
+            lock_seconds = config.ANNOUNCEMENT_PROTECTION['lock_seconds']
+            self.bot.scheduler.schedule('announcement_unlock', delay=lock_seconds, payload={
+                'channel_id': channel.id,
+                'send_messages': previous
+            })
+            # Only marked locked once the unlock is queued, so a failed lock can be retried
+            self.locked_channels.add(channel.id)
+        finally:
+            self.locking_channels.discard(channel.id)
         
-        # Get announcements channel
-        announcements_channel = self.bot.get_channel(config.ANNOUNCEMENTS_CHANNEL_ID)
-        if not announcements_channel:
-            await ctx.send("❌ Announcements channel not configured!")
+        embed = discord.Embed(
+            title="🔒 Channel Temporarily Locked",
+            description=(
+                "Too many unauthorized messages were posted here. "
+                f"The channel will unlock automatically in {lock_seconds // 60} minute(s)."
+            ),
+            color=config.EMBED_COLORS['warning']
+        )
+        embed.set_footer(text=config.BOT_FOOTER)
+        await channel.send(embed=embed, delete_after=lock_seconds)
+        logger.warning(f"🔒 Locked announcements channel for {lock_seconds}s after a spam flood")
+    
+    async def _unlock_channel_job(self, payload):
+        """Scheduled job: restore @everyone's send permission after a lock"""
+        channel = self.bot.get_channel(payload['channel_id'])
+        self.locked_channels.discard(payload['channel_id'])
+        if not channel:
             return
         
+        default_role = channel.guild.default_role
+        overwrite = channel.overwrites_for(default_role)
+        overwrite.send_messages = payload['send_messages']
+        await channel.set_permissions(
+            default_role,
+            overwrite=None if overwrite.is_empty() else overwrite,
+            reason="Announcements spam lock expired"
+        )
+        logger.info("🔓 Unlocked announcements channel")
+    
+    def can_announce(self, member):
+        """Admins and the announcement role may post announcements"""
+        return (
+            member.guild_permissions.administrator or
+            self.settings.member_has_role(member, 'announcement_role')
+        )
+    
+    @staticmethod
+    def first_image_url(message):
+        """URL of the first image attached to a message, if any"""
+        for attachment in message.attachments:
+            if any(attachment.filename.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp']):
+                return attachment.url
+        return None
+    
+    def create_announcement_embed(self, guild, message, author_name, image_url=None, title=None):
+        """Announcement embed, or a news embed when a title is given"""
         embed = discord.Embed(
-            title=f"📢 {config.COMPANY_NAME} Announcement",
+            title=f"📰 {title}" if title else f"📢 {config.COMPANY_NAME} Announcement",
             description=message,
             color=config.EMBED_COLORS['info']
         )
         
-        if ctx.guild.icon:
+        if guild.icon:
             embed.set_author(
-                name=f"{config.COMPANY_NAME}",
-                icon_url=ctx.guild.icon.url
+                name=f"{config.COMPANY_NAME} News" if title else f"{config.COMPANY_NAME}",
+                icon_url=guild.icon.url
             )
         
         embed.set_footer(
-            text=f"Posted by {ctx.author.display_name} • {config.BOT_FOOTER}"
+            text=f"Posted by {author_name} • {config.BOT_FOOTER}"
         )
         embed.timestamp = discord.utils.utcnow()
         
-        # Check for image attachments and add to embed
-        if ctx.message.attachments:
-            for attachment in ctx.message.attachments:
-                if any(attachment.filename.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp']):
-                    embed.set_image(url=attachment.url)
-                    break  # Only use the first image
+        if image_url:
+            embed.set_image(url=image_url)
+        return embed
+    
+    @staticmethod
+    def parse_news(content):
+        """Split `Title | message`, returning (title, message) or None"""
+        if '|' not in content:
+            return None
+        title, message = (part.strip() for part in content.split('|', 1))
+        if not title or not message:
+            return None
+        return title, message
+    
+    @commands.group(name='announce', invoke_without_command=True, extras={'help_tier': 'admin'})
+    async def post_announcement(self, ctx, *, message):
+        """Post an announcement to the announcements channel
+        
+        Usage: !announce Your message here
+        Note: You can attach images to your message and they will be included!
+        """
         
-        await announcements_channel.send(embed=embed)
-        await ctx.send(f"✅ Announcement posted to {announcements_channel.mention}")
+        # Check if user has permission (admin or announcement role)
+        if not self.can_announce(ctx.author):
+            await ctx.send("❌ You don't have permission to post announcements!")
+            return
+        
+        # Include the first attached image, if any
+        embed = self.create_announcement_embed(
+            ctx.guild, message, ctx.author.display_name, self.first_image_url(ctx.message)
+        )
+        
+        results = await self.fan_out(ctx.guild, embed)
+        await ctx.send(embed=self.create_delivery_report("Announcement", results))
         logger.info(f"📢 {ctx.author.name} posted announcement: {message[:50]}...")
     
-    @commands.command(name='addnews')
+    @commands.command(name='addnews', extras={'help_tier': 'admin'})
     async def add_news(self, ctx, *, content):
         """Post a news update with a custom title and message
         
@@ -132,12 +302,7 @@ class Announcements(commands.Cog):
         """
         
         # Check if user has permission (admin or announcement role)
-        has_permission = (
-            ctx.author.guild_permissions.administrator or
-            any(role.id == config.ANNOUNCEMENT_ROLE_ID for role in ctx.author.roles)
-        )
-        
-        if not has_permission:
+        if not self.can_announce(ctx.author):
             await ctx.send("❌ You don't have permission to post announcements!")
             return
         
@@ -147,54 +312,422 @@ class Announcements(commands.Cog):
             return
         
         # Split title and message
-        parts = content.split('|', 1)
-        title = parts[0].strip()
-        message = parts[1].strip()
-        
-        if not title or not message:
+        news = self.parse_news(content)
+        if not news:
             await ctx.send("❌ **Error:** Both title and message are required!")
             return
+        title, message = news
+        
+        # Create news embed with the first attached image, if any
+        embed = self.create_announcement_embed(
+            ctx.guild, message, ctx.author.display_name, self.first_image_url(ctx.message), title=title
+        )
+        
+        # Post to every announcement target
+        results = await self.fan_out(ctx.guild, embed)
+        await ctx.send(embed=self.create_delivery_report("News", results))
+        logger.info(f"📰 {ctx.author.name} posted news: {title}")
+    
+    # ---- Scheduled announcements ----
+    
+    @staticmethod
+    def parse_interval(text):
+        """Seconds in an interval like `45m`, `2h30m` or `1d`, or None"""
+        if not INTERVAL_PATTERN.fullmatch(text.lower()):
+            return None
+        return sum(int(amount) * INTERVAL_UNITS[unit] for amount, unit in INTERVAL_PART.findall(text.lower())) or None
+    
+    def parse_schedule(self, spec, now=None):
+        """Parse `<when> [every <interval>] <rest>` into (run_at, interval, rest)
+        
+        `<when>` is a delay (`2h30m`), a UTC time today or tomorrow (`18:00`),
+        or a UTC date and time (`2025-12-24 18:00`). Returns None if it
+        can't be parsed.
+        """
+        now = now or time.time()
+        tokens = spec.split(maxsplit=4)
+        run_at = None
+        used = 0
+        
+        if len(tokens) >= 2:
+            try:
+                moment = datetime.strptime(f"{tokens[0]} {tokens[1]}", '%Y-%m-%d %H:%M')
+                run_at = moment.replace(tzinfo=timezone.utc).timestamp()
+                used = 2
+            except ValueError:
+                pass
+        
+        if run_at is None and tokens:
+            delay = self.parse_interval(tokens[0])
+            if delay:
+                run_at = now + delay
+            else:
+                try:
+                    clock = datetime.strptime(tokens[0], '%H:%M')
+                    today = datetime.fromtimestamp(now, timezone.utc)
+                    moment = today.replace(hour=clock.hour, minute=clock.minute, second=0, microsecond=0)
+                    if moment.timestamp() <= now:
+                        moment += timedelta(days=1)
+                    run_at = moment.timestamp()
+                except ValueError:
+                    return None
+            used = 1
+        
+        if run_at is None:
+            return None
+        
+        interval = None
+        rest = tokens[used:]
+        if len(rest) >= 2 and rest[0].lower() == 'every':
+            interval = self.parse_interval(rest[1])
+            if interval:
+                rest = rest[2:]
+        
+        # Rebuild the remainder from the original text to keep its line breaks
+        text = spec
+        for token in tokens[:len(tokens) - len(rest)]:
+            text = text.split(token, 1)[1]
+        return round(run_at), interval, text.strip()
+    
+    def scheduled_posts(self, guild_id=None, schedule_id=None):
+        """Pending scheduled-announcement jobs as (job_id, run_at, payload)"""
+        return [
+            (job_id, run_at, payload)
+            for job_id, _, run_at, payload in self.bot.scheduler.pending('scheduled_announcement')
+            if (guild_id is None or payload['guild_id'] == guild_id)
+            and (schedule_id is None or payload['schedule_id'] == schedule_id)
+        ]
+    
+    @post_announcement.group(name='schedule', invoke_without_command=True)
+    async def schedule_announcement(self, ctx, *, spec):
+        """Schedule an announcement (or news) for later, optionally repeating
+        
+        Usage: !announce schedule <when> [every <interval>] <message>
+               !announce schedule <when> [every <interval>] news <title> | <message>
+        Example: !announce schedule 2025-12-24 18:00 every 7d Weekly event starts now!
+        """
+        if not self.can_announce(ctx.author):
+            await ctx.send("❌ You don't have permission to post announcements!")
+            return
+        
+        settings = config.SCHEDULED_ANNOUNCEMENTS
+        parsed = self.parse_schedule(spec)
+        if not parsed or not parsed[2]:
+            await ctx.send(
+                "❌ **Invalid format!** Use: `!announce schedule <when> [every <interval>] <message>`\n"
+                "`<when>` can be a delay (`2h30m`), a UTC time (`18:00`) or a UTC date and time (`2025-12-24 18:00`)"
+            )
+            return
+        run_at, interval, text = parsed
+        
+        now = time.time()
+        if run_at <= now:
+            await ctx.send("❌ **Error:** That time is in the past!")
+            return
+        if run_at - now > settings['max_delay_days'] * 86400:
+            await ctx.send(f"❌ **Error:** Announcements can be scheduled at most {settings['max_delay_days']} days ahead!")
+            return
+        if interval and interval < settings['min_interval']:
+            await ctx.send(f"❌ **Error:** Repeating announcements must be at least {settings['min_interval'] // 60} minutes apart!")
+            return
         
-        # Get announcements channel
-        announcements_channel = self.bot.get_channel(config.ANNOUNCEMENTS_CHANNEL_ID)
-        if not announcements_channel:
-            await ctx.send("❌ Announcements channel not configured!")
+        title = None
+        if text.split(maxsplit=1)[0].lower() == 'news':
+            news = self.parse_news(text[4:])
+            if not news:
+                await ctx.send("❌ **Invalid format!** Use: `news <title> | <message>`")
+                return
+            title, text = news
+        
+        if len(self.scheduled_posts(ctx.guild.id)) >= settings['max_pending']:
+            await ctx.send(f"❌ **Error:** This server already has {settings['max_pending']} scheduled announcements!")
             return
         
-        # Create news embed
+        schedule_id = uuid.uuid4().hex[:6]
+        self.bot.scheduler.schedule('scheduled_announcement', run_at=run_at, payload={
+            'schedule_id': schedule_id,
+            'guild_id': ctx.guild.id,
+            'title': title,
+            'message': text,
+            'image_url': self.first_image_url(ctx.message),
+            'author_name': ctx.author.display_name,
+            'interval': interval,
+            'occurrence': run_at
+        })
+        
+        repeat = f"\n🔁 Repeats every `{self.format_interval(interval)}`" if interval else ""
         embed = discord.Embed(
-            title=f"📰 {title}",
-            description=message,
-            color=config.EMBED_COLORS['info']
+            title="⏰ Announcement Scheduled",
+            description=f"**ID:** `{schedule_id}`\n📅 Posts <t:{run_at}:F> (<t:{run_at}:R>){repeat}",
+            color=config.EMBED_COLORS['success']
         )
+        embed.set_footer(text=f"Cancel with !announce schedule cancel {schedule_id} • {config.BOT_FOOTER}")
+        await ctx.send(embed=embed)
+        logger.info(f"⏰ {ctx.author.name} scheduled announcement {schedule_id} for {run_at}")
+    
+    @schedule_announcement.command(name='list')
+    async def list_scheduled(self, ctx):
+        """List this server's scheduled announcements"""
+        if not self.can_announce(ctx.author):
+            await ctx.send("❌ You don't have permission to post announcements!")
+            return
         
-        if ctx.guild.icon:
-            embed.set_author(
-                name=f"{config.COMPANY_NAME} News",
-                icon_url=ctx.guild.icon.url
+        posts = self.scheduled_posts(ctx.guild.id)
+        embed = discord.Embed(
+            title="⏰ Scheduled Announcements",
+            color=config.EMBED_COLORS['info']
+        )
+        if not posts:
+            embed.description = "No announcements are scheduled."
+        for _, run_at, payload in posts[:25]:
+            repeat = f" • 🔁 every `{self.format_interval(payload['interval'])}`" if payload['interval'] else ""
+            preview = payload['title'] or payload['message']
+            embed.add_field(
+                name=f"`{payload['schedule_id']}` • {payload['author_name']}",
+                value=f"<t:{round(run_at)}:R>{repeat}\n{preview[:100]}",
+                inline=False
             )
+        embed.set_footer(text=config.BOT_FOOTER)
+        await ctx.send(embed=embed)
+    
+    @schedule_announcement.command(name='cancel')
+    async def cancel_scheduled(self, ctx, schedule_id: str):
+        """Cancel a scheduled announcement, including future repeats"""
+        if not self.can_announce(ctx.author):
+            await ctx.send("❌ You don't have permission to post announcements!")
+            return
         
-        embed.set_footer(
-            text=f"Posted by {ctx.author.display_name} • {config.BOT_FOOTER}"
+        posts = self.scheduled_posts(ctx.guild.id, schedule_id.lower())
+        if not posts:
+            await ctx.send(f"❌ No scheduled announcement with ID `{schedule_id}`!")
+            return
+        
+        for job_id, _, _ in posts:
+            self.bot.scheduler.cancel(job_id)
+        await ctx.send(f"✅ Cancelled scheduled announcement `{schedule_id}`")
+        logger.info(f"⏰ {ctx.author.name} cancelled scheduled announcement {schedule_id}")
+    
+    @staticmethod
+    def format_interval(seconds):
+        """Compact interval such as `1d 6h`"""
+        parts = []
+        for unit in ('w', 'd', 'h', 'm', 's'):
+            amount, seconds = divmod(seconds, INTERVAL_UNITS[unit])
+            if amount:
+                parts.append(f"{amount}{unit}")
+        return ' '.join(parts)
+    
+    async def _scheduled_announcement_job(self, payload):
+        """Scheduled job: queue the next repeat, then post exactly once"""
+        scheduler = self.bot.scheduler
+        occurrence = payload['occurrence']
+        
+        interval = payload['interval']
+        if interval:
+            # Skip repeats missed while offline rather than posting them all at once
+            now = time.time()
+            next_run = occurrence + interval
+            if next_run <= now:
+                next_run += interval * int((now - next_run) // interval + 1)
+            # A re-run after a crash finds the next repeat already queued
+            if not any(queued['occurrence'] == next_run for _, _, queued in self.scheduled_posts(schedule_id=payload['schedule_id'])):
+                scheduler.schedule('scheduled_announcement', run_at=next_run, payload={**payload, 'occurrence': next_run})
+        
+        claim = f"announcement:{payload['schedule_id']}:{occurrence}"
+        if not scheduler.claim(claim):
+            return  # Already posted before a restart
+        
+        guild = self.bot.get_guild(payload['guild_id'])
+        if not guild:
+            logger.warning(f"⚠️ Scheduled announcement {payload['schedule_id']} skipped: bot is no longer in its server")
+            return
+        
+        embed = self.create_announcement_embed(
+            guild, payload['message'], payload['author_name'], payload['image_url'], title=payload['title']
         )
-        embed.timestamp = discord.utils.utcnow()
+        results = await self.fan_out(guild, embed)
+        failed = [(channel_id, status) for channel_id, delivered, status in results if not delivered]
+        if all(delivered is False for _, delivered, _ in results):
+            scheduler.release(claim)  # Definitely nothing went out; let the scheduler retry the post
+            raise RuntimeError(f"no announcement target accepted the post ({failed[0][1] if failed else 'no targets'})")
         
-        # Check for image attachments
-        if ctx.message.attachments:
-            for attachment in ctx.message.attachments:
-                if any(attachment.filename.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp']):
-                    embed.set_image(url=attachment.url)
-                    break
+        # Unknown outcomes (timeouts) keep the claim and aren't retried, since a retry could post twice
+        for channel_id, status in failed:
+            logger.warning(f"⚠️ Scheduled announcement {payload['schedule_id']} not confirmed for {channel_id}: {status}")
+        logger.info(f"⏰ Posted scheduled announcement {payload['schedule_id']} to {len(results) - len(failed)} channel(s)")
+    
+    # ---- Announcement fan-out ----
+    
+    def migrate_targets_file(self, path):
+        """Move targets saved by older versions into the main guild's settings"""
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            current = self.settings.get(config.GUILD_ID, 'announcement_targets')
+            self.settings.set(config.GUILD_ID, 'announcement_targets', current + saved)
+            os.replace(path, f"{path}.migrated")
+            logger.info(f"✅ Migrated {len(saved)} announcement target(s) into guild settings")
+        except Exception as e:
+            logger.error(f"Error migrating announcement targets: {e}")
+    
+    def announcement_targets(self, guild):
+        """Every channel a guild's announcements go to, its announcements channel first"""
+        channel_ids = [
+            self.settings.get(guild.id, 'announcements_channel'),
+            *self.settings.get(guild.id, 'announcement_targets')
+        ]
+        return [channel_id for channel_id in dict.fromkeys(channel_ids) if channel_id]
+    
+    async def send_to_target(self, channel_id, embed):
+        """Send to one channel, crossposting on news channels; returns (delivered, status)
         
-        # Post to announcements channel
-        await announcements_channel.send(embed=embed)
-        await ctx.send(f"✅ News posted to {announcements_channel.mention}")
-        logger.info(f"📰 {ctx.author.name} posted news: {title}")
+        delivered is None when the outcome is unknown (Discord may have accepted the message).
+        """
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            return False, "channel not found"
+        
+        timeout = config.ANNOUNCEMENT_FANOUT['timeout']
+        try:
+            await asyncio.wait_for(self.send_limiter.acquire(channel_id), timeout)
+        except asyncio.TimeoutError:
+            return False, "timed out waiting to send"
+        try:
+            message = await asyncio.wait_for(channel.send(embed=embed), timeout)
+        except asyncio.TimeoutError:
+            return None, "timed out, may have been delivered"
+        except discord.Forbidden:
+            return False, "missing permissions"
+        except discord.NotFound:
+            return False, "channel not found"
+        except discord.HTTPException as e:
+            if e.status >= 500:
+                return None, f"server error ({e.status}), may have been delivered"
+            return False, f"failed ({e.status})"
+        
+        if not (config.ANNOUNCEMENT_FANOUT['auto_publish'] and channel.is_news()):
+            return True, "sent"
+        
+        # Crossposts are limited per channel per hour; don't queue behind that budget
+        if not self.publish_limiter.try_acquire(channel_id):
+            return True, "sent, crosspost limit reached"
+        try:
+            await asyncio.wait_for(message.publish(), timeout)
+        except asyncio.TimeoutError:
+            return True, "sent, crosspost timed out"
+        except discord.HTTPException as e:
+            return True, f"sent, crosspost failed ({e.status})"
+        return True, "sent and published"
+    
+    async def fan_out(self, guild, embed):
+        """Send an embed to every target concurrently; returns [(channel_id, delivered, status)]"""
+        channel_ids = self.announcement_targets(guild)
+        results = await asyncio.gather(
+            *(self.send_to_target(channel_id, embed) for channel_id in channel_ids),
+            return_exceptions=True
+        )
+        report = []
+        for channel_id, result in zip(channel_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending announcement to {channel_id}: {result}")
+                result = (None, "error, may have been delivered")
+            report.append((channel_id, *result))
+        return report
+    
+    def target_label(self, channel_id):
+        """Mention for a target channel, with its server name"""
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            return f"`{channel_id}`"
+        return f"{channel.mention} ({channel.guild.name})"
+    
+    def create_delivery_report(self, kind, results):
+        """Per-target delivery summary for the poster"""
+        delivered = sum(1 for _, ok, _ in results if ok)
+        unknown = sum(1 for _, ok, _ in results if ok is None)
+        if results and delivered == len(results):
+            color = config.EMBED_COLORS['success']
+        else:
+            color = config.EMBED_COLORS['warning'] if delivered or unknown else config.EMBED_COLORS['error']
+        
+        unconfirmed = f" ({unknown} unconfirmed)" if unknown else ""
+        embed = discord.Embed(
+            title=f"{'✅' if delivered else '❌'} {kind} posted to {delivered}/{len(results)} channel(s){unconfirmed}",
+            description='\n'.join(
+                f"{'✅' if ok else '⚠️' if ok is None else '❌'} {self.target_label(channel_id)} - {status}"
+                for channel_id, ok, status in results
+            )[:4000] or f"No announcements channel is set for this server. Use `{config.PREFIX}settings set announcements_channel #channel`",
+            color=color
+        )
+        embed.set_footer(text=config.BOT_FOOTER)
+        return embed
+    
+    @staticmethod
+    def parse_channel_id(text):
+        """Channel ID from a mention or a raw ID"""
+        text = text.strip('<#>')
+        return int(text) if text.isdigit() else None
+    
+    @commands.group(name='announcetargets', invoke_without_command=True)
+    @commands.has_permissions(administrator=True)
+    async def announce_targets(self, ctx):
+        """List the channels announcements are sent to"""
+        main_channel = self.settings.get(ctx.guild.id, 'announcements_channel')
+        embed = discord.Embed(
+            title="📢 Announcement Targets",
+            description='\n'.join(
+                f"• {self.target_label(channel_id)}{' *(announcements channel)*' if channel_id == main_channel else ''}"
+                for channel_id in self.announcement_targets(ctx.guild)
+            ) or "No announcement channels configured.",
+            color=config.EMBED_COLORS['info']
+        )
+        embed.set_footer(text=f"Add with !announcetargets add <#channel or ID> • {config.BOT_FOOTER}")
+        await ctx.send(embed=embed)
+    
+    @announce_targets.command(name='add')
+    @commands.has_permissions(administrator=True)
+    async def add_target(self, ctx, channel: str):
+        """Also send announcements to a channel (other servers need Manage Channels there)"""
+        channel_id = self.parse_channel_id(channel)
+        target = self.bot.get_channel(channel_id) if channel_id else None
+        if not isinstance(target, discord.TextChannel):
+            await ctx.send("❌ **Error:** I can't see that text channel! Use a channel mention or ID.")
+            return
+        if not target.permissions_for(target.guild.me).send_messages:
+            await ctx.send(f"❌ **Error:** I can't send messages in {self.target_label(target.id)}!")
+            return
+        if not can_target_channel(ctx.author, ctx.guild, target):
+            await ctx.send(f"❌ **Error:** You need Manage Channels in **{target.guild.name}** to send announcements there!")
+            return
+        if target.id in self.announcement_targets(ctx.guild):
+            await ctx.send(f"❌ {self.target_label(target.id)} is already an announcement target!")
+            return
+        
+        targets = self.settings.get(ctx.guild.id, 'announcement_targets')
+        self.settings.set(ctx.guild.id, 'announcement_targets', targets + [target.id])
+        await ctx.send(f"✅ Announcements will also be sent to {self.target_label(target.id)}")
+        logger.info(f"📢 {ctx.author.name} added announcement target {target.id}")
+    
+    @announce_targets.command(name='remove')
+    @commands.has_permissions(administrator=True)
+    async def remove_target(self, ctx, channel: str):
+        """Stop sending announcements to an extra target channel"""
+        channel_id = self.parse_channel_id(channel)
+        targets = self.settings.get(ctx.guild.id, 'announcement_targets')
+        if channel_id not in targets:
+            await ctx.send("❌ That channel isn't an announcement target!")
+            return
+        
+        self.settings.set(ctx.guild.id, 'announcement_targets', [target for target in targets if target != channel_id])
+        await ctx.send(f"✅ Removed {self.target_label(channel_id)} from announcement targets")
+        logger.info(f"📢 {ctx.author.name} removed announcement target {channel_id}")
     
     @commands.command(name='setannounce')
     @commands.has_permissions(administrator=True)
     async def set_announce_channel(self, ctx, channel: discord.TextChannel = None):
-        """Set the announcement channel for the bot
+        """Set this server's announcement channel
         
         Usage: !setannounce #channel-name
         Example: !setannounce #announcements
@@ -204,42 +737,22 @@ class Announcements(commands.Cog):
             await ctx.send("❌ **Error:** Please mention a channel!\n**Usage:** `!setannounce #channel-name`")
             return
         
-        # Update the config file
-        try:
-            with open('config.py', 'r', encoding='utf-8') as f:
-                config_content = f.read()
-            
-            # Replace the ANNOUNCEMENTS_CHANNEL_ID value
-            import re
-            pattern = r"ANNOUNCEMENTS_CHANNEL_ID = int\(os\.getenv\('ANNOUNCEMENTS_CHANNEL_ID', '\d+'\)\)"
-            replacement = f"ANNOUNCEMENTS_CHANNEL_ID = int(os.getenv('ANNOUNCEMENTS_CHANNEL_ID', '{channel.id}'))"
-            
-            new_content = re.sub(pattern, replacement, config_content)
-            
-            with open('config.py', 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            # Update the config module in memory
-            config.ANNOUNCEMENTS_CHANNEL_ID = channel.id
-            
-            # Send confirmation
-            embed = discord.Embed(
-                title="✅ Announcement Channel Updated",
-                description=f"The announcement channel has been set to {channel.mention}\n\n"
-                           f"**Channel Protection Active:**\n"
-                           f"• Only `!announce` and `!addnews` commands allowed\n"
-                           f"• Other messages will be automatically deleted\n"
-                           f"• Users will receive a warning",
-                color=config.EMBED_COLORS['success']
-            )
-            embed.set_footer(text=config.BOT_FOOTER)
-            
-            await ctx.send(embed=embed)
-            logger.info(f"📢 Announcement channel set to {channel.name} (ID: {channel.id}) by {ctx.author.name}")
-            
-        except Exception as e:
-            await ctx.send(f"❌ **Error updating config:** {e}")
-            logger.error(f"Error setting announcement channel: {e}")
+        self.settings.set(ctx.guild.id, 'announcements_channel', channel.id)
+        
+        # Send confirmation
+        embed = discord.Embed(
+            title="✅ Announcement Channel Updated",
+            description=f"The announcement channel has been set to {channel.mention}\n\n"
+                       f"**Channel Protection Active:**\n"
+                       f"• Only `!announce` and `!addnews` commands allowed\n"
+                       f"• Other messages will be automatically deleted\n"
+                       f"• Users will receive a warning",
+            color=config.EMBED_COLORS['success']
+        )
+        embed.set_footer(text=config.BOT_FOOTER)
+        
+        await ctx.send(embed=embed)
+        logger.info(f"📢 Announcement channel set to {channel.name} (ID: {channel.id}) by {ctx.author.name}")
 
 async def setup(bot):
     """Setup function for the cog"""
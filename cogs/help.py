@@ -4,9 +4,9 @@ Custom help system with professional theming and organized commands
 
 Features:
 - Professional help interface
-- Organized command categories
-- Interactive help menus
-- Admin command filtering
+- Help pages generated from the loaded cogs and commands
+- Pages cached per prefix and rebuilt when extensions change
+- Commands shown by viewer tier (members, support staff, admins)
 """
 
 import discord
@@ -16,334 +16,333 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# Presentation for known cogs; other cogs get a page from their name and docstring
+HELP_CATEGORIES = {
+    'HelpCommand': {
+        'key': 'general', 'title': "🎭 General", 'aliases': ['basic', 'main'],
+        'description': "Basic bot functionality and information",
+    },
+    'Welcome': {
+        'key': 'welcome', 'title': "👋 Welcome", 'aliases': ['stats'],
+        'description': "Welcome messages, auto-roles and server statistics",
+    },
+    'InviteTracker': {
+        'key': 'invites', 'title': "📨 Invites", 'aliases': ['invite', 'tracking', 'leaderboard'],
+        'description': "Invite tracking and leaderboards",
+        'notes': [(
+            "🏆 Recruitment Ranks",
+            "🦑 **Leviathan Summoner** (100+ invites)\n"
+            "👹 **Demon Recruiter** (50+ invites)\n"
+            "🕷️ **Spider's Web Master** (25+ invites)\n"
+            "👻 **Ghost Whisperer** (10+ invites)\n"
+            "🧟 **Zombie Herder** (5+ invites)\n"
+            "🎃 **Novice Cultist** (1+ invites)"
+        )],
+    },
+    'RoleAssignment': {
+        'key': 'roles', 'title': "🎮 Roles", 'aliases': ['role', 'selection'],
+        'description': "Role selection and management",
+    },
+    'TicketSystem': {
+        'key': 'tickets', 'title': "🎫 Tickets", 'aliases': ['ticket', 'support'],
+        'description': "Support ticket system",
+        'notes': [(
+            "👥 Opening a Ticket",
+            "Pick a ticket type from the dropdown in the ticket panel channel"
+        )],
+    },
+    'Announcements': {
+        'key': 'announcements', 'title': "📢 Announcements", 'aliases': ['announce', 'news'],
+        'description': "Announcements, news posts and scheduling",
+    },
+    'NewsFeeds': {
+        'key': 'feeds', 'title': "📰 News Feeds", 'aliases': ['newsfeeds'],
+        'description': "Game-news feed ingestion",
+    },
+    'Settings': {
+        'key': 'settings', 'title': "⚙️ Settings", 'aliases': ['config'],
+        'description': "Per-server channel and role settings",
+    },
+}
+
+ADMIN_ALIASES = ('admin', 'administrator', 'mod', 'staff')
+TIERS = ('member', 'support', 'admin')  # Who can see a command, lowest first
+FIELD_LIMIT = 1024
+EMBED_LIMIT = 6000
+
 class HelpCommand(commands.Cog):
     """Custom help command system"""
-    
+
     def __init__(self, bot):
         self.bot = bot
-    
-    @commands.command(name='help', aliases=['h', 'commands'])
-    @commands.cooldown(1, 10, commands.BucketType.user)
-    async def help_command(self, ctx, category: str = None):
-        """Show help information for bot commands"""
-        
-        if category:
-            await self.show_category_help(ctx, category.lower())
+        self.pages = {}  # prefix -> generated help pages (embed dicts)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Build the help pages once every extension is loaded"""
+        self.get_pages(config.PREFIX)
+
+    @commands.Cog.listener()
+    async def on_extension_update(self, name):
+        """Commands changed, so the cached pages are stale"""
+        self.pages.clear()
+
+    @staticmethod
+    def command_tier(command):
+        """Lowest viewer tier that sees a command
+
+        The nearest command (itself, then its parents) with a `help_tier` in
+        its extras or with checks decides. Checks make it staff-only at the
+        tier they declare (`help_tier` on the predicate, admin if not set).
+        """
+        for cmd in (command, *command.parents):
+            if 'help_tier' in cmd.extras:
+                return cmd.extras['help_tier']
+            if cmd.checks:
+                return max((getattr(check, 'help_tier', 'admin') for check in cmd.checks), key=TIERS.index)
+        return 'admin' if command.hidden else 'member'
+
+    @staticmethod
+    def command_line(prefix, command):
+        """Usage line for a command list"""
+        usage = f"{prefix}{command.qualified_name} {command.signature}".strip()
+        return f"**`{usage}`**\n└ {command.short_doc or 'No description'}"
+
+    @staticmethod
+    def add_lines(embed, name, lines):
+        """Add lines as one or more fields, splitting at the field size limit"""
+        chunk = []
+        for line in lines:
+            if chunk and len('\n'.join(chunk + [line])) > FIELD_LIMIT:
+                embed.add_field(name=name, value='\n'.join(chunk), inline=False)
+                name = f"{name} (cont.)"
+                chunk = []
+            chunk.append(line[:FIELD_LIMIT])
+        if chunk:
+            embed.add_field(name=name, value='\n'.join(chunk), inline=False)
+
+    def categories(self):
+        """(metadata, commands) for every loaded cog with commands, in display order"""
+        order = list(HELP_CATEGORIES)
+        cogs = sorted(self.bot.cogs.values(), key=lambda cog: (
+            order.index(cog.qualified_name) if cog.qualified_name in order else len(order),
+            cog.qualified_name
+        ))
+
+        result = []
+        for cog in cogs:
+            cog_commands = sorted(
+                (command for command in cog.walk_commands() if command.enabled),
+                key=lambda command: command.qualified_name
+            )
+            if not cog_commands:
+                continue
+            meta = HELP_CATEGORIES.get(cog.qualified_name) or {
+                'key': cog.qualified_name.lower(),
+                'title': cog.qualified_name,
+                'aliases': [],
+                'description': cog.description or "No description",
+            }
+            result.append((meta, cog_commands))
+        return result
+
+    def build_pages(self, prefix):
+        """Generate every help page for a prefix as embed dicts, one variant per viewer tier"""
+        categories = self.categories()
+        pages = {'aliases': {}, 'categories': {}, 'commands': {}, 'main': {}, 'staff': {}}
+        staff_lines = {viewer: [] for viewer in TIERS[1:]}
+
+        for meta, cog_commands in categories:
+            key = meta['key']
+            for alias in (key, *meta['aliases']):
+                pages['aliases'].setdefault(alias, key)
+
+            tiers = {command: TIERS.index(self.command_tier(command)) for command in cog_commands}
+            public = [command for command in cog_commands if tiers[command] == 0]
+
+            variants = {}
+            for rank, viewer in enumerate(TIERS):
+                staff = [command for command in cog_commands if 0 < tiers[command] <= rank]
+                if not public and not staff:
+                    continue
+                embed = discord.Embed(
+                    title=f"{meta['title']} Commands",
+                    description=meta['description'],
+                    color=config.EMBED_COLORS['warning'] if not public else config.EMBED_COLORS['info']
+                )
+                if public:
+                    self.add_lines(embed, "📋 Available Commands", [self.command_line(prefix, command) for command in public])
+                if staff:
+                    self.add_lines(embed, "⚙️ Staff Commands", [self.command_line(prefix, command) for command in staff])
+                    staff_lines[viewer].append((meta['title'], [self.command_line(prefix, command) for command in staff]))
+                for name, value in meta.get('notes', []):
+                    embed.add_field(name=name, value=value, inline=False)
+                embed.set_footer(text=config.BOT_FOOTER)
+                variants[viewer] = embed.to_dict()
+            pages['categories'][key] = variants
+
+            for command in cog_commands:
+                pages['commands'][command.qualified_name] = (tiers[command], self.build_command_page(prefix, command))
+
+        for viewer, lines in staff_lines.items():
+            pages['staff'][viewer] = self.build_staff_page(prefix, viewer, lines)
+        for viewer in TIERS:
+            pages['main'][viewer] = self.build_main_page(prefix, categories, pages, viewer)
+
+        logger.info(f"📖 Built help pages for {len(categories)} categories and {len(pages['commands'])} commands")
+        return pages
+
+    def build_staff_page(self, prefix, viewer, staff_lines):
+        """Overview of every staff command a viewer tier can use, grouped by category"""
+        if viewer == 'admin':
+            title, description = "⚙️ Administrator Commands", "Commands for server administrators and moderators"
         else:
-            await self.show_main_help(ctx)
-    
-    async def show_main_help(self, ctx):
-        """Show the main help menu"""
+            title, description = "🎫 Support Staff Commands", "Commands for the support team"
+        embed = discord.Embed(title=title, description=description, color=config.EMBED_COLORS['warning'])
+        for category_title, lines in staff_lines:
+            self.add_lines(embed, category_title, lines)
+        if len(embed) > EMBED_LIMIT or len(embed.fields) > 25:
+            embed.clear_fields()
+            for category_title, lines in staff_lines:
+                self.add_lines(embed, category_title, [line.split('\n', 1)[0] for line in lines])
+            embed.description += f"\nUse `{prefix}help <command>` for details on a command"
+        embed.set_footer(text=config.BOT_FOOTER)
+        return embed.to_dict()
+
+    def build_main_page(self, prefix, categories, pages, viewer):
+        """Category overview for the main help menu"""
         embed = discord.Embed(
             title=f"⚡ {config.COMPANY_NAME} Bot - Command Help",
             description=(
                 f"Welcome to {config.COMPANY_NAME} help system! Use the commands below to navigate "
                 "through our bot features.\n\n"
-                f"**Prefix:** `{ctx.prefix}`\n"
-                f"**Use:** `{ctx.prefix}help <category>` for detailed information"
+                f"**Prefix:** `{prefix}`\n"
+                f"**Use:** `{prefix}help <category>` or `{prefix}help <command>` for detailed information"
             ),
             color=config.EMBED_COLORS['info']
         )
-        
-        # Command categories
-        categories = {
-            "🎭 **General**": {
-                "description": "Basic bot functionality and information",
-                "command": f"`{ctx.prefix}help general`"
-            },
-            "📨 **Invites**": {
-                "description": "Invite tracking and leaderboards",
-                "command": f"`{ctx.prefix}help invites`"
-            },
-            "🎮 **Roles**": {
-                "description": "Role selection and management",
-                "command": f"`{ctx.prefix}help roles`"
-            },
-            "🎫 **Tickets**": {
-                "description": "Support ticket system",
-                "command": f"`{ctx.prefix}help tickets`"
-            }
-        }
-        
-        # Check if user is admin
-        is_admin = any(role.id in config.ADMIN_ROLES for role in ctx.author.roles)
-        if is_admin:
-            categories["⚙️ **Admin**"] = {
-                "description": "Administrator commands",
-                "command": f"`{ctx.prefix}help admin`"
-            }
-        
-        # Add categories to embed
-        for category_name, category_info in categories.items():
+
+        for meta, _ in categories:
+            if viewer not in pages['categories'][meta['key']]:
+                continue  # Nothing in this category for the viewer
             embed.add_field(
-                name=category_name,
-                value=f"{category_info['description']}\n{category_info['command']}",
+                name=meta['title'],
+                value=f"{meta['description']}\n`{prefix}help {meta['key']}`",
                 inline=True
             )
-        
-        # Add useful information
-        embed.add_field(
-            name="🔗 Quick Links",
-            value=(
-                f"• `{ctx.prefix}roles` - Role selection menu\n"
-                f"• `{ctx.prefix}leaderboard` - Invite rankings\n"
-                f"• `{ctx.prefix}game about` - Game information\n"
-                f"• `{ctx.prefix}mystats` - Your statistics"
-            ),
-            inline=False
-        )
-        
+
+        if viewer != 'member':
+            embed.add_field(
+                name="⚙️ Staff",
+                value=f"{'Administrator' if viewer == 'admin' else 'Support staff'} commands\n`{prefix}help staff`",
+                inline=True
+            )
+
         embed.add_field(
             name="💡 Tips",
             value=(
                 "• Most commands have aliases (shorter versions)\n"
-                "• Use slash commands with `/` for modern interface\n"
                 "• Commands are case-insensitive\n"
                 "• Some commands have cooldowns to prevent spam"
             ),
             inline=False
         )
-        
-        embed.set_footer(
-            text=f"{len(self.bot.commands)} commands available • {config.BOT_FOOTER}"
+
+        rank = TIERS.index(viewer)
+        visible = sum(1 for tier, _ in pages['commands'].values() if tier <= rank)
+        embed.set_footer(text=f"{visible} commands available • {config.BOT_FOOTER}")
+        return embed.to_dict()
+
+    def build_command_page(self, prefix, command):
+        """Detailed help for one command"""
+        embed = discord.Embed(
+            title=f"📖 {prefix}{command.qualified_name}",
+            description=command.help or command.short_doc or "No description",
+            color=config.EMBED_COLORS['info']
         )
-        embed.timestamp = discord.utils.utcnow()
-        
-        await ctx.send(embed=embed)
-    
-    async def show_category_help(self, ctx, category):
-        """Show help for a specific category"""
-        
-        if category in ['general', 'basic', 'main']:
-            await self.show_general_help(ctx)
-        elif category in ['invites', 'invite', 'tracking', 'leaderboard']:
-            await self.show_invites_help(ctx)
-        elif category in ['roles', 'role', 'selection']:
-            await self.show_roles_help(ctx)
-        elif category in ['tickets', 'ticket', 'support']:
-            await self.show_tickets_help(ctx)
-        elif category in ['admin', 'administrator', 'mod']:
-            await self.show_admin_help(ctx)
-        else:
+        embed.add_field(name="Usage", value=f"`{prefix}{command.qualified_name} {command.signature}`".replace(' `', '`'), inline=False)
+        if command.aliases:
+            embed.add_field(name="Aliases", value=", ".join(f"`{alias}`" for alias in command.aliases), inline=False)
+        if isinstance(command, commands.Group):
+            self.add_lines(embed, "Subcommands", [self.command_line(prefix, sub) for sub in sorted(command.commands, key=lambda sub: sub.name)])
+        embed.set_footer(text=config.BOT_FOOTER)
+        return embed.to_dict()
+
+    def get_pages(self, prefix):
+        """Help pages for a prefix, generated on first use"""
+        pages = self.pages.get(prefix)
+        if pages is None:
+            pages = self.pages[prefix] = self.build_pages(prefix)
+        return pages
+
+    def viewer_tier(self, member):
+        """Admins and admin roles see every command, support roles see support commands"""
+        permissions = getattr(member, 'guild_permissions', None)
+        if (permissions and permissions.administrator) or self.bot.settings.member_has_role(member, 'admin_roles'):
+            return 'admin'
+        if self.bot.settings.member_has_role(member, 'support_roles'):
+            return 'support'
+        return 'member'
+
+    @commands.command(name='help', aliases=['h', 'commands'])
+    @commands.cooldown(1, 10, commands.BucketType.user)
+    async def help_command(self, ctx, *, category: str = None):
+        """Show help information for bot commands"""
+        await self.send_help(ctx, category)
+
+    # @discord.slash_command(name="help", description="Show bot help information")
+    async def slash_help(self, ctx, category: str = None):
+        """Slash command version of help"""
+        await ctx.defer()
+        await self.send_help(ctx, category)
+
+    async def send_help(self, ctx, category=None):
+        """Send the main menu, a category page or a command page"""
+        pages = self.get_pages(ctx.clean_prefix)
+        viewer = self.viewer_tier(ctx.author)
+
+        if not category:
+            await ctx.send(embed=discord.Embed.from_dict(pages['main'][viewer]))
+            return
+
+        category = category.lower().removeprefix(ctx.clean_prefix)
+        if category in ADMIN_ALIASES:
+            if viewer == 'member':
+                embed = discord.Embed(
+                    title="🚫 Access Denied",
+                    description="You don't have permission to view staff commands!",
+                    color=config.EMBED_COLORS['error']
+                )
+                await ctx.send(embed=embed)
+                return
+            await ctx.send(embed=discord.Embed.from_dict(pages['staff'][viewer]))
+            return
+
+        key = pages['aliases'].get(category)
+        page = pages['categories'].get(key, {}).get(viewer)
+        if page is None:
+            tier, page = pages['commands'].get(category, (0, None))
+            if tier > TIERS.index(viewer):
+                page = None
+
+        if page is None:
+            available = [meta_key for meta_key, variants in pages['categories'].items() if viewer in variants]
             embed = discord.Embed(
                 title="❌ Category Not Found",
                 description=(
-                    f"Unknown category: `{category}`\n\n"
-                    "**Available categories:**\n"
-                    "• `general` - Basic commands\n"
-                    "• `invites` - Invite tracking\n"
-                    "• `roles` - Role management\n"
-                    "• `tickets` - Support system\n"
-                    "• `admin` - Admin commands"
+                    f"Unknown category or command: `{category}`\n\n"
+                    "**Available categories:**\n" +
+                    "\n".join(f"• `{key}`" for key in available) +
+                    ("\n• `staff` - Staff commands" if viewer != 'member' else "")
                 ),
                 color=config.EMBED_COLORS['error']
             )
             await ctx.send(embed=embed)
-    
-    async def show_general_help(self, ctx):
-        """Show general commands help"""
-        embed = discord.Embed(
-            title="🎭 General Commands",
-            description="Basic bot functionality and utilities",
-            color=config.EMBED_COLORS['info']
-        )
-        
-        commands_info = [
-            (f"`{ctx.prefix}help [category]`", "Show this help menu"),
-            (f"`{ctx.prefix}mystats`", "Show your personal statistics"),
-            (f"`{ctx.prefix}welcomestats`", "Show server statistics"),
-            (f"`{ctx.prefix}myroles`", "Show your current roles"),
-            (f"`{ctx.prefix}roleinfo <role>`", "Get information about a role"),
-        ]
-        
-        embed.add_field(
-            name="📋 Available Commands",
-            value="\n".join([f"**{cmd}**\n└ {desc}" for cmd, desc in commands_info]),
-            inline=False
-        )
-        
-        await ctx.send(embed=embed)
-    
-    async def show_invites_help(self, ctx):
-        """Show invite tracking commands help"""
-        embed = discord.Embed(
-            title="📨 Invite Tracking Commands",
-            description="Track invitations and view recruitment statistics",
-            color=config.EMBED_COLORS['info']
-        )
-        
-        commands_info = [
-            (f"`{ctx.prefix}invites [@user]`", "Check invite statistics for you or another user"),
-            (f"`{ctx.prefix}leaderboard`", "Show invite leaderboard (aliases: !lb, !top)"),
-            (f"`{ctx.prefix}mystats`", "Show your detailed recruitment record (aliases: !me, !myrank)"),
-            (f"`{ctx.prefix}welcomestats`", "Show overall server recruitment statistics"),
-        ]
-        
-        embed.add_field(
-            name="📋 Available Commands",
-            value="\n".join([f"**{cmd}**\n└ {desc}" for cmd, desc in commands_info]),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🏆 Recruitment Ranks",
-            value=(
-                "🦑 **Leviathan Summoner** (100+ invites)\n"
-                "👹 **Demon Recruiter** (50+ invites)\n"
-                "🕷️ **Spider's Web Master** (25+ invites)\n"
-                "👻 **Ghost Whisperer** (10+ invites)\n"
-                "🧟 **Zombie Herder** (5+ invites)\n"
-                "🎃 **Novice Cultist** (1+ invites)"
-            ),
-            inline=False
-        )
-        
-        await ctx.send(embed=embed)
-    
-    async def show_roles_help(self, ctx):
-        """Show role management commands help"""
-        embed = discord.Embed(
-            title="🎭 Role Management Commands",
-            description="Manage your roles and customize your server experience",
-            color=config.EMBED_COLORS['info']
-        )
-        
-        commands_info = [
-            (f"`{ctx.prefix}roles`", "Open the role selection menu (buttons)"),
-            (f"`{ctx.prefix}myroles`", "Show your current roles"),
-            (f"`{ctx.prefix}roleinfo <role>`", "Get detailed information about a role"),
-        ]
-        
-        embed.add_field(
-            name="📋 Available Commands",
-            value="\n".join([f"**{cmd}**\n└ {desc}" for cmd, desc in commands_info]),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🎮 Available Role",
-            value="**Member** - Active community member",
-            inline=False
-        )
-        
-        await ctx.send(embed=embed)
-    
-    async def show_tickets_help(self, ctx):
-        """Show ticket system commands help"""
-        embed = discord.Embed(
-            title="🎫 Ticket System Commands",
-            description="Professional support ticket system for users and staff",
-            color=config.EMBED_COLORS['info']
-        )
-        
-        user_commands = [
-            ("**Ticket Panel**", "Click the dropdown menu in the ticket channel to create tickets"),
-            ("**Ticket Types**", "🎮 Game Support • ❓ General Help • ⚠️ Report Issue • 💡 Suggestions • 🛡️ Moderator Help"),
-        ]
-        
-        embed.add_field(
-            name="👥 User Features",
-            value="\n".join([f"**{cmd}**\n└ {desc}" for cmd, desc in user_commands]),
-            inline=False
-        )
-        
-        # Check if user is admin/moderator
-        is_staff = any(role.id in config.ADMIN_ROLES for role in ctx.author.roles)
-        if is_staff:
-            admin_commands = [
-                (f"`{ctx.prefix}setup ticketlog [#channel]`", "Set ticket logging channel"),
-                (f"`{ctx.prefix}setup ticketpanel`", "Create ticket selection panel"),
-            ]
-            
-            embed.add_field(
-                name="⚙️ Staff Setup",
-                value="\n".join([f"**{cmd}**\n└ {desc}" for cmd, desc in admin_commands]),
-                inline=False
-            )
-        
-        embed.add_field(
-            name="🔧 Ticket Features",
-            value=(
-                "• **Smart Categories** - Automatic channel organization\n"
-                "• **Role Permissions** - Staff-only access\n"
-                "• **Logging System** - Complete ticket history\n"
-                "• **Auto-Close** - Inactive tickets auto-close\n"
-                "• **User Limits** - Prevent ticket spam"
-            ),
-            inline=False
-        )
-        
-        await ctx.send(embed=embed)
-    
-    async def show_admin_help(self, ctx):
-        """Show admin commands help (admin only)"""
-        # Check if user is admin
-        is_admin = any(role.id in config.ADMIN_ROLES for role in ctx.author.roles)
-        if not is_admin:
-            embed = discord.Embed(
-                title="🚫 Access Denied",
-                description="You don't have permission to view admin commands!",
-                color=config.EMBED_COLORS['error']
-            )
-            await ctx.send(embed=embed)
             return
-        
-        embed = discord.Embed(
-            title="⚙️ Administrator Commands",
-            description="Commands for server administrators and moderators",
-            color=config.EMBED_COLORS['warning']
-        )
-        
-        commands_info = [
-            (f"`{ctx.prefix}announce <message>`", "Post announcements to announcements channel"),
-            (f"`{ctx.prefix}gameupdate <version> <changes>`", "Post game update information"),
-            (f"`{ctx.prefix}gamenews <title>\n<content>`", "Post game news updates"),
-            (f"`{ctx.prefix}hotfix <version> <fixes>`", "Post hotfix/patch announcements"),
-            (f"`{ctx.prefix}setupgameinfo`", "Setup game info in current channel"),
-            (f"`{ctx.prefix}setup ticketlog [#channel]`", "Setup ticket logging channel"),
-            (f"`{ctx.prefix}setup ticketpanel`", "Create ticket panel with dropdown"),
-            (f"`{ctx.prefix}invitemod @user <amount>`", "Modify user's invite count"),
-            (f"`{ctx.prefix}postleaderboard`", "Post leaderboard in current channel"),
-            (f"`{ctx.prefix}refreshleaderboard`", "Force refresh auto-leaderboard"),
-            (f"`{ctx.prefix}cleanleaderboards`", "Remove duplicate leaderboards"),
-            (f"`{ctx.prefix}reactionroles`", "Set up reaction role message"),
-            (f"`{ctx.prefix}resetinvites [@user]`", "Reset invite statistics"),
-            (f"`{ctx.prefix}cacheinvites`", "Refresh invite cache"),
-            (f"`{ctx.prefix}rolestats`", "Show role statistics"),
-            (f"`{ctx.prefix}testwelcome [@user]`", "Test welcome message"),
-            (f"`{ctx.prefix}testboost [@user]`", "Test boost message"),
-        ]
-        
-        embed.add_field(
-            name="📋 Available Commands",
-            value="\n".join([f"**{cmd}**\n└ {desc}" for cmd, desc in commands_info]),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚠️ Important Notes",
-            value=(
-                "• These commands require administrator permissions\n"
-                "• Announcement commands post to configured channels\n"
-                "• Be careful with reset commands - they delete data\n"
-                "• Test commands are useful for debugging"
-            ),
-            inline=False
-        )
-        
-        await ctx.send(embed=embed)
-    
-    # @discord.slash_command(name="help", description="Show bot help information")
-    async def slash_help(self, ctx, category: str = None):
-        """Slash command version of help"""
-        await ctx.defer()
-        
-        if category:
-            await self.show_category_help(ctx, category.lower())
-        else:
-            await self.show_main_help(ctx)
+
+        await ctx.send(embed=discord.Embed.from_dict(page))
 
 async def setup(bot):
     """Setup function for the cog"""
     await bot.add_cog(HelpCommand(bot))
-    logger.info("✅ Help command cog loaded successfully")
\ No newline at end of file
+    logger.info("✅ Help cog loaded successfully")
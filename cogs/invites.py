@@ -5,34 +5,265 @@ Tracks who invited new members and maintains statistics
 Features:
 - Track invite usage and who invited whom
 - Store invite statistics in a simple database
-- Attribution messages when members join
-- Integration with welcome system
+- Attribution stage of the welcome join pipeline
+- Standalone attribution messages when the welcome cog is not loaded
+- Precomputed invite leaderboard with cached pages
+- Compact packed-array storage for invitee history
+- Daily join/leave rollups per inviter and invite code
+- Batched attribution during join bursts, flagging brand-new accounts as fake
 """
 
 import discord
 from discord.ext import commands
+import asyncio
 import json
 import os
 import logging
-from datetime import datetime, timezone
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 import config
+from utils.journal import JournaledStore
+from utils.packing import int64_array, pack_int64, unpack_int64
+from utils.ranking import RankedSkipList
 
 logger = logging.getLogger(__name__)
 
+def month_start(argument):
+    """Converter for a YYYY-MM month argument, returning its first day"""
+    try:
+        return datetime.strptime(argument, '%Y-%m').date()
+    except ValueError:
+        raise commands.BadArgument(f"`{argument}` is not a month in the format YYYY-MM") from None
+
+class InviteLeaderboard:
+    """Ranking of inviters in one guild, kept sorted as stats change"""
+    
+    PAGE_SIZE = 10
+    
+    def __init__(self):
+        self.ranking = RankedSkipList()  # Keys sort best inviter first
+        self.keys = {}  # user_id -> current ranking key
+        self.page_cache = {}  # page index -> rendered lines
+    
+    @staticmethod
+    def make_key(user_id, stats):
+        """Ranking key: most current invites, then most total invites"""
+        if stats['total_invites'] <= 0 and stats['current_invites'] <= 0:
+            return None  # Never invited anyone, so not ranked
+        return (-stats['current_invites'], -stats['total_invites'], user_id)
+    
+    def __len__(self):
+        return len(self.ranking)
+    
+    def update(self, user_id, stats):
+        """Move a user to their new position after their stats changed"""
+        new_key = self.make_key(user_id, stats) if stats else None
+        old_key = self.keys.get(user_id)
+        if old_key == new_key:
+            return
+        
+        old_rank = None
+        if old_key is not None:
+            old_rank = self.ranking.rank(old_key)
+            self.ranking.remove(old_key)
+            del self.keys[user_id]
+        
+        new_rank = None
+        if new_key is not None:
+            self.ranking.insert(new_key)
+            self.keys[user_id] = new_key
+            new_rank = self.ranking.rank(new_key)
+        
+        self._invalidate(old_rank, new_rank)
+    
+    def remove(self, user_id):
+        """Drop a user from the ranking"""
+        self.update(user_id, None)
+    
+    def _invalidate(self, old_rank, new_rank):
+        """Drop cached pages whose rank window was affected by a move"""
+        if old_rank is None or new_rank is None:
+            # An entry appeared or disappeared, so every later rank shifted
+            changed = old_rank if new_rank is None else new_rank
+            first_page = changed // self.PAGE_SIZE
+            for page in [page for page in self.page_cache if page >= first_page]:
+                del self.page_cache[page]
+            return
+        
+        # Only the ranks between the old and new position shifted
+        low, high = sorted((old_rank, new_rank))
+        for page in range(low // self.PAGE_SIZE, high // self.PAGE_SIZE + 1):
+            self.page_cache.pop(page, None)
+    
+    def rank_of(self, user_id):
+        """1-based rank of a user, or None if unranked"""
+        key = self.keys.get(user_id)
+        if key is None:
+            return None
+        return self.ranking.rank(key) + 1
+    
+    def page(self, page):
+        """Rendered lines for a 0-based page, cached until its ranks change"""
+        lines = self.page_cache.get(page)
+        if lines is None:
+            start = page * self.PAGE_SIZE
+            lines = []
+            for offset, (current, total, user_id) in enumerate(self.ranking.slice(start, start + self.PAGE_SIZE)):
+                rank = start + offset + 1
+                medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(rank, f"**#{rank}**")
+                lines.append(f"{medal} <@{user_id}> • **{-current}** members ({-total} total)")
+            self.page_cache[page] = lines
+        return lines
+
+class InviteRollups:
+    """Per-day join/leave counters keyed by guild, inviter and invite code
+    
+    Each day bucket maps "inviter|code" to four counters: joins, leaves on
+    that day, and leaves (ever / within 30 days) of members who joined that
+    day. Range queries sum day buckets instead of scanning raw events.
+    Counters are journaled one "guild|day|inviter|code" key at a time.
+    """
+    
+    JOINS, LEAVES, COHORT_LEAVES, COHORT_LEAVES_30D = range(4)
+    
+    def __init__(self, data_file='invite_rollups.json'):
+        self.store = JournaledStore(data_file, compact_every=config.INVITE_ROLLUP_CONFIG['journal_compact_every'])
+        try:
+            self.store.load(('counters', 'members'))
+        except Exception as e:
+            logger.error(f"Error loading invite rollups: {e}")
+            self.store.state = {'counters': {}, 'members': {}}
+        self.counters = self.store.state['counters']  # "guild|YYYY-MM-DD|inviter|code" -> counters
+        self.members = self.store.state['members']  # "guild|member" -> [inviter, code, joined_ts]
+        self.migrate_day_buckets()
+        
+        # Day buckets for range queries, sharing the counter lists with the store
+        self.days = {}  # "guild|YYYY-MM-DD" -> {"inviter|code": counters}
+        for key, counters in self.counters.items():
+            guild_id, day, source = key.split('|', 2)
+            self.days.setdefault(f"{guild_id}|{day}", {})[source] = counters
+    
+    def migrate_day_buckets(self):
+        """Split whole-day buckets saved by older versions into per-source counters"""
+        old_days = self.store.state.pop('days', None)
+        if not old_days:
+            return
+        for day_key, bucket in old_days.items():
+            for source, counters in bucket.items():
+                self.counters[f"{day_key}|{source}"] = counters
+        self.store.compact()
+        logger.info(f"📊 Migrated {len(old_days)} invite rollup day bucket(s)")
+    
+    def _bump(self, guild_id, day, inviter_id, code, *counter_indexes):
+        """Increment counters for one day and source, journaling just that source"""
+        day_key = f"{guild_id}|{day}"
+        source = f"{inviter_id}|{code}"
+        bucket = self.days.setdefault(day_key, {})
+        counters = bucket.get(source)
+        if counters is None:
+            counters = bucket[source] = [0, 0, 0, 0]
+        for index in counter_indexes:
+            counters[index] += 1
+        self.store.set('counters', f"{day_key}|{source}", counters)
+    
+    def record_join(self, guild_id, inviter_id, code, member_id, when):
+        """Count a join and remember its source until the member leaves"""
+        try:
+            self._bump(guild_id, when.strftime('%Y-%m-%d'), inviter_id or 0, code, self.JOINS)
+            self.store.set('members', f"{guild_id}|{member_id}", [inviter_id or 0, code, int(when.timestamp())])
+        except Exception as e:
+            logger.error(f"Error recording invite join: {e}")
+    
+    def record_leave(self, guild_id, member_id, when):
+        """Count a leave against the day it happened and the member's join cohort"""
+        try:
+            source = self.members.get(f"{guild_id}|{member_id}")
+            if source is None:
+                return  # Joined before rollups existed or via an unknown invite
+            
+            inviter_id, code, joined_ts = source
+            joined_at = datetime.fromtimestamp(joined_ts, timezone.utc)
+            self._bump(guild_id, when.strftime('%Y-%m-%d'), inviter_id, code, self.LEAVES)
+            
+            cohort_counters = [self.COHORT_LEAVES]
+            if when - joined_at <= timedelta(days=30):
+                cohort_counters.append(self.COHORT_LEAVES_30D)
+            self._bump(guild_id, joined_at.strftime('%Y-%m-%d'), inviter_id, code, *cohort_counters)
+            
+            self.store.delete('members', f"{guild_id}|{member_id}")
+        except Exception as e:
+            logger.error(f"Error recording invite leave: {e}")
+    
+    def query(self, guild_id, start, end, group_by='inviter'):
+        """Sum counters for days in [start, end], grouped by 'inviter' or 'code'"""
+        totals = {}
+        day = start
+        while day <= end:
+            bucket = self.days.get(f"{guild_id}|{day.strftime('%Y-%m-%d')}")
+            if bucket:
+                for source, counters in bucket.items():
+                    inviter_id, code = source.split('|', 1)
+                    key = int(inviter_id) if group_by == 'inviter' else code
+                    summed = totals.setdefault(key, [0, 0, 0, 0])
+                    for index, value in enumerate(counters):
+                        summed[index] += value
+            day += timedelta(days=1)
+        return totals
+    
+    def forget_guild(self, guild_id):
+        """Drop all rollups for a guild"""
+        prefix = f"{guild_id}|"
+        for day_key in [key for key in self.days if key.startswith(prefix)]:
+            del self.days[day_key]
+        for counter_key in [key for key in self.counters if key.startswith(prefix)]:
+            self.store.delete('counters', counter_key)
+        for member_key in [key for key in self.members if key.startswith(prefix)]:
+            self.store.delete('members', member_key)
+    
+    def close(self):
+        """Compact the rollup journal"""
+        try:
+            self.store.close()
+        except Exception as e:
+            logger.error(f"Error saving invite rollups: {e}")
+
 class InviteTracker(commands.Cog):
     """Track invites and member attribution"""
     
+    # Packed per-inviter history columns (see utils.packing)
+    INVITEE_ARRAYS = ('invited_ids', 'invited_at', 'left_ids', 'left_joined_at', 'left_at')
+    
     def __init__(self, bot):
         self.bot = bot
         self.invite_data_file = 'invite_data.json'
+        self.packed_invitees = {}  # (guild_str, user_str) -> encoded arrays, reused until the record changes
         self.invite_stats = self.load_invite_data()
+        self.leaderboards = {}  # guild_id str -> InviteLeaderboard, built on first use
+        self.rollups = InviteRollups()
+        self.pending_attribution = {}  # guild_id -> members joined during a raid, in join order
+        self.attribution_tasks = {}  # guild_id -> batch attribution loop task
+    
+    def cog_unload(self):
+        """Clean up when cog is unloaded"""
+        for task in self.attribution_tasks.values():
+            task.cancel()
+        self.rollups.close()
         
     def load_invite_data(self):
         """Load invite statistics from JSON file"""
         try:
             if os.path.exists(self.invite_data_file):
                 with open(self.invite_data_file, 'r') as f:
-                    return json.load(f)
+                    data = json.load(f)
+                for guild_str, guild_stats in data.items():
+                    for user_str, stats in guild_stats.items():
+                        if 'invited_users' not in stats:
+                            self.packed_invitees[(guild_str, user_str)] = tuple(
+                                stats.get(field, '') for field in self.INVITEE_ARRAYS
+                            )
+                        self._decode_invitees(stats)
+                return data
             return {}
         except Exception as e:
             logger.error(f"Error loading invite data: {e}")
@@ -41,109 +272,211 @@ class InviteTracker(commands.Cog):
     def save_invite_data(self):
         """Save invite statistics to JSON file"""
         try:
+            data = {
+                guild_str: {
+                    user_str: self._encode_invitees(guild_str, user_str, stats)
+                    for user_str, stats in guild_stats.items()
+                }
+                for guild_str, guild_stats in self.invite_stats.items()
+            }
             with open(self.invite_data_file, 'w') as f:
-                json.dump(self.invite_stats, f, indent=2)
+                json.dump(data, f, separators=(',', ':'))
         except Exception as e:
             logger.error(f"Error saving invite data: {e}")
     
+    def _decode_invitees(self, stats):
+        """Turn stored invitee history into packed arrays (in place)"""
+        if 'invited_users' in stats:
+            # Older files keep one dict per invitee; convert them once
+            legacy = stats.pop('invited_users')
+            stats['invited_ids'] = int64_array(user['user_id'] for user in legacy)
+            stats['invited_at'] = int64_array(
+                int(datetime.fromisoformat(user['joined_at']).timestamp()) for user in legacy
+            )
+            for field in self.INVITEE_ARRAYS[2:]:
+                stats[field] = int64_array()
+        else:
+            for field in self.INVITEE_ARRAYS:
+                stats[field] = unpack_int64(stats.get(field))
+    
+    def _encode_invitees(self, guild_str, user_str, stats):
+        """Copy of a stats record with invitee arrays encoded for JSON"""
+        packed = self.packed_invitees.get((guild_str, user_str))
+        if packed is None:
+            packed = tuple(pack_int64(stats[field]) for field in self.INVITEE_ARRAYS)
+            self.packed_invitees[(guild_str, user_str)] = packed
+        
+        encoded = dict(stats)
+        encoded.update(zip(self.INVITEE_ARRAYS, packed))
+        return encoded
+    
+    def _new_user_stats(self):
+        """Empty statistics record"""
+        return {
+            'total_invites': 0,
+            'current_invites': 0,
+            'left_members': 0,
+            'fake_invites': 0,
+            'invited_ids': int64_array(),  # Invitee user IDs
+            'invited_at': int64_array(),  # Matching join times (epoch seconds)
+            'left_ids': int64_array(),  # Invitees who later left
+            'left_joined_at': int64_array(),  # Their join times
+            'left_at': int64_array(),  # Their leave times
+            'last_updated': datetime.now(timezone.utc).isoformat()
+        }
+    
     def get_user_stats(self, guild_id, user_id):
-        """Get invite statistics for a user"""
-        guild_str = str(guild_id)
+        """Get invite statistics for a user (an unsaved empty record if none exist)"""
+        stats = self.invite_stats.get(str(guild_id), {}).get(str(user_id))
+        return stats if stats is not None else self._new_user_stats()
+    
+    def _get_or_create_user_stats(self, guild_id, user_id):
+        """Get the stored statistics record for a user, creating it if needed"""
+        guild_stats = self.invite_stats.setdefault(str(guild_id), {})
         user_str = str(user_id)
-        
-        if guild_str not in self.invite_stats:
-            self.invite_stats[guild_str] = {}
-        
-        if user_str not in self.invite_stats[guild_str]:
-            self.invite_stats[guild_str][user_str] = {
-                'total_invites': 0,
-                'current_invites': 0,
-                'left_members': 0,
-                'fake_invites': 0,
-                'invited_users': [],
-                'last_updated': datetime.now(timezone.utc).isoformat()
-            }
-        
-        return self.invite_stats[guild_str][user_str]
+        if user_str not in guild_stats:
+            guild_stats[user_str] = self._new_user_stats()
+        return guild_stats[user_str]
+    
+    def find_inviter(self, guild_id, invited_user_id):
+        """Find who invited a member, or None"""
+        for user_str, stats in self.invite_stats.get(str(guild_id), {}).items():
+            if invited_user_id in stats['invited_ids']:
+                return int(user_str)
+        return None
+    
+    def get_leaderboard(self, guild_id):
+        """Get the leaderboard for a guild, building it once from stored stats"""
+        guild_str = str(guild_id)
+        leaderboard = self.leaderboards.get(guild_str)
+        if leaderboard is None:
+            leaderboard = InviteLeaderboard()
+            for user_str, stats in self.invite_stats.get(guild_str, {}).items():
+                leaderboard.update(int(user_str), stats)
+            self.leaderboards[guild_str] = leaderboard
+        return leaderboard
     
-    def update_user_stats(self, guild_id, user_id, invited_user_id=None, action='invite'):
+    def update_user_stats(self, guild_id, user_id, invited_user_id=None, action='invite', save=True):
         """Update invite statistics for a user"""
-        stats = self.get_user_stats(guild_id, user_id)
+        stats = self._get_or_create_user_stats(guild_id, user_id)
         
         if action == 'invite' and invited_user_id:
             stats['total_invites'] += 1
             stats['current_invites'] += 1
-            stats['invited_users'].append({
-                'user_id': invited_user_id,
-                'joined_at': datetime.now(timezone.utc).isoformat()
-            })
+            stats['invited_ids'].append(invited_user_id)
+            stats['invited_at'].append(int(datetime.now(timezone.utc).timestamp()))
         elif action == 'leave' and invited_user_id:
             stats['current_invites'] -= 1
             stats['left_members'] += 1
-            # Remove from invited_users list
-            stats['invited_users'] = [
-                user for user in stats['invited_users'] 
-                if user['user_id'] != invited_user_id
-            ]
+            # Move from the current invitees to the leaver history
+            try:
+                index = stats['invited_ids'].index(invited_user_id)
+                stats['left_ids'].append(invited_user_id)
+                stats['left_joined_at'].append(stats['invited_at'][index])
+                stats['left_at'].append(int(datetime.now(timezone.utc).timestamp()))
+                del stats['invited_ids'][index]
+                del stats['invited_at'][index]
+            except ValueError:
+                pass
         elif action == 'fake':
             stats['fake_invites'] += 1
             stats['total_invites'] -= 1
             stats['current_invites'] -= 1
+            # A fake invitee is no longer counted, so a later leave must not count again
+            if invited_user_id:
+                try:
+                    index = stats['invited_ids'].index(invited_user_id)
+                    del stats['invited_ids'][index]
+                    del stats['invited_at'][index]
+                except ValueError:
+                    pass
         
         stats['last_updated'] = datetime.now(timezone.utc).isoformat()
-        self.save_invite_data()
+        self.packed_invitees.pop((str(guild_id), str(user_id)), None)
+        self.get_leaderboard(guild_id).update(int(user_id), stats)
+        if save:
+            self.save_invite_data()
     
     @commands.Cog.listener()
     async def on_member_join(self, member):
-        """Track which invite was used when someone joins"""
+        """Track invites on their own when the welcome join pipeline is not loaded"""
+        if self.bot.get_cog('Welcome'):
+            return  # Welcome runs attribution as the first stage of its pipeline
+        
         try:
-            guild = member.guild
-            
-            # Skip bots
-            if member.bot:
-                return
-            
-            # Get current invites
-            try:
-                current_invites = await guild.invites()
-            except discord.Forbidden:
-                logger.warning(f"No permission to view invites in {guild.name}")
-                return
-            
-            # Compare with cached invites
-            used_invite = None
-            cached_invites = self.bot.invite_cache.get(guild.id, {})
-            
-            for invite in current_invites:
-                cached_uses = cached_invites.get(invite.code, 0)
-                if invite.uses > cached_uses:
-                    used_invite = invite
-                    break
-            
-            # Update cache
-            self.bot.invite_cache[guild.id] = {
-                invite.code: invite.uses for invite in current_invites
-            }
-            
-            # Track the invite
-            if used_invite and used_invite.inviter:
-                self.update_user_stats(
-                    guild.id, 
-                    used_invite.inviter.id, 
-                    member.id, 
-                    'invite'
-                )
-                
-                # Send attribution message
-                await self.send_invite_attribution(member, used_invite.inviter)
-                
-                logger.info(f"📨 {member.name} joined via invite from {used_invite.inviter.name}")
-            else:
-                logger.info(f"📨 {member.name} joined but couldn't determine invite source")
-                
+            raid = (config.FEATURES.get('raid_protection') and
+                    self.bot.join_detector.record_join(member.guild.id, member.id))
+            inviter = await self.track_join(member, raid)
+            if inviter:
+                await self.send_invite_attribution(member, inviter)
         except Exception as e:
             logger.error(f"Error tracking invite for {member.name}: {e}")
     
+    async def track_join(self, member, raid=False):
+        """Attribute a join to an invite and return the inviter, if known
+        
+        This is the attribution stage of the welcome join pipeline. During a
+        raid the join is queued for batch attribution and None is returned.
+        """
+        guild = member.guild
+        
+        # Skip bots
+        if member.bot:
+            return None
+        
+        # During a join burst, attribute joins in batches instead of one fetch each
+        if raid:
+            self.queue_attribution(member)
+            return None
+        
+        # Get current invites
+        try:
+            current_invites = await guild.invites()
+        except discord.Forbidden:
+            logger.warning(f"No permission to view invites in {guild.name}")
+            return None
+        
+        # Compare with cached invites
+        used_invite = None
+        cached_invites = self.bot.invite_cache.get(guild.id, {})
+        
+        for invite in current_invites:
+            cached_uses = cached_invites.get(invite.code, 0)
+            if invite.uses > cached_uses:
+                used_invite = invite
+                break
+        
+        # Update cache
+        self.bot.invite_cache[guild.id] = {
+            invite.code: invite.uses for invite in current_invites
+        }
+        
+        # Roll the join up by day, inviter and code
+        if used_invite:
+            if config.FEATURES.get('raid_protection'):
+                self.bot.join_detector.record_code_uses(guild.id, used_invite.code)
+            self.rollups.record_join(
+                guild.id,
+                used_invite.inviter.id if used_invite.inviter else None,
+                used_invite.code,
+                member.id,
+                datetime.now(timezone.utc)
+            )
+        
+        # Track the invite
+        if used_invite and used_invite.inviter:
+            self.update_user_stats(
+                guild.id, 
+                used_invite.inviter.id, 
+                member.id, 
+                'invite'
+            )
+            logger.info(f"📨 {member.name} joined via invite from {used_invite.inviter.name}")
+            return used_invite.inviter
+        
+        logger.info(f"📨 {member.name} joined but couldn't determine invite source")
+        return None
+    
     @commands.Cog.listener()
     async def on_member_remove(self, member):
         """Update stats when someone leaves"""
@@ -153,24 +486,133 @@ class InviteTracker(commands.Cog):
                 return
             
             guild = member.guild
+            self.rollups.record_leave(guild.id, member.id, datetime.now(timezone.utc))
             
             # Find who invited this member
-            for user_id, stats in self.invite_stats.get(str(guild.id), {}).items():
-                for invited_user in stats['invited_users']:
-                    if invited_user['user_id'] == member.id:
-                        self.update_user_stats(guild.id, int(user_id), member.id, 'leave')
-                        logger.info(f"📤 {member.name} left, updated stats for inviter {user_id}")
-                        return
+            inviter_id = self.find_inviter(guild.id, member.id)
+            if inviter_id is not None:
+                self.update_user_stats(guild.id, inviter_id, member.id, 'leave')
+                logger.info(f"📤 {member.name} left, updated stats for inviter {inviter_id}")
                         
         except Exception as e:
             logger.error(f"Error handling member leave for {member.name}: {e}")
     
+    def queue_attribution(self, member):
+        """Hold a raid join for the next attribution batch"""
+        guild_id = member.guild.id
+        self.pending_attribution.setdefault(guild_id, []).append(member)
+        if guild_id not in self.attribution_tasks:
+            logger.warning(f"🛡️ Join burst in {member.guild.name}, batching invite attribution")
+            self.attribution_tasks[guild_id] = asyncio.create_task(self._attribution_loop(member.guild))
+    
+    async def _attribution_loop(self, guild):
+        """Attribute queued joins once per batch interval until raid mode ends"""
+        try:
+            while True:
+                await asyncio.sleep(config.RAID_CONFIG['batch_interval'])
+                members = self.pending_attribution.pop(guild.id, [])
+                if members:
+                    await self.attribute_batch(guild, members)
+                if not self.bot.join_detector.in_raid_mode(guild.id) and not self.pending_attribution.get(guild.id):
+                    logger.info(f"🛡️ Join burst in {guild.name} is over, resuming per-join attribution")
+                    break
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error in batch invite attribution for {guild.name}: {e}")
+        finally:
+            self.attribution_tasks.pop(guild.id, None)
+    
+    async def attribute_batch(self, guild, members):
+        """Attribute a batch of joins with a single invite fetch
+        
+        Use counts only say how many joins each code received, not which
+        member used it, so members are matched to codes in join order.
+        Accounts younger than RAID_CONFIG['new_account_days'] are recorded
+        as fake invites.
+        """
+        try:
+            current_invites = await guild.invites()
+        except discord.Forbidden:
+            logger.warning(f"No permission to view invites in {guild.name}")
+            return
+        
+        cached_invites = self.bot.invite_cache.get(guild.id, {})
+        self.bot.invite_cache[guild.id] = {invite.code: invite.uses for invite in current_invites}
+        
+        now = datetime.now(timezone.utc)
+        new_account_cutoff = now - timedelta(days=config.RAID_CONFIG['new_account_days'])
+        queue = deque(members)
+        inviters = {}  # inviter_id -> [inviter, joins, fakes]
+        
+        for invite in current_invites:
+            used = invite.uses - cached_invites.get(invite.code, 0)
+            if used <= 0:
+                continue
+            self.bot.join_detector.record_code_uses(guild.id, invite.code, used)
+            inviter = invite.inviter
+            
+            for _ in range(min(used, len(queue))):
+                member = queue.popleft()
+                self.rollups.record_join(guild.id, inviter.id if inviter else None, invite.code, member.id, now)
+                if not inviter:
+                    continue
+                
+                entry = inviters.setdefault(inviter.id, [inviter, 0, 0])
+                entry[1] += 1
+                self.update_user_stats(guild.id, inviter.id, member.id, 'invite', save=False)
+                if member.created_at > new_account_cutoff:
+                    entry[2] += 1
+                    self.update_user_stats(guild.id, inviter.id, member.id, 'fake', save=False)
+        
+        if inviters:
+            self.save_invite_data()
+        
+        traced = len(members) - len(queue)
+        logger.info(f"📨 Batch-attributed {traced}/{len(members)} raid joins in {guild.name}")
+        await self.send_batch_attribution(guild, inviters, len(members), traced)
+    
+    async def send_batch_attribution(self, guild, inviters, joined, traced):
+        """Send one attribution summary for a batch of raid joins"""
+        try:
+            channel = (self.bot.settings.channel(guild, 'welcome_channel') or
+                      self.bot.settings.channel(guild, 'general_channel'))
+            
+            if not channel:
+                return
+            
+            ranked = sorted(inviters.values(), key=lambda entry: entry[1], reverse=True)
+            lines = [
+                f"• **{inviter.mention}** • {joins} joins" + (f" ({fakes} flagged as new accounts)" if fakes else "")
+                for inviter, joins, fakes in ranked[:10]
+            ]
+            if len(ranked) > 10:
+                lines.append(f"• ...and {len(ranked) - 10} more inviters")
+            
+            embed = discord.Embed(
+                title="📨 Batch Invitation Trace",
+                description=f"🛡️ Traced **{traced}** of **{joined}** members who joined during a burst.",
+                color=config.EMBED_COLORS['warning']
+            )
+            embed.add_field(
+                name="🎯 Inviters",
+                value="\n".join(lines) if lines else "No invites could be traced.",
+                inline=False
+            )
+            embed.set_footer(text=config.BOT_FOOTER)
+            embed.timestamp = discord.utils.utcnow()
+            
+            await channel.send(embed=embed)
+            
+        except Exception as e:
+            logger.error(f"Error sending batch invite attribution: {e}")
+    
     async def send_invite_attribution(self, member, inviter):
         """Send a message attributing the new member to their inviter"""
         try:
             # Get the welcome channel or general channel
-            channel = (self.bot.get_channel(config.WELCOME_CHANNEL_ID) or
-                      self.bot.get_channel(config.GENERAL_CHANNEL_ID))
+            channel = (self.bot.settings.channel(member.guild, 'welcome_channel') or
+                      self.bot.settings.channel(member.guild, 'general_channel'))
             
             if not channel:
                 return
@@ -227,7 +669,7 @@ class InviteTracker(commands.Cog):
         else:
             return "💀 **Fresh Recruit**"
     
-    @commands.command(name='invites', aliases=['inv'])
+    @commands.group(name='invites', aliases=['inv'], invoke_without_command=True)
     @commands.cooldown(1, 10, commands.BucketType.user)
     async def check_invites(self, ctx, member: discord.Member = None):
         """Check invite statistics for a member"""
@@ -273,6 +715,144 @@ class InviteTracker(commands.Cog):
         
         await ctx.send(embed=embed)
     
+    @check_invites.command(name='top', aliases=['leaderboard', 'lb'])
+    @commands.cooldown(1, 10, commands.BucketType.user)
+    async def invites_top(self, ctx, page: int = 1):
+        """Show the invite leaderboard"""
+        leaderboard = self.get_leaderboard(ctx.guild.id)
+        page_count = max((len(leaderboard) - 1) // InviteLeaderboard.PAGE_SIZE + 1, 1)
+        page = min(max(page, 1), page_count)
+        
+        lines = leaderboard.page(page - 1)
+        
+        embed = discord.Embed(
+            title="🏆 Recruitment Leaderboard",
+            description="\n".join(lines) if lines else "No recruiters yet. Invite someone to claim the top spot!",
+            color=config.EMBED_COLORS['info']
+        )
+        embed.set_footer(text=f"Page {page}/{page_count} • {len(leaderboard)} recruiters • {config.BOT_FOOTER}")
+        embed.timestamp = discord.utils.utcnow()
+        
+        await ctx.send(embed=embed)
+    
+    @check_invites.command(name='rank')
+    @commands.cooldown(1, 10, commands.BucketType.user)
+    async def invites_rank(self, ctx, member: discord.Member = None):
+        """Show a member's position on the invite leaderboard"""
+        if member is None:
+            member = ctx.author
+        
+        leaderboard = self.get_leaderboard(ctx.guild.id)
+        rank = leaderboard.rank_of(member.id)
+        
+        if rank is None:
+            description = f"{member.mention} is not on the leaderboard yet."
+        else:
+            stats = self.invite_stats[str(ctx.guild.id)][str(member.id)]
+            description = (
+                f"{member.mention} is ranked **#{rank}** of **{len(leaderboard)}** recruiters\n\n"
+                f"👥 **Current Members:** {stats['current_invites']}\n"
+                f"🎯 **Total Invites:** {stats['total_invites']}"
+            )
+        
+        embed = discord.Embed(
+            title="🏆 Leaderboard Position",
+            description=description,
+            color=config.EMBED_COLORS['info']
+        )
+        embed.set_thumbnail(url=member.avatar.url if member.avatar else member.default_avatar.url)
+        embed.set_footer(text=config.BOT_FOOTER)
+        embed.timestamp = discord.utils.utcnow()
+        
+        await ctx.send(embed=embed)
+    
+    @check_invites.command(name='recent', aliases=['week'])
+    @commands.cooldown(1, 10, commands.BucketType.user)
+    async def invites_recent(self, ctx, days: int = 7):
+        """Show the top recruiters and invite codes over the last few days"""
+        days = min(max(days, 1), config.INVITE_ROLLUP_CONFIG['max_query_days'])
+        end = datetime.now(timezone.utc).date()
+        start = end - timedelta(days=days - 1)
+        
+        by_inviter = self.rollups.query(ctx.guild.id, start, end, 'inviter')
+        by_code = self.rollups.query(ctx.guild.id, start, end, 'code')
+        
+        embed = discord.Embed(
+            title=f"📈 Recruitment - Last {days} Day(s)",
+            description=f"Joins and leaves from **{start}** to **{end}** (UTC)",
+            color=config.EMBED_COLORS['info']
+        )
+        
+        top_inviters = sorted(
+            ((inviter_id, counters) for inviter_id, counters in by_inviter.items() if inviter_id),
+            key=lambda item: item[1][InviteRollups.JOINS],
+            reverse=True
+        )[:10]
+        embed.add_field(
+            name="🏆 Top Recruiters",
+            value="\n".join(
+                f"<@{inviter_id}> • **{counters[InviteRollups.JOINS]}** joined, {counters[InviteRollups.LEAVES]} left"
+                for inviter_id, counters in top_inviters
+            ) or "No tracked joins in this period.",
+            inline=False
+        )
+        
+        top_codes = sorted(by_code.items(), key=lambda item: item[1][InviteRollups.JOINS], reverse=True)[:10]
+        embed.add_field(
+            name="🔗 Top Invite Codes",
+            value="\n".join(
+                f"`{code}` • **{counters[InviteRollups.JOINS]}** joined, {counters[InviteRollups.LEAVES]} left"
+                for code, counters in top_codes
+            ) or "No tracked joins in this period.",
+            inline=False
+        )
+        
+        embed.set_footer(text=config.BOT_FOOTER)
+        embed.timestamp = discord.utils.utcnow()
+        
+        await ctx.send(embed=embed)
+    
+    @check_invites.command(name='retention')
+    @commands.cooldown(1, 10, commands.BucketType.user)
+    async def invites_retention(self, ctx, month: Optional[month_start] = None, member: Optional[discord.Member] = None):
+        """Show 30-day retention of members who joined in a month (YYYY-MM)"""
+        start = month or datetime.now(timezone.utc).date().replace(day=1)
+        end = (start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        
+        by_inviter = self.rollups.query(ctx.guild.id, start, end, 'inviter')
+        if member is not None:
+            by_inviter = {member.id: by_inviter.get(member.id, [0, 0, 0, 0])}
+        
+        joins = sum(counters[InviteRollups.JOINS] for counters in by_inviter.values())
+        left_30d = sum(counters[InviteRollups.COHORT_LEAVES_30D] for counters in by_inviter.values())
+        left_ever = sum(counters[InviteRollups.COHORT_LEAVES] for counters in by_inviter.values())
+        
+        scope = f" invited by {member.mention}" if member else ""
+        embed = discord.Embed(
+            title=f"📊 Retention - {start.strftime('%B %Y')}",
+            description=f"Members who joined in **{start.strftime('%B %Y')}**{scope}",
+            color=config.EMBED_COLORS['info']
+        )
+        
+        if joins:
+            embed.add_field(name="📥 Joined", value=f"`{joins}`", inline=True)
+            embed.add_field(name="📈 30-Day Retention", value=f"`{(joins - left_30d) / joins * 100:.1f}%`", inline=True)
+            embed.add_field(name="👥 Still Here", value=f"`{joins - left_ever}`", inline=True)
+        else:
+            embed.add_field(name="📥 Joined", value="No tracked joins in this month.", inline=False)
+        
+        if datetime.now(timezone.utc).date() < end + timedelta(days=30):
+            embed.add_field(
+                name="⏳ Note",
+                value="Some of this cohort joined less than 30 days ago, so retention may still drop.",
+                inline=False
+            )
+        
+        embed.set_footer(text=config.BOT_FOOTER)
+        embed.timestamp = discord.utils.utcnow()
+        
+        await ctx.send(embed=embed)
+    
     @commands.command(name='resetinvites', hidden=True)
     @commands.has_permissions(administrator=True)
     async def reset_invites(self, ctx, member: discord.Member = None):
@@ -282,6 +862,9 @@ class InviteTracker(commands.Cog):
             guild_str = str(ctx.guild.id)
             if guild_str in self.invite_stats:
                 del self.invite_stats[guild_str]
+            self.leaderboards.pop(guild_str, None)
+            self.packed_invitees = {key: value for key, value in self.packed_invitees.items() if key[0] != guild_str}
+            self.rollups.forget_guild(ctx.guild.id)
             self.save_invite_data()
             
             embed = discord.Embed(
@@ -296,6 +879,8 @@ class InviteTracker(commands.Cog):
             
             if guild_str in self.invite_stats and user_str in self.invite_stats[guild_str]:
                 del self.invite_stats[guild_str][user_str]
+                self.packed_invitees.pop((guild_str, user_str), None)
+                self.get_leaderboard(ctx.guild.id).remove(member.id)
                 self.save_invite_data()
             
             embed = discord.Embed(
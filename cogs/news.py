@@ -0,0 +1,224 @@
+"""
+News Feed Cog for Lua Corporation Discord Bot
+Posts game news from RSS, Atom and HTML sources as news announcements
+
+Features:
+- One shared aiohttp session for all sources
+- Conditional requests (ETag / Last-Modified) so unchanged feeds cost a 304
+- Parsing runs in a small thread pool, off the event loop
+- Items deduplicated against a persisted hash set
+- Posts use the same news embed and channels as !addnews
+"""
+
+import discord
+from discord.ext import commands, tasks
+import aiohttp
+import asyncio
+import functools
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+import config
+from utils.feeds import item_hash, parse_feed, parse_html
+
+logger = logging.getLogger(__name__)
+
+class NewsFeeds(commands.Cog):
+    """Game-news ingestion from configured feeds"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.state_file = 'news_feeds.json'
+        self.session = None
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.NEWS_FEEDS['parser_threads'],
+            thread_name_prefix='news-parser'
+        )
+        self.poll_lock = asyncio.Lock()
+        self.status = {}  # source url -> result of the last poll
+        self.validators = {}  # source url -> {'etag', 'last_modified'}
+        self.initialized = set()  # source urls whose existing items have been recorded
+        self.seen = {}  # item hash -> None, oldest first (used as an ordered set)
+        self.load_state()
+
+    async def cog_load(self):
+        """Open the shared HTTP session and start polling"""
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=config.NEWS_FEEDS['timeout']),
+            headers={'User-Agent': f"{config.BOT_NAME} (news reader)"}
+        )
+        if config.FEATURES.get('news_feeds', True) and config.NEWS_FEEDS['sources']:
+            self.poll_feeds.change_interval(minutes=config.NEWS_FEEDS['poll_minutes'])
+            self.poll_feeds.start()
+
+    async def cog_unload(self):
+        """Stop polling and release the session and parser threads"""
+        self.poll_feeds.cancel()
+        if self.session:
+            await self.session.close()
+        self.executor.shutdown(wait=False)
+
+    def load_state(self):
+        """Load feed validators and seen item hashes from JSON file"""
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                self.validators = state.get('validators', {})
+                self.initialized = set(state.get('initialized', []))
+                self.seen = dict.fromkeys(state.get('seen', []))
+        except Exception as e:
+            logger.error(f"Error loading news feed state: {e}")
+
+    def save_state(self):
+        """Save feed validators and the most recent seen item hashes to JSON file"""
+        limit = config.NEWS_FEEDS['seen_limit']
+        while len(self.seen) > limit:
+            del self.seen[next(iter(self.seen))]
+        try:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'validators': self.validators,
+                    'initialized': sorted(self.initialized),
+                    'seen': list(self.seen)
+                }, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving news feed state: {e}")
+
+    async def fetch(self, source):
+        """Conditional GET; returns (text, validators), or (None, None) if unchanged"""
+        url = source['url']
+        headers = {}
+        cached = self.validators.get(url, {})
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        async with self.session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return None, None
+            response.raise_for_status()
+            text = await response.text()
+            return text, {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+
+    async def parse(self, source, text):
+        """Parse a fetched document in the parser thread pool"""
+        if source.get('type', 'rss') == 'html':
+            parser = functools.partial(parse_html, text, source['selector'], source['url'])
+        else:
+            parser = functools.partial(parse_feed, text, source['url'])
+        return await asyncio.get_running_loop().run_in_executor(self.executor, parser)
+
+    async def post_item(self, source, item):
+        """Post one item as a news announcement; returns True if any channel (may have) received it"""
+        announcements = self.bot.get_cog('Announcements')
+        guild = self.bot.get_guild(source.get('guild_id', config.GUILD_ID))
+        if not announcements or not guild:
+            return False
+
+        message = item['summary'] or item['title']
+        if item['link']:
+            message += f"\n\n🔗 [Read more]({item['link']})"
+        embed = announcements.create_announcement_embed(
+            guild, message, source['name'], item['image'], title=item['title']
+        )
+        results = await announcements.fan_out(guild, embed)
+        # Unknown outcomes count as posted so a retry can't post the item twice
+        return any(delivered is not False for _, delivered, _ in results)
+
+    async def poll_source(self, source):
+        """Fetch, parse and post new items from one source"""
+        url = source['url']
+        text, validators = await self.fetch(source)
+        if text is None:
+            self.status[url] = "unchanged"
+            return
+
+        items = await self.parse(source, text)
+        new_items = [item for item in items if item_hash(item) not in self.seen]
+
+        if url not in self.initialized:
+            # First poll: remember what's already published instead of posting a backlog
+            self.seen.update(dict.fromkeys(item_hash(item) for item in new_items))
+            self.initialized.add(url)
+            self.validators[url] = validators
+            self.status[url] = f"tracking {len(items)} existing item(s)"
+            return
+
+        limit = config.NEWS_FEEDS['max_posts_per_poll']
+        posted = 0
+        for item in new_items[::-1][:limit]:  # Oldest first
+            if not await self.post_item(source, item):
+                self.status[url] = f"posted {posted}, delivery failed"
+                return  # Retry the rest next poll
+            self.seen[item_hash(item)] = None
+            posted += 1
+
+        # Keep the validators only once everything is posted, or a 304 would hide the rest
+        if len(new_items) <= limit:
+            self.validators[url] = validators
+        self.status[url] = f"posted {posted} new item(s)"
+        if posted:
+            logger.info(f"📰 Posted {posted} news item(s) from {source['name']}")
+
+    async def poll_all(self):
+        """Poll every source concurrently"""
+        async with self.poll_lock:
+            sources = config.NEWS_FEEDS['sources']
+            results = await asyncio.gather(*(self.poll_source(source) for source in sources), return_exceptions=True)
+            for source, result in zip(sources, results):
+                if isinstance(result, Exception):
+                    self.status[source['url']] = f"error: {result}"
+                    logger.warning(f"⚠️ News source {source['name']} failed: {result}")
+            self.save_state()
+
+    @tasks.loop(minutes=15)
+    async def poll_feeds(self):
+        """Periodically poll the configured news sources"""
+        await self.poll_all()
+
+    @poll_feeds.before_loop
+    async def before_poll_feeds(self):
+        """Wait for bot to be ready before polling"""
+        await self.bot.wait_until_ready()
+
+    @commands.group(name='newsfeeds', invoke_without_command=True)
+    @commands.has_permissions(administrator=True)
+    async def news_feeds(self, ctx):
+        """Show the configured news sources and their last poll result"""
+        embed = discord.Embed(
+            title="📰 News Feeds",
+            description=(
+                f"Polling every {config.NEWS_FEEDS['poll_minutes']} minute(s)"
+                if self.poll_feeds.is_running() else "Polling is disabled or no sources are configured."
+            ),
+            color=config.EMBED_COLORS['info']
+        )
+        for source in config.NEWS_FEEDS['sources'][:25]:
+            embed.add_field(
+                name=source['name'],
+                value=f"`{source.get('type', 'rss')}` • {source['url']}\n{self.status.get(source['url'], 'not polled yet')}"[:1024],
+                inline=False
+            )
+        embed.set_footer(text=f"Poll now with !newsfeeds poll • {config.BOT_FOOTER}")
+        await ctx.send(embed=embed)
+
+    @news_feeds.command(name='poll')
+    @commands.has_permissions(administrator=True)
+    async def poll_now(self, ctx):
+        """Poll every news source now"""
+        if not config.NEWS_FEEDS['sources']:
+            await ctx.send("❌ No news sources configured in `config.py`!")
+            return
+        await self.poll_all()
+        await ctx.send("✅ News sources polled. Use `!newsfeeds` to see the results.")
+
+async def setup(bot):
+    """Setup function for the cog"""
+    await bot.add_cog(NewsFeeds(bot))
+    logger.info("✅ News feed cog loaded successfully")
@@ -5,111 +5,319 @@ Handles reaction roles and button-based role selection
 Features:
 - Reaction-based role assignment
 - Button-based role selection with Discord UI
-"""
-Role Management Cog
-==================
-Manages server roles and role selection
 - Professional role selection interface
 - Admin controls for role management
+- Role member counts read from precomputed counters
+- Registry of reaction-role panels, each with its own emoji -> role mapping
+- Per-guild role catalog driving paginated select menus
+- Resumable bulk role jobs with live throughput and ETA
 """
 
 import discord
 from discord.ext import commands
+import asyncio
+import json
+import os
 import logging
+import time
+import unicodedata
+from datetime import datetime, timezone
 import config
 
 logger = logging.getLogger(__name__)
 
+def is_emoji(text):
+    """Whether text is a custom emoji or a Unicode emoji (select menus reject anything else)"""
+    if not text:
+        return False
+    if discord.PartialEmoji.from_str(text).id:
+        return True
+    # Keycaps such as 1️⃣ start with an ASCII character
+    if len(text) > 1 and text[0] in '0123456789#*' and text.endswith('\u20e3'):
+        return True
+    categories = [unicodedata.category(char) for char in text]
+    return 'So' in categories and all(category in ('So', 'Sk', 'Mn', 'Me', 'Cf') for category in categories)
+
+class RoleCatalog:
+    """Per-guild catalog of self-assignable roles with precomputed lookups
+    
+    Each guild's catalog is a list of {'role_id', 'emoji', 'description'}
+    entries, seeded from ROLE_SELECTION_ROLES. Emoji/role indexes and menu
+    pages are built once per catalog change instead of on every click.
+    """
+    
+    PAGE_SIZE = 25  # Discord's limit on options in one select menu
+    
+    def __init__(self, data_file='role_menus.json'):
+        self.data_file = data_file
+        self.catalogs = self.load()  # guild_id str -> list of entries
+        self.indexes = {}  # guild_id -> built lookups, dropped when the catalog changes
+    
+    def load(self):
+        """Load role catalogs from JSON file"""
+        try:
+            if os.path.exists(self.data_file):
+                with open(self.data_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading role catalogs: {e}")
+        return {}
+    
+    def save(self):
+        """Save role catalogs to JSON file"""
+        try:
+            with open(self.data_file, 'w', encoding='utf-8') as f:
+                json.dump(self.catalogs, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving role catalogs: {e}")
+    
+    def entries(self, guild_id):
+        """Catalog entries for a guild (the configured defaults until customized)"""
+        entries = self.catalogs.get(str(guild_id))
+        if entries is None:
+            return [
+                {'role_id': role_id, 'emoji': emoji, 'description': ''}
+                for emoji, role_id in config.ROLE_SELECTION_ROLES.items()
+            ]
+        return entries
+    
+    def index(self, guild_id):
+        """Emoji -> role, role -> entry and page lookups for a guild"""
+        index = self.indexes.get(guild_id)
+        if index is None:
+            entries = self.entries(guild_id)
+            index = self.indexes[guild_id] = {
+                'emoji_to_role': {entry['emoji']: entry['role_id'] for entry in entries if entry['emoji']},
+                'role_to_entry': {entry['role_id']: entry for entry in entries},
+                'pages': [entries[i:i + self.PAGE_SIZE] for i in range(0, len(entries), self.PAGE_SIZE)],
+            }
+        return index
+    
+    def _update(self, guild_id, entries):
+        self.catalogs[str(guild_id)] = entries
+        self.indexes.pop(guild_id, None)
+        self.save()
+    
+    def add(self, guild_id, role_id, emoji=None, description=''):
+        """Add or update a role in the guild's catalog"""
+        entries = [entry for entry in self.entries(guild_id) if entry['role_id'] != role_id]
+        entries.append({'role_id': role_id, 'emoji': emoji, 'description': description})
+        self._update(guild_id, entries)
+    
+    def remove(self, guild_id, role_id):
+        """Remove a role from the guild's catalog, returning True if it was listed"""
+        entries = self.entries(guild_id)
+        remaining = [entry for entry in entries if entry['role_id'] != role_id]
+        if len(remaining) == len(entries):
+            return False
+        self._update(guild_id, remaining)
+        return True
+
+class RoleMenuView(discord.ui.View):
+    """Ephemeral, paginated role picker for one member"""
+    
+    def __init__(self, catalog, member, page=0):
+        super().__init__(timeout=180)
+        self.catalog = catalog
+        self.member = member
+        
+        guild = member.guild
+        pages = catalog.index(guild.id)['pages']
+        self.page = max(0, min(page, len(pages) - 1))
+        
+        # Only offer roles that exist and that the bot can manage
+        self.page_roles = []
+        for entry in pages[self.page] if pages else []:
+            role = guild.get_role(entry['role_id'])
+            if role and role < guild.me.top_role:
+                self.page_roles.append((role, entry))
+        
+        if self.page_roles:
+            select = discord.ui.Select(
+                placeholder=f"Choose your roles (page {self.page + 1}/{len(pages)})",
+                min_values=0,
+                max_values=len(self.page_roles),
+                options=[
+                    discord.SelectOption(
+                        label=role.name[:100],
+                        value=str(role.id),
+                        emoji=entry['emoji'] if is_emoji(entry['emoji']) else None,
+                        description=entry['description'][:100] or None,
+                        default=role in member.roles
+                    )
+                    for role, entry in self.page_roles
+                ]
+            )
+            select.callback = self.apply_selection
+            self.add_item(select)
+        
+        if len(pages) > 1:
+            previous_button = discord.ui.Button(label="Previous", emoji="◀️", disabled=self.page == 0)
+            previous_button.callback = lambda interaction: self.change_page(interaction, self.page - 1)
+            self.add_item(previous_button)
+            
+            next_button = discord.ui.Button(label="Next", emoji="▶️", disabled=self.page >= len(pages) - 1)
+            next_button.callback = lambda interaction: self.change_page(interaction, self.page + 1)
+            self.add_item(next_button)
+    
+    async def change_page(self, interaction: discord.Interaction, page: int):
+        """Show another page of the menu"""
+        await interaction.response.edit_message(view=RoleMenuView(self.catalog, interaction.user, page))
+    
+    async def apply_selection(self, interaction: discord.Interaction):
+        """Apply this page's selection with a single member edit"""
+        member = interaction.user
+        selected = {int(value) for value in interaction.data.get('values', [])}
+        page_ids = {role.id for role, _ in self.page_roles}
+        
+        current = [role for role in member.roles if not role.is_default()]
+        current_ids = {role.id for role in current}
+        added = [role for role, _ in self.page_roles if role.id in selected and role.id not in current_ids]
+        removed = [role for role in current if role.id in page_ids and role.id not in selected]
+        
+        if not added and not removed:
+            await interaction.response.send_message("ℹ️ No changes to your roles.", ephemeral=True)
+            return
+        
+        try:
+            new_roles = [role for role in current if role not in removed] + added
+            await member.edit(roles=new_roles, reason="Role menu selection")
+        except discord.Forbidden:
+            await interaction.response.send_message("❌ I don't have permission to manage roles!", ephemeral=True)
+            return
+        except discord.HTTPException as e:
+            logger.error(f"Error applying role menu for {member.name}: {e}")
+            await interaction.response.send_message("❌ An error occurred while managing your roles.", ephemeral=True)
+            return
+        
+        lines = [f"➕ Added **{role.name}**" for role in added] + [f"➖ Removed **{role.name}**" for role in removed]
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+        logger.info(f"Role menu for {member.name}: +{len(added)} -{len(removed)} roles")
+
 class RoleSelectionView(discord.ui.View):
-    """Persistent view for role selection buttons"""
+    """Persistent view that opens the role menu"""
     
-    def __init__(self):
+    def __init__(self, catalog):
         super().__init__(timeout=None)  # Persistent view
-        
+        self.catalog = catalog
+    
     @discord.ui.button(
-        label="Member", 
-        emoji="🎮", 
+        label="Choose Roles", 
+        emoji="🎭", 
         style=discord.ButtonStyle.primary,
-        custom_id="role_member"
+        custom_id="role_menu_open"
     )
-    async def member_role(self, button: discord.ui.Button, interaction: discord.Interaction):
-        await self.handle_role_toggle(interaction, "member", "🎮")
+    async def open_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.send_menu(interaction)
     
-    async def handle_role_toggle(self, interaction: discord.Interaction, role_key: str, emoji: str):
-        """Handle role assignment/removal"""
-        try:
-            # Get role mapping
-            role_map = {
-                "member": config.ROLE_SELECTION_ROLES.get('🎮'),
-            }
-            
-            role_id = role_map.get(role_key)
-            if not role_id:
-                await interaction.response.send_message(
-                    "❌ Role not configured properly!", 
-                    ephemeral=True
-                )
-                return
-            
-            # Get the role
-            role = interaction.guild.get_role(role_id)
-            if not role:
-                await interaction.response.send_message(
-                    f"❌ Role not found! Please contact an administrator.", 
-                    ephemeral=True
-                )
-                return
-            
-            # Check if user has the role
-            if role in interaction.user.roles:
-                # Remove role
-                await interaction.user.remove_roles(role)
-                await interaction.response.send_message(
-                    f"➖ Removed the **{role.name}** {emoji} role!", 
-                    ephemeral=True
-                )
-                logger.info(f"Removed {role.name} role from {interaction.user.name}")
-            else:
-                # Add role
-                await interaction.user.add_roles(role)
-                await interaction.response.send_message(
-                    f"➕ Added the **{role.name}** {emoji} role!", 
-                    ephemeral=True
-                )
-                logger.info(f"Added {role.name} role to {interaction.user.name}")
-                
-        except discord.Forbidden:
-            await interaction.response.send_message(
-                "❌ I don't have permission to manage roles!", 
-                ephemeral=True
-            )
-        except Exception as e:
-            logger.error(f"Error in role toggle: {e}")
-            await interaction.response.send_message(
-                "❌ An error occurred while managing your role.", 
-                ephemeral=True
-            )
+    async def send_menu(self, interaction: discord.Interaction):
+        """Send the member their own paginated role menu"""
+        view = RoleMenuView(self.catalog, interaction.user)
+        if not view.children:
+            await interaction.response.send_message("❌ No selectable roles are configured!", ephemeral=True)
+            return
+        await interaction.response.send_message("🎭 Pick the roles you want:", view=view, ephemeral=True)
+
+class LegacyRoleSelectionView(RoleSelectionView):
+    """Keeps the Member button on older !roles messages working by opening the menu"""
+    
+    def __init__(self, catalog):
+        super().__init__(catalog)
+        self.clear_items()
+        button = discord.ui.Button(
+            label="Member",
+            emoji="🎮",
+            style=discord.ButtonStyle.primary,
+            custom_id="role_member"
+        )
+        button.callback = self.send_menu
+        self.add_item(button)
+
+class BulkRoleFilters(commands.FlagConverter, prefix='--', delimiter=' '):
+    """Member filters for !bulkrole (e.g. --has @Role --after 2025-01-01)"""
+    
+    has: discord.Role = None
+    joined_after: str = commands.flag(name='after', default=None)
+    joined_before: str = commands.flag(name='before', default=None)
 
 class RoleAssignment(commands.Cog):
     """Role assignment system using reactions and buttons"""
     
     def __init__(self, bot):
         self.bot = bot
+        self.reaction_roles_file = 'reaction_roles.json'
+        self.reaction_panels = self.load_reaction_panels()  # message_id -> panel
+        self.catalog = RoleCatalog()
+        self.bulk_jobs_file = 'bulk_role_jobs.json'
+        self.active_bulk_jobs = {}  # guild_id -> {'cancelled': bool}
         
-        # Add persistent view for role selection
-        self.bot.add_view(RoleSelectionView())
+        # Add persistent views for role selection
+        self.bot.add_view(RoleSelectionView(self.catalog))
+        self.bot.add_view(LegacyRoleSelectionView(self.catalog))
+    
+    def load_reaction_panels(self):
+        """Load registered reaction-role panels from JSON file"""
+        try:
+            if os.path.exists(self.reaction_roles_file):
+                with open(self.reaction_roles_file, 'r', encoding='utf-8') as f:
+                    return {int(message_id): panel for message_id, panel in json.load(f).items()}
+        except Exception as e:
+            logger.error(f"Error loading reaction-role panels: {e}")
+        return {}
+    
+    def save_reaction_panels(self):
+        """Save registered reaction-role panels to JSON file"""
+        try:
+            with open(self.reaction_roles_file, 'w', encoding='utf-8') as f:
+                json.dump({str(message_id): panel for message_id, panel in self.reaction_panels.items()}, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving reaction-role panels: {e}")
+    
+    def register_panel(self, message, roles):
+        """Index a message as a reaction-role panel (roles: emoji -> role_id)"""
+        self.reaction_panels[message.id] = {
+            'guild_id': message.guild.id,
+            'channel_id': message.channel.id,
+            'roles': roles
+        }
+        self.save_reaction_panels()
+    
+    async def parse_role_pairs(self, ctx, spec):
+        """Parse "emoji role emoji role ..." into emoji -> role_id (default: the role catalog)"""
+        if not spec:
+            return dict(self.catalog.index(ctx.guild.id)['emoji_to_role'])
+        
+        tokens = spec.split()
+        if len(tokens) % 2:
+            raise commands.BadArgument("Expected pairs of an emoji followed by a role")
+        
+        roles = {}
+        for emoji, role_arg in zip(tokens[::2], tokens[1::2]):
+            role = await commands.RoleConverter().convert(ctx, role_arg)
+            roles[emoji] = role.id
+        return roles
     
     @commands.command(name='roles', aliases=['roleselect', 'rolesmenu'])
     @commands.cooldown(1, 30, commands.BucketType.guild)
     async def roles_menu(self, ctx):
         """Display the role selection menu"""
+        entries = self.catalog.entries(ctx.guild.id)
+        lines = []
+        for entry in entries[:20]:
+            role = ctx.guild.get_role(entry['role_id'])
+            if role:
+                emoji = f"{entry['emoji']} " if entry['emoji'] else ""
+                description = f" - {entry['description']}" if entry['description'] else ""
+                lines.append(f"{emoji}**{role.name}**{description}")
+        if len(entries) > 20:
+            lines.append(f"...and **{len(entries) - 20}** more in the menu")
+        
         embed = discord.Embed(
             title="🎭 Role Selection",
             description=(
-                "Click the button below to assign yourself the Member role.\n"
+                "Click the button below to pick your roles.\n"
                 "This gives you access to exclusive content and discussions.\n\n"
-                "**Available Role:**\n"
-                "🎮 **Member** - Active community member"
+                "**Available Roles:**\n" + ("\n".join(lines) if lines else "No selectable roles configured")
             ),
             color=config.EMBED_COLORS['info']
         )
@@ -117,8 +325,8 @@ class RoleAssignment(commands.Cog):
         embed.add_field(
             name="💡 How it works",
             value=(
-                "• Click the button to **add** the role if you don't have it\n"
-                "• Click the button to **remove** the role if you already have it\n"
+                "• Click the button to open your personal role menu\n"
+                "• **Select** roles to add them, **deselect** roles to remove them\n"
                 "• Changes are immediate!"
             ),
             inline=False
@@ -127,68 +335,192 @@ class RoleAssignment(commands.Cog):
         embed.set_footer(text=config.BOT_FOOTER)
         embed.timestamp = discord.utils.utcnow()
         
-        view = RoleSelectionView()
+        view = RoleSelectionView(self.catalog)
         await ctx.send(embed=embed, view=view)
     
-    @commands.command(name='reactionroles', hidden=True)
+    @commands.group(name='rolemenu', invoke_without_command=True)
     @commands.has_permissions(administrator=True)
-    async def setup_reaction_roles(self, ctx):
-        """Set up reaction roles (Admin only)"""
+    async def role_menu_admin(self, ctx):
+        """List the roles offered in the role menu (Admin only)"""
+        entries = self.catalog.entries(ctx.guild.id)
+        lines = []
+        for entry in entries:
+            emoji = f"{entry['emoji']} " if entry['emoji'] else ""
+            lines.append(f"{emoji}<@&{entry['role_id']}>" + (f" - {entry['description']}" if entry['description'] else ""))
+        
+        embed = discord.Embed(
+            title="🎭 Role Menu Catalog",
+            description="\n".join(lines[:50]) if lines else "No selectable roles configured.",
+            color=config.EMBED_COLORS['info']
+        )
+        embed.add_field(
+            name="⚙️ Manage",
+            value="`!rolemenu add @role [emoji] [description]`\n`!rolemenu remove @role`",
+            inline=False
+        )
+        embed.set_footer(text=f"{len(entries)} role(s) • {config.BOT_FOOTER}")
+        await ctx.send(embed=embed)
+    
+    @role_menu_admin.command(name='add')
+    @commands.has_permissions(administrator=True)
+    async def role_menu_add(self, ctx, role: discord.Role, emoji: str = None, *, description: str = ''):
+        """Add a role to the role menu (Admin only)"""
+        if role >= ctx.guild.me.top_role:
+            await ctx.send(f"❌ **Error:** `{role.name}` is above my highest role, so I can't assign it.")
+            return
+        
+        if emoji and not is_emoji(emoji):
+            # No emoji given, so the first word belongs to the description
+            description = f"{emoji} {description}".strip()
+            emoji = None
+        
+        self.catalog.add(ctx.guild.id, role.id, emoji, description[:100])
+        await ctx.send(f"✅ **Success:** `{role.name}` is now in the role menu.")
+        logger.info(f"🎭 Added {role.name} to the role menu in {ctx.guild.name}")
+    
+    @role_menu_admin.command(name='remove')
+    @commands.has_permissions(administrator=True)
+    async def role_menu_remove(self, ctx, role: discord.Role):
+        """Remove a role from the role menu (Admin only)"""
+        if self.catalog.remove(ctx.guild.id, role.id):
+            await ctx.send(f"✅ **Success:** `{role.name}` was removed from the role menu.")
+        else:
+            await ctx.send(f"ℹ️ **Info:** `{role.name}` is not in the role menu.")
+    
+    @commands.group(name='reactionroles', hidden=True, invoke_without_command=True)
+    @commands.has_permissions(administrator=True)
+    async def setup_reaction_roles(self, ctx, *, spec: str = None):
+        """Create a reaction-role panel (Admin only)
+        
+        Usage: !reactionroles [emoji @role emoji @role ...]
+        Without arguments the panel uses the catalog roles that have an emoji.
+        """
+        try:
+            roles = await self.parse_role_pairs(ctx, spec)
+        except commands.BadArgument as e:
+            await ctx.send(f"❌ **Error:** {e}\n**Usage:** `!reactionroles 🎮 @Role 👻 @OtherRole`")
+            return
+        
+        lines = []
+        for emoji, role_id in roles.items():
+            role = ctx.guild.get_role(role_id)
+            lines.append(f"{emoji} - **{role.name if role else 'Unknown Role'}**")
+        
         embed = discord.Embed(
             title="🎭 Reaction Role Setup",
-            description=(
-                "React to this message to get the Member role.\n\n"
-                "🎮 - **Member Role**"
-            ),
+            description="React to this message to get a role.\n\n" + "\n".join(lines),
             color=config.EMBED_COLORS['info']
         )
         
         embed.set_footer(text="React to get your roles!")
         message = await ctx.send(embed=embed)
+        self.register_panel(message, roles)
         
         # Add reactions
-        for emoji in config.ROLE_SELECTION_ROLES.keys():
+        for emoji in roles.keys():
             try:
                 await message.add_reaction(emoji)
             except Exception as e:
                 logger.error(f"Failed to add reaction {emoji}: {e}")
+        
+        logger.info(f"🎭 Registered reaction-role panel {message.id} with {len(roles)} role(s) in {ctx.guild.name}")
+    
+    @setup_reaction_roles.command(name='register')
+    @commands.has_permissions(administrator=True)
+    async def register_reaction_roles(self, ctx, message: discord.Message, *, spec: str = None):
+        """Register an existing message as a reaction-role panel (Admin only)"""
+        if message.guild is None or message.guild.id != ctx.guild.id:
+            await ctx.send("❌ **Error:** That message is not in this server.")
+            return
+        
+        try:
+            roles = await self.parse_role_pairs(ctx, spec)
+        except commands.BadArgument as e:
+            await ctx.send(f"❌ **Error:** {e}")
+            return
+        
+        self.register_panel(message, roles)
+        await ctx.send(f"✅ **Success:** Registered [this message]({message.jump_url}) with {len(roles)} reaction role(s).")
+    
+    @setup_reaction_roles.command(name='list')
+    @commands.has_permissions(administrator=True)
+    async def list_reaction_roles(self, ctx):
+        """List reaction-role panels in this server (Admin only)"""
+        panels = [(message_id, panel) for message_id, panel in self.reaction_panels.items()
+                  if panel['guild_id'] == ctx.guild.id]
+        
+        embed = discord.Embed(
+            title="🎭 Reaction Role Panels",
+            color=config.EMBED_COLORS['info']
+        )
+        if not panels:
+            embed.description = "No reaction-role panels registered. Create one with `!reactionroles`."
+        for message_id, panel in panels[:25]:
+            roles = ", ".join(f"{emoji} <@&{role_id}>" for emoji, role_id in panel['roles'].items())
+            embed.add_field(
+                name=f"Message {message_id}",
+                value=f"<#{panel['channel_id']}> • {roles}",
+                inline=False
+            )
+        
+        embed.set_footer(text=config.BOT_FOOTER)
+        await ctx.send(embed=embed)
+    
+    @setup_reaction_roles.command(name='remove')
+    @commands.has_permissions(administrator=True)
+    async def remove_reaction_roles(self, ctx, message_id: int):
+        """Unregister a reaction-role panel (Admin only)"""
+        panel = self.reaction_panels.get(message_id)
+        if not panel or panel['guild_id'] != ctx.guild.id:
+            await ctx.send(f"❌ **Error:** No reaction-role panel with message ID `{message_id}`.")
+            return
+        
+        del self.reaction_panels[message_id]
+        self.save_reaction_panels()
+        await ctx.send(f"✅ **Success:** Reaction-role panel `{message_id}` removed.")
+    
+    def resolve_reaction_role(self, payload):
+        """Return (guild, member, role) for a panel reaction, or None to ignore it"""
+        # One lookup rejects reactions on anything that is not a panel
+        panel = self.reaction_panels.get(payload.message_id)
+        if panel is None or payload.user_id == self.bot.user.id:
+            return None
+        
+        role_id = panel['roles'].get(str(payload.emoji))
+        if role_id is None:
+            return None
+        
+        guild = self.bot.get_guild(payload.guild_id)
+        if not guild:
+            return None
+        
+        member = guild.get_member(payload.user_id)
+        role = guild.get_role(role_id)
+        if not member or not role:
+            return None
+        return guild, member, role
     
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload):
         """Handle reaction role additions"""
-        if payload.user_id == self.bot.user.id:
-            return
-        
-        # Check if it's a role selection reaction
-        if str(payload.emoji) not in config.ROLE_SELECTION_ROLES:
+        resolved = self.resolve_reaction_role(payload)
+        if resolved is None:
             return
         
         try:
-            guild = self.bot.get_guild(payload.guild_id)
-            if not guild:
-                return
+            guild, member, role = resolved
             
-            member = guild.get_member(payload.user_id)
-            if not member:
-                return
-            
-            role_id = config.ROLE_SELECTION_ROLES[str(payload.emoji)]
-            role = guild.get_role(role_id)
-            
-            if role and role not in member.roles:
+            if role not in member.roles:
                 await member.add_roles(role)
                 logger.info(f"Added {role.name} role to {member.name} via reaction")
                 
-                # Send DM confirmation
-                try:
-                    embed = discord.Embed(
-                        title="✅ Role Added!",
-                        description=f"You now have the **{role.name}** role in **{guild.name}**!",
-                        color=config.EMBED_COLORS['success']
-                    )
-                    await member.send(embed=embed)
-                except discord.Forbidden:
-                    pass  # User has DMs disabled
+                # DM confirmation; keyed by role so the latest add/remove replaces older ones
+                embed = discord.Embed(
+                    title="✅ Role Added!",
+                    description=f"You now have the **{role.name}** role in **{guild.name}**!",
+                    color=config.EMBED_COLORS['success']
+                )
+                self.bot.dm.send(member, embed, key=f"reaction-role:{role.id}")
                     
         except Exception as e:
             logger.error(f"Error in reaction role add: {e}")
@@ -196,43 +528,258 @@ class RoleAssignment(commands.Cog):
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload):
         """Handle reaction role removals"""
-        if payload.user_id == self.bot.user.id:
-            return
-        
-        # Check if it's a role selection reaction
-        if str(payload.emoji) not in config.ROLE_SELECTION_ROLES:
+        resolved = self.resolve_reaction_role(payload)
+        if resolved is None:
             return
         
         try:
-            guild = self.bot.get_guild(payload.guild_id)
-            if not guild:
-                return
+            guild, member, role = resolved
             
-            member = guild.get_member(payload.user_id)
-            if not member:
-                return
-            
-            role_id = config.ROLE_SELECTION_ROLES[str(payload.emoji)]
-            role = guild.get_role(role_id)
-            
-            if role and role in member.roles:
+            if role in member.roles:
                 await member.remove_roles(role)
                 logger.info(f"Removed {role.name} role from {member.name} via reaction")
                 
-                # Send DM confirmation
-                try:
-                    embed = discord.Embed(
-                        title="➖ Role Removed!",
-                        description=f"You no longer have the **{role.name}** role in **{guild.name}**!",
-                        color=config.EMBED_COLORS['warning']
-                    )
-                    await member.send(embed=embed)
-                except discord.Forbidden:
-                    pass  # User has DMs disabled
+                # DM confirmation; keyed by role so the latest add/remove replaces older ones
+                embed = discord.Embed(
+                    title="➖ Role Removed!",
+                    description=f"You no longer have the **{role.name}** role in **{guild.name}**!",
+                    color=config.EMBED_COLORS['warning']
+                )
+                self.bot.dm.send(member, embed, key=f"reaction-role:{role.id}")
                     
         except Exception as e:
             logger.error(f"Error in reaction role remove: {e}")
     
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload):
+        """Unregister panels whose message was deleted"""
+        if self.reaction_panels.pop(payload.message_id, None) is not None:
+            self.save_reaction_panels()
+    
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload):
+        """Unregister panels removed in a bulk delete"""
+        removed = [message_id for message_id in payload.message_ids if self.reaction_panels.pop(message_id, None)]
+        if removed:
+            self.save_reaction_panels()
+    
+    def load_bulk_checkpoints(self):
+        """Load bulk role job checkpoints from JSON file"""
+        try:
+            if os.path.exists(self.bulk_jobs_file):
+                with open(self.bulk_jobs_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading bulk role checkpoints: {e}")
+        return {}
+    
+    def save_bulk_checkpoints(self, checkpoints):
+        """Save bulk role job checkpoints to JSON file"""
+        try:
+            with open(self.bulk_jobs_file, 'w', encoding='utf-8') as f:
+                json.dump(checkpoints, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving bulk role checkpoints: {e}")
+    
+    @staticmethod
+    def parse_join_date(value):
+        """Parse a YYYY-MM-DD filter date as UTC midnight"""
+        return datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    
+    @staticmethod
+    def format_duration(seconds):
+        """Short human-readable duration for ETAs"""
+        seconds = int(seconds)
+        if seconds < 60:
+            return f"{seconds}s"
+        if seconds < 3600:
+            return f"{seconds // 60}m {seconds % 60}s"
+        return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+    
+    def create_bulk_embed(self, job, state, rate=None):
+        """Status embed for a bulk role job"""
+        titles = {
+            'running': ("🔄 Bulk Role Job Running", config.EMBED_COLORS['info']),
+            'complete': ("✅ Bulk Role Job Complete", config.EMBED_COLORS['success']),
+            'cancelled': ("⏸️ Bulk Role Job Paused", config.EMBED_COLORS['warning']),
+            'interrupted': ("⚠️ Bulk Role Job Interrupted", config.EMBED_COLORS['warning']),
+        }
+        title, color = titles[state]
+        verb = "Removing" if job['action'] == 'remove' else "Giving"
+        
+        embed = discord.Embed(
+            title=title,
+            description=f"{verb} <@&{job['role_id']}> • {job['description']}",
+            color=color
+        )
+        total = job['total'] or 1
+        embed.add_field(name="👥 Processed", value=f"`{job['processed']}/{job['total']}` ({job['processed'] / total * 100:.0f}%)", inline=True)
+        embed.add_field(name="✅ Changed", value=f"`{job['changed']}`", inline=True)
+        embed.add_field(name="❌ Failed", value=f"`{job['failed']}`", inline=True)
+        if state == 'running' and rate:
+            remaining = max(job['total'] - job['processed'], 0)
+            embed.add_field(name="⚡ Throughput", value=f"`{rate * 60:.0f}` members/min", inline=True)
+            embed.add_field(name="⏱️ ETA", value=f"`{self.format_duration(remaining / rate)}`", inline=True)
+        if state in ('cancelled', 'interrupted'):
+            embed.add_field(
+                name="🔁 Resume",
+                value="Run the same `!bulkrole` command again to continue from the last checkpoint.",
+                inline=False
+            )
+        embed.set_footer(text=config.BOT_FOOTER)
+        embed.timestamp = discord.utils.utcnow()
+        return embed
+    
+    @commands.group(name='bulkrole', invoke_without_command=True)
+    @commands.has_permissions(administrator=True)
+    async def bulk_role(self, ctx):
+        """Bulk role operations (Admin only)"""
+        await ctx.send(
+            "**Usage:**\n"
+            "`!bulkrole add @Role --has @OtherRole` - Give a role to everyone with another role\n"
+            "`!bulkrole remove @Role --before 2025-01-01` - Remove a role from members who joined before a date\n"
+            "`!bulkrole cancel` - Pause the running job (resume by running it again)\n"
+            "Filters: `--has @Role`, `--after YYYY-MM-DD`, `--before YYYY-MM-DD` (join date)"
+        )
+    
+    @bulk_role.command(name='add')
+    @commands.has_permissions(administrator=True)
+    async def bulk_role_add(self, ctx, role: discord.Role, *, filters: BulkRoleFilters):
+        """Give a role to every member matching the filters (Admin only)"""
+        await self.run_bulk_job(ctx, 'add', role, filters)
+    
+    @bulk_role.command(name='remove')
+    @commands.has_permissions(administrator=True)
+    async def bulk_role_remove(self, ctx, role: discord.Role, *, filters: BulkRoleFilters):
+        """Remove a role from every member matching the filters (Admin only)"""
+        await self.run_bulk_job(ctx, 'remove', role, filters)
+    
+    @bulk_role.command(name='cancel')
+    @commands.has_permissions(administrator=True)
+    async def bulk_role_cancel(self, ctx):
+        """Pause the running bulk role job (Admin only)"""
+        job = self.active_bulk_jobs.get(ctx.guild.id)
+        if not job:
+            await ctx.send("ℹ️ **Info:** No bulk role job is running in this server.")
+            return
+        job['cancelled'] = True
+        await ctx.send("⏸️ **Pausing** after the current batch. Run the same command again to resume.")
+    
+    async def run_bulk_job(self, ctx, action, role, filters):
+        """Apply a role change to all matching members, checkpointing each batch"""
+        guild = ctx.guild
+        if guild.id in self.active_bulk_jobs:
+            await ctx.send("ℹ️ **Info:** A bulk role job is already running. Use `!bulkrole cancel` to pause it.")
+            return
+        
+        # Claim the guild before any await so a second invocation can't start the same job
+        control = self.active_bulk_jobs[guild.id] = {'cancelled': False}
+        try:
+            await self._run_bulk_job(ctx, action, role, filters, control)
+        finally:
+            self.active_bulk_jobs.pop(guild.id, None)
+    
+    async def _run_bulk_job(self, ctx, action, role, filters, control):
+        """Validate, then process the job while this guild's job slot is held"""
+        guild = ctx.guild
+        if role.is_default() or role.managed or role >= guild.me.top_role:
+            await ctx.send(f"❌ **Error:** I can't assign `{role.name}`.")
+            return
+        
+        try:
+            joined_after = self.parse_join_date(filters.joined_after) if filters.joined_after else None
+            joined_before = self.parse_join_date(filters.joined_before) if filters.joined_before else None
+        except ValueError:
+            await ctx.send("❌ **Error:** Dates must be in `YYYY-MM-DD` format.")
+            return
+        if not (filters.has or joined_after or joined_before):
+            await ctx.send("❌ **Error:** Add at least one filter (`--has @everyone` targets all members).")
+            return
+        
+        parts = []
+        if filters.has:
+            parts.append(f"members with {filters.has.mention}")
+        if joined_after:
+            parts.append(f"joined after {filters.joined_after}")
+        if joined_before:
+            parts.append(f"joined before {filters.joined_before}")
+        description = ", ".join(parts)
+        
+        # The same command resumes its checkpoint; a different one starts over
+        signature = [action, role.id, filters.has.id if filters.has else None, filters.joined_after, filters.joined_before]
+        checkpoints = self.load_bulk_checkpoints()
+        job = checkpoints.get(str(guild.id))
+        if not job or job.get('signature') != signature:
+            job = {
+                'signature': signature, 'action': action, 'role_id': role.id, 'description': description,
+                'after': 0, 'processed': 0, 'changed': 0, 'failed': 0, 'total': 0
+            }
+        elif job['after']:
+            await ctx.send(f"🔁 **Resuming** bulk role job after {job['processed']} processed members.")
+        
+        def matches(member):
+            if filters.has and filters.has not in member.roles:
+                return False
+            if joined_after and (not member.joined_at or member.joined_at < joined_after):
+                return False
+            if joined_before and (not member.joined_at or member.joined_at >= joined_before):
+                return False
+            return True
+        
+        # Work in member ID order so the checkpoint is a single "after" ID
+        source = filters.has.members if filters.has and not filters.has.is_default() else guild.members
+        candidates = sorted((member for member in source if member.id > job['after'] and matches(member)), key=lambda m: m.id)
+        job['total'] = job['processed'] + len(candidates)
+        
+        status = await ctx.send(embed=self.create_bulk_embed(job, 'running'))
+        remove = action == 'remove'
+        reason = f"Bulk role {action} by {ctx.author}"
+        chunk_size = config.ROLE_WORKER_CONFIG['backfill_chunk']
+        started = time.monotonic()
+        last_edit = started
+        processed_this_run = 0
+        state = 'interrupted'
+        
+        try:
+            for start in range(0, len(candidates), chunk_size):
+                if control['cancelled']:
+                    state = 'cancelled'
+                    break
+                
+                chunk = candidates[start:start + chunk_size]
+                needed = [member for member in chunk if (role in member.roles) == remove]
+                results = await asyncio.gather(*(
+                    self.bot.role_worker.enqueue(member, role, reason, remove=remove) for member in needed
+                ))
+                
+                job['processed'] += len(chunk)
+                job['changed'] += sum(results)
+                job['failed'] += len(results) - sum(results)
+                job['after'] = chunk[-1].id
+                checkpoints[str(guild.id)] = job
+                self.save_bulk_checkpoints(checkpoints)
+                processed_this_run += len(chunk)
+                
+                now = time.monotonic()
+                if now - last_edit >= config.ROLE_WORKER_CONFIG['progress_interval']:
+                    rate = processed_this_run / (now - started)
+                    await status.edit(embed=self.create_bulk_embed(job, 'running', rate))
+                    last_edit = now
+            else:
+                # Finished, so the next run of this command starts fresh
+                checkpoints.pop(str(guild.id), None)
+                self.save_bulk_checkpoints(checkpoints)
+                state = 'complete'
+                logger.info(f"✅ Bulk role {action} of {role.name} in {guild.name}: {job['changed']} changed, {job['failed']} failed")
+                
+        except discord.HTTPException as e:
+            logger.error(f"Bulk role job in {guild.name} interrupted: {e}")
+        finally:
+            try:
+                await status.edit(embed=self.create_bulk_embed(job, state))
+            except discord.HTTPException:
+                pass
+    
     @commands.command(name='myroles')
     @commands.cooldown(1, 10, commands.BucketType.user)
     async def my_roles(self, ctx):
@@ -247,13 +794,11 @@ class RoleAssignment(commands.Cog):
             )
         else:
             role_list = []
+            role_to_entry = self.catalog.index(ctx.guild.id)['role_to_entry']
             for role in sorted(user_roles, key=lambda r: r.position, reverse=True):
                 # Add emoji if it's a selectable role
-                emoji = ""
-                for reaction_emoji, role_id in config.ROLE_SELECTION_ROLES.items():
-                    if role.id == role_id:
-                        emoji = f"{reaction_emoji} "
-                        break
+                entry = role_to_entry.get(role.id)
+                emoji = f"{entry['emoji']} " if entry and entry['emoji'] else ""
                 
                 role_list.append(f"{emoji}**{role.name}**")
             
@@ -297,7 +842,7 @@ class RoleAssignment(commands.Cog):
             name="📊 Statistics",
             value=(
                 f"**ID:** {role.id}\n"
-                f"**Members:** {len(role.members)}\n"
+                f"**Members:** {self.bot.member_counters.role_members(role)}\n"
                 f"**Position:** {role.position}\n"
                 f"**Mentionable:** {'Yes' if role.mentionable else 'No'}\n"
                 f"**Hoisted:** {'Yes' if role.hoist else 'No'}"
@@ -315,7 +860,7 @@ class RoleAssignment(commands.Cog):
         )
         
         # Check if it's a selectable role
-        is_selectable = any(role.id == role_id for role_id in config.ROLE_SELECTION_ROLES.values())
+        is_selectable = role.id in self.catalog.index(ctx.guild.id)['role_to_entry']
         if is_selectable:
             embed.add_field(
                 name="✨ Special Role",
@@ -340,12 +885,13 @@ class RoleAssignment(commands.Cog):
         
         # Get selectable role stats
         selectable_stats = []
-        for emoji, role_id in config.ROLE_SELECTION_ROLES.items():
-            role = ctx.guild.get_role(role_id)
+        for entry in self.catalog.entries(ctx.guild.id)[:25]:
+            emoji = f"{entry['emoji']} " if entry['emoji'] else ""
+            role = ctx.guild.get_role(entry['role_id'])
             if role:
-                selectable_stats.append(f"{emoji} **{role.name}**: {len(role.members)} members")
+                selectable_stats.append(f"{emoji}**{role.name}**: {self.bot.member_counters.role_members(role)} members")
             else:
-                selectable_stats.append(f"{emoji} **Role not found** (ID: {role_id})")
+                selectable_stats.append(f"{emoji}**Role not found** (ID: {entry['role_id']})")
         
         embed.add_field(
             name="🎭 Selectable Roles",
@@ -0,0 +1,151 @@
+"""
+Settings Cog for Lua Corporation Discord Bot
+Per-server channel and role configuration without editing config.py
+
+Features:
+- View every setting with its current value
+- Change channels and roles per server at runtime
+- Reset a setting back to the config.py default
+- Force a slash command resync
+"""
+
+import discord
+from discord.ext import commands
+import logging
+import config
+from utils.settings import SCHEMA, can_target_channel
+
+logger = logging.getLogger(__name__)
+
+class Settings(commands.Cog):
+    """Per-server settings management"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.settings = bot.settings
+
+    def format_value(self, key, value):
+        """Render a setting value as mentions"""
+        kind = SCHEMA[key].kind
+        values = value if SCHEMA[key].is_list else [value]
+        values = [item for item in values if item]
+        if not values:
+            return "Not set"
+        if kind in ('role', 'roles'):
+            return ", ".join(f"<@&{item}>" for item in values)
+        return ", ".join(f"<#{item}>" for item in values)
+
+    async def convert_value(self, ctx, key, arguments):
+        """Convert command arguments to a setting value, raising BadArgument if they don't fit"""
+        spec = SCHEMA[key]
+        if not arguments or (len(arguments) == 1 and arguments[0].lower() == 'none'):
+            return [] if spec.is_list else None
+
+        if spec.kind in ('role', 'roles'):
+            converter = commands.RoleConverter()
+            values = [(await converter.convert(ctx, argument)).id for argument in arguments]
+        elif spec.kind == 'channel':
+            values = [(await commands.TextChannelConverter().convert(ctx, argument)).id for argument in arguments]
+        else:
+            # Channel lists may point at other servers the bot is in, if the author manages the channel there
+            current = self.settings.get(ctx.guild.id, key)
+            values = []
+            for argument in arguments:
+                text = argument.strip('<#>')
+                channel = self.bot.get_channel(int(text)) if text.isdigit() else None
+                if not isinstance(channel, discord.TextChannel):
+                    raise commands.BadArgument(f"Channel `{argument}` not found.")
+                if channel.id not in current and not can_target_channel(ctx.author, ctx.guild, channel):
+                    raise commands.BadArgument(f"You need Manage Channels in **{channel.guild.name}** to use {channel.mention}.")
+                values.append(channel.id)
+
+        if not spec.is_list:
+            if len(values) > 1:
+                raise commands.BadArgument(f"`{key}` takes a single value.")
+            return values[0]
+        return values
+
+    @commands.group(name='settings', invoke_without_command=True)
+    @commands.has_permissions(administrator=True)
+    async def settings_group(self, ctx):
+        """Show this server's settings
+
+        Usage: !settings
+        """
+        embed = discord.Embed(
+            title="⚙️ Server Settings",
+            description=(
+                f"`{ctx.prefix}settings set <name> <value...>` - Change a setting (`none` to clear)\n"
+                f"`{ctx.prefix}settings reset <name>` - Restore the default"
+            ),
+            color=config.EMBED_COLORS['info']
+        )
+        for key, spec in SCHEMA.items():
+            value = self.format_value(key, self.settings.get(ctx.guild.id, key))
+            source = "" if self.settings.is_overridden(ctx.guild.id, key) else " *(default)*"
+            embed.add_field(name=f"`{key}`", value=f"{value}{source}\n{spec.description}"[:1024], inline=False)
+        embed.set_footer(text=config.BOT_FOOTER)
+        await ctx.send(embed=embed)
+
+    @settings_group.command(name='set')
+    @commands.has_permissions(administrator=True)
+    async def set_setting(self, ctx, key: str, *arguments):
+        """Change a setting for this server
+
+        Usage: !settings set <name> <value...>
+        Example: !settings set welcome_channel #welcome
+        Example: !settings set support_roles @Staff @Moderator
+        """
+        key = key.lower()
+        if key not in SCHEMA:
+            await ctx.send(f"❌ **Error:** Unknown setting `{key}`. Use `{ctx.prefix}settings` to see them all.")
+            return
+
+        try:
+            value = await self.convert_value(ctx, key, arguments)
+        except commands.BadArgument as e:
+            await ctx.send(f"❌ **Error:** {e}")
+            return
+
+        value = self.settings.set(ctx.guild.id, key, value)
+        await ctx.send(f"✅ `{key}` set to {self.format_value(key, value)}")
+        logger.info(f"⚙️ {ctx.author.name} set {key} in {ctx.guild.name}")
+
+    @settings_group.command(name='reset')
+    @commands.has_permissions(administrator=True)
+    async def reset_setting(self, ctx, key: str):
+        """Restore a setting to its default
+
+        Usage: !settings reset <name>
+        """
+        key = key.lower()
+        if key not in SCHEMA:
+            await ctx.send(f"❌ **Error:** Unknown setting `{key}`. Use `{ctx.prefix}settings` to see them all.")
+            return
+
+        value = self.settings.reset(ctx.guild.id, key)
+        await ctx.send(f"✅ `{key}` reset to the default: {self.format_value(key, value)}")
+        logger.info(f"⚙️ {ctx.author.name} reset {key} in {ctx.guild.name}")
+
+    @commands.command(name='synccommands')
+    @commands.has_permissions(administrator=True)
+    @commands.cooldown(1, 60, commands.BucketType.default)
+    async def sync_commands(self, ctx):
+        """Force a slash command resync, even if the command tree is unchanged
+
+        Usage: !synccommands
+        """
+        try:
+            synced = await self.bot.command_sync.sync(force=True)
+        except discord.HTTPException as e:
+            await ctx.send(f"❌ **Error:** Slash command sync failed: {e}")
+            return
+
+        target = "the development server" if self.bot.command_sync.dev_guild else "all servers"
+        await ctx.send(f"✅ Synced {len(synced)} slash command(s) to {target}")
+        logger.info(f"⚙️ {ctx.author.name} forced a slash command sync")
+
+async def setup(bot):
+    """Setup function for the cog"""
+    await bot.add_cog(Settings(bot))
+    logger.info("✅ Settings cog loaded successfully")
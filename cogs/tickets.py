@@ -8,6 +8,10 @@ Features:
 - Proper channel isolation and privacy
 - Staff notification system
 - Transcript generation with proper routing
+- SLA analytics with streaming percentiles
+- Least-loaded staff assignment
+- Coalesced staff alerts with per-ticket cooldowns
+- Crash-safe journaled ticket storage
 """
 
 import discord
@@ -16,11 +20,25 @@ import logging
 import asyncio
 import json
 import os
+import time
 from datetime import datetime, timedelta, timezone
 import config
+from utils.journal import JournaledStore
+from utils.sketch import QuantileSketch
 
 logger = logging.getLogger(__name__)
 
+def support_staff_only():
+    """Command check: the author holds one of the guild's support roles"""
+    async def predicate(ctx):
+        if ctx.guild is None:
+            raise commands.NoPrivateMessage()
+        if ctx.bot.settings.member_has_role(ctx.author, 'support_roles'):
+            return True
+        raise commands.MissingAnyRole(ctx.bot.settings.get(ctx.guild.id, 'support_roles'))
+    predicate.help_tier = 'support'  # !help lists these commands for support staff
+    return commands.check(predicate)
+
 class TicketDropdown(discord.ui.Select):
     """Dropdown menu for ticket type selection"""
     
@@ -124,7 +142,7 @@ class TicketActionView(discord.ui.View):
         ticket_data = ticket_cog.active_tickets[channel_id]
         
         # Only ticket creator or staff can close
-        is_staff = any(role.id in config.TICKET_CONFIG['support_roles'] for role in interaction.user.roles)
+        is_staff = ticket_cog._is_staff(interaction.user)
         is_creator = interaction.user.id == ticket_data['user_id']
         
         if not (is_staff or is_creator):
@@ -140,14 +158,41 @@ class TicketActionView(discord.ui.View):
     @discord.ui.button(label="Alert Staff", style=discord.ButtonStyle.secondary, emoji="🔔", custom_id="alert_staff")
     async def alert_staff_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Alert staff button"""
+        ticket_cog = interaction.client.get_cog('TicketSystem')
+        if not ticket_cog:
+            await interaction.response.send_message("❌ Ticket system not available!", ephemeral=True)
+            return
+        
+        if str(interaction.channel.id) not in ticket_cog.active_tickets:
+            await interaction.response.send_message("❌ This is not a valid ticket channel!", ephemeral=True)
+            return
+        
+        # One alert per ticket per cooldown window
+        remaining = ticket_cog.alert_cooldown_remaining(interaction.channel.id)
+        if remaining:
+            await interaction.response.send_message(
+                f"⏳ Staff have already been alerted for this ticket. "
+                f"You can alert them again in **{ticket_cog._format_seconds(remaining)}**.",
+                ephemeral=True
+            )
+            return
+        
+        # Staff get a batched digest when an alert channel is configured
+        if ticket_cog.settings.channel(interaction.guild, 'ticket_alert_channel'):
+            ticket_cog.queue_staff_alert(interaction.channel, interaction.user)
+            await interaction.response.send_message(
+                f"🔔 **Staff Alert!**\n\n"
+                f"**{interaction.user.mention}** needs immediate assistance in this ticket! "
+                f"The support team has been notified.",
+                ephemeral=False  # Everyone in ticket can see this
+            )
+            return
+        
         # Create mention string for all support roles
-        mentions = []
-        for role_id in config.TICKET_CONFIG['support_roles']:
-            role = interaction.guild.get_role(role_id)
-            if role:
-                mentions.append(role.mention)
+        mentions = [role.mention for role in ticket_cog.settings.roles(interaction.guild, 'support_roles')]
         
         if mentions:
+            ticket_cog.start_alert_cooldown(interaction.channel.id)
             mention_text = " ".join(mentions)
             await interaction.response.send_message(
                 f"🔔 **Staff Alert!**\n{mention_text}\n\n"
@@ -164,20 +209,270 @@ class TicketView(discord.ui.View):
         super().__init__(timeout=None)  # Persistent view
         self.add_item(TicketDropdown(bot))
 
+class TicketAnalytics:
+    """Running SLA aggregates per ticket type and per day"""
+    
+    METRICS = ('first_response', 'resolution')
+    
+    def __init__(self, data_file='ticket_stats.json'):
+        self.data_file = data_file
+        self.by_type = {}  # ticket_type -> bucket
+        self.by_day = {}  # 'YYYY-MM-DD' -> {ticket_type -> bucket}
+        self.save_task = None  # Pending debounced save
+        self.load()
+    
+    def _new_bucket(self):
+        """Create an empty aggregate bucket"""
+        bucket = {'created': 0, 'closed': 0}
+        for metric in self.METRICS:
+            bucket[metric] = QuantileSketch()
+        return bucket
+    
+    def _buckets_for(self, ticket_type, when):
+        """Get the per-type and per-day buckets an event falls into"""
+        day = when.strftime('%Y-%m-%d')
+        if ticket_type not in self.by_type:
+            self.by_type[ticket_type] = self._new_bucket()
+        day_buckets = self.by_day.setdefault(day, {})
+        if ticket_type not in day_buckets:
+            day_buckets[ticket_type] = self._new_bucket()
+        return self.by_type[ticket_type], day_buckets[ticket_type]
+    
+    def record_created(self, ticket_type, when):
+        """Record a ticket being opened"""
+        for bucket in self._buckets_for(ticket_type, when):
+            bucket['created'] += 1
+        self.schedule_save()
+    
+    def record_first_response(self, ticket_type, seconds, when):
+        """Record the time until the first staff reply"""
+        for bucket in self._buckets_for(ticket_type, when):
+            bucket['first_response'].add(seconds)
+        self.schedule_save()
+    
+    def record_closed(self, ticket_type, seconds, when):
+        """Record a ticket being closed and how long it was open"""
+        for bucket in self._buckets_for(ticket_type, when):
+            bucket['closed'] += 1
+            bucket['resolution'].add(seconds)
+        self.schedule_save()
+    
+    def summary(self, days=None):
+        """Merge the aggregates into one bucket per ticket type
+        
+        With days=None the all-time per-type buckets are used, otherwise the
+        daily buckets of the last `days` days are merged.
+        """
+        if days is None:
+            sources = [self.by_type]
+        else:
+            today = datetime.now().date()
+            wanted = {(today - timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range(days)}
+            sources = [buckets for day, buckets in self.by_day.items() if day in wanted]
+        
+        merged = {}
+        for source in sources:
+            for ticket_type, bucket in source.items():
+                if ticket_type not in merged:
+                    merged[ticket_type] = self._new_bucket()
+                target = merged[ticket_type]
+                target['created'] += bucket['created']
+                target['closed'] += bucket['closed']
+                for metric in self.METRICS:
+                    target[metric].merge(bucket[metric])
+        return merged
+    
+    def _prune_days(self):
+        """Drop daily buckets older than the retention window"""
+        retention = config.TICKET_CONFIG.get('stats_retention_days', 90)
+        cutoff = (datetime.now().date() - timedelta(days=retention)).strftime('%Y-%m-%d')
+        for day in [day for day in self.by_day if day < cutoff]:
+            del self.by_day[day]
+    
+    def _bucket_to_dict(self, bucket):
+        data = {'created': bucket['created'], 'closed': bucket['closed']}
+        for metric in self.METRICS:
+            data[metric] = bucket[metric].to_dict()
+        return data
+    
+    def _bucket_from_dict(self, data):
+        bucket = {'created': data.get('created', 0), 'closed': data.get('closed', 0)}
+        for metric in self.METRICS:
+            bucket[metric] = QuantileSketch.from_dict(data.get(metric, {}))
+        return bucket
+    
+    def load(self):
+        """Load aggregates from file"""
+        try:
+            if os.path.exists(self.data_file):
+                with open(self.data_file, 'r') as f:
+                    data = json.load(f)
+                self.by_type = {
+                    ticket_type: self._bucket_from_dict(bucket)
+                    for ticket_type, bucket in data.get('by_type', {}).items()
+                }
+                self.by_day = {
+                    day: {ticket_type: self._bucket_from_dict(bucket) for ticket_type, bucket in buckets.items()}
+                    for day, buckets in data.get('by_day', {}).items()
+                }
+                logger.info("✅ Loaded ticket statistics")
+        except Exception as e:
+            logger.error(f"❌ Error loading ticket statistics: {e}")
+            self.by_type = {}
+            self.by_day = {}
+    
+    def schedule_save(self):
+        """Save after a short delay so bursts of ticket events share one write"""
+        if self.save_task is None or self.save_task.done():
+            self.save_task = asyncio.create_task(self._save_later())
+    
+    async def _save_later(self):
+        try:
+            await asyncio.sleep(config.TICKET_CONFIG.get('stats_save_delay', 30))
+        except asyncio.CancelledError:
+            return
+        self.save()
+    
+    def flush(self):
+        """Write a pending debounced save now"""
+        if self.save_task and not self.save_task.done():
+            self.save_task.cancel()
+            self.save()
+    
+    def save(self):
+        """Save aggregates to file"""
+        try:
+            self._prune_days()
+            data = {
+                'by_type': {ticket_type: self._bucket_to_dict(bucket) for ticket_type, bucket in self.by_type.items()},
+                'by_day': {
+                    day: {ticket_type: self._bucket_to_dict(bucket) for ticket_type, bucket in buckets.items()}
+                    for day, buckets in self.by_day.items()
+                }
+            }
+            # Write a temp file and rename it so a crash mid-write can't truncate the stats
+            temp_file = f"{self.data_file}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.data_file)
+        except Exception as e:
+            logger.error(f"❌ Error saving ticket statistics: {e}")
+
+class StaffLoadIndex:
+    """Open-ticket counts per staff member, bucketed by load
+    
+    Available staff sit in buckets keyed by their open ticket count, so the
+    least-loaded staffer is always found in the lowest non-empty bucket.
+    Within a bucket staff are kept in insertion order, which rotates ties.
+    """
+    
+    def __init__(self):
+        self.load = {}  # member_id -> open ticket count
+        self.available = set()
+        self.buckets = {}  # open ticket count -> {member_id: None} (ordered set)
+        self.min_load = 0
+    
+    def __contains__(self, member_id):
+        return member_id in self.load
+    
+    def _bucket_add(self, member_id):
+        count = self.load[member_id]
+        self.buckets.setdefault(count, {})[member_id] = None
+        if count < self.min_load or len(self.buckets) == 1:
+            self.min_load = count
+    
+    def _bucket_remove(self, member_id):
+        count = self.load[member_id]
+        bucket = self.buckets.get(count)
+        if bucket is None or member_id not in bucket:
+            return
+        del bucket[member_id]
+        if not bucket:
+            del self.buckets[count]
+    
+    def add_staff(self, member_id, available=True):
+        """Start tracking a staff member"""
+        if member_id not in self.load:
+            self.load[member_id] = 0
+        self.set_available(member_id, available)
+    
+    def remove_staff(self, member_id):
+        """Stop tracking a staff member"""
+        if member_id not in self.load:
+            return
+        self.set_available(member_id, False)
+        del self.load[member_id]
+    
+    def set_available(self, member_id, available):
+        """Mark a staff member as available (online) or not"""
+        if member_id not in self.load:
+            return
+        if available and member_id not in self.available:
+            self.available.add(member_id)
+            self._bucket_add(member_id)
+        elif not available and member_id in self.available:
+            self._bucket_remove(member_id)
+            self.available.discard(member_id)
+    
+    def adjust(self, member_id, delta):
+        """Change a staff member's open ticket count by delta"""
+        if member_id not in self.load:
+            return
+        if member_id in self.available:
+            self._bucket_remove(member_id)
+            self.load[member_id] = max(self.load[member_id] + delta, 0)
+            self._bucket_add(member_id)
+        else:
+            self.load[member_id] = max(self.load[member_id] + delta, 0)
+    
+    def least_loaded(self, exclude=None):
+        """Return the available staff member with the fewest open tickets"""
+        if not self.buckets:
+            return None
+        
+        # Buckets only ever move by one per ticket, so this rarely advances
+        while self.min_load not in self.buckets:
+            self.min_load += 1
+        
+        for member_id in self.buckets[self.min_load]:
+            if member_id != exclude:
+                return member_id
+        
+        # Only the excluded member is at the minimum; fall back to the next bucket
+        for count in sorted(self.buckets):
+            for member_id in self.buckets[count]:
+                if member_id != exclude:
+                    return member_id
+        return None
+
 class TicketSystem(commands.Cog):
     """Professional ticket system with dropdown interface"""
     
     def __init__(self, bot):
         self.bot = bot
         self.tickets_data_file = 'tickets_data.json'
-        self.ticket_config_file = 'ticket_config.json'
+        self.settings = bot.settings
         self.active_tickets = {}
         self.user_tickets = {}  # Track tickets per user
-        self.ticket_log_channel = None  # Will be loaded from config
+        self.ticket_store = JournaledStore(
+            self.tickets_data_file,
+            compact_every=config.TICKET_CONFIG['journal_compact_every']
+        )
+        self.analytics = TicketAnalytics()
+        self.staff_indexes = {}  # guild_id -> StaffLoadIndex
+        self.assigned_tickets = {}  # staff member_id -> set of ticket channel ids
+        self.alert_cooldowns = {}  # ticket channel_id -> monotonic time of last alert
+        self.pending_alerts = {}  # ticket channel_id -> (channel, user, time) awaiting digest
+        self.alert_flush_task = None
         
         # Load existing ticket data
         self.load_ticket_data()
-        self.load_ticket_config()
+        self.migrate_ticket_config('ticket_config.json')
+        
+        # Delayed channel deletions survive restarts via the job scheduler
+        self.bot.scheduler.register('ticket_delete_channel', self._delete_channel_job)
         
         # Start auto-close task
         if config.FEATURES.get('ticket_system', True):
@@ -185,57 +480,71 @@ class TicketSystem(commands.Cog):
     
     def cog_unload(self):
         """Clean up when cog is unloaded"""
+        self.bot.scheduler.unregister('ticket_delete_channel')
         self.auto_close_tickets.cancel()
+        if self.alert_flush_task:
+            self.alert_flush_task.cancel()
+        self.analytics.flush()
         self.save_ticket_data()
-        self.save_ticket_config()
     
-    def load_ticket_config(self):
-        """Load ticket configuration from file"""
+    def migrate_ticket_config(self, path):
+        """Move the log and alert channels from the old ticket config file into the main guild's settings"""
+        if not os.path.exists(path):
+            return
         try:
-            if os.path.exists(self.ticket_config_file):
-                with open(self.ticket_config_file, 'r') as f:
-                    config_data = json.load(f)
-                    self.ticket_log_channel = config_data.get('log_channel_id')
-                logger.info("✅ Loaded ticket configuration")
+            with open(path, 'r') as f:
+                config_data = json.load(f)
+            for old_key, setting in (('log_channel_id', 'ticket_log_channel'), ('alert_channel_id', 'ticket_alert_channel')):
+                if config_data.get(old_key) and not self.settings.is_overridden(config.GUILD_ID, setting):
+                    self.settings.set(config.GUILD_ID, setting, config_data[old_key])
+            os.replace(path, f"{path}.migrated")
+            logger.info("✅ Migrated ticket configuration into guild settings")
         except Exception as e:
-            logger.error(f"❌ Error loading ticket config: {e}")
-            self.ticket_log_channel = None
+            logger.error(f"❌ Error migrating ticket config: {e}")
     
-    def save_ticket_config(self):
-        """Save ticket configuration to file"""
+    @commands.Cog.listener()
+    async def on_settings_update(self, guild_id, key, old, new):
+        """Rebuild the staff index when a guild changes its support roles"""
+        if key == 'support_roles':
+            self.staff_indexes.pop(guild_id, None)
+
+    def load_ticket_data(self):
+        """Load ticket data from the snapshot and journal"""
         try:
-            config_data = {
-                'log_channel_id': self.ticket_log_channel
-            }
-            with open(self.ticket_config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
-            logger.info("✅ Saved ticket configuration")
+            state = self.ticket_store.load(('active_tickets', 'user_tickets'))
+            logger.info("✅ Loaded existing ticket data")
         except Exception as e:
-            logger.error(f"❌ Error saving ticket config: {e}")
+            logger.error(f"❌ Error loading ticket data: {e}")
+            self.ticket_store.state = {}
+            state = self.ticket_store.state
+        
+        # The cog works on the store's dicts directly, so snapshots always see current data
+        self.active_tickets = state.setdefault('active_tickets', {})
+        self.user_tickets = state.setdefault('user_tickets', {})
     
-    def load_ticket_data(self):
-        """Load ticket data from file"""
+    def save_ticket(self, channel_id):
+        """Journal the current state of one ticket (or its removal)"""
         try:
-            if os.path.exists(self.tickets_data_file):
-                with open(self.tickets_data_file, 'r') as f:
-                    data = json.load(f)
-                    self.active_tickets = data.get('active_tickets', {})
-                    self.user_tickets = data.get('user_tickets', {})
-                logger.info("✅ Loaded existing ticket data")
+            channel_id = str(channel_id)
+            if channel_id in self.active_tickets:
+                self.ticket_store.set('active_tickets', channel_id, self.active_tickets[channel_id])
+            else:
+                self.ticket_store.delete('active_tickets', channel_id)
         except Exception as e:
-            logger.error(f"❌ Error loading ticket data: {e}")
-            self.active_tickets = {}
-            self.user_tickets = {}
+            logger.error(f"❌ Error saving ticket {channel_id}: {e}")
+    
+    def save_user_tickets(self, user_id):
+        """Journal the open ticket list of one user"""
+        try:
+            user_id = str(user_id)
+            self.ticket_store.set('user_tickets', user_id, self.user_tickets.get(user_id, []))
+        except Exception as e:
+            logger.error(f"❌ Error saving tickets for user {user_id}: {e}")
     
     def save_ticket_data(self):
-        """Save ticket data to file"""
+        """Compact all ticket data into a fresh snapshot"""
         try:
-            data = {
-                'active_tickets': self.active_tickets,
-                'user_tickets': self.user_tickets
-            }
-            with open(self.tickets_data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.ticket_store.compact()
             logger.info("✅ Saved ticket data")
         except Exception as e:
             logger.error(f"❌ Error saving ticket data: {e}")
@@ -281,14 +590,12 @@ class TicketSystem(commands.Cog):
         }
         
         # Add permissions for support roles
-        for role_id in config.TICKET_CONFIG['support_roles']:
-            role = guild.get_role(role_id)
-            if role:
-                overwrites[role] = discord.PermissionOverwrite(
-                    read_messages=True, 
-                    send_messages=True, 
-                    manage_messages=True
-                )
+        for role in self.settings.roles(guild, 'support_roles'):
+            overwrites[role] = discord.PermissionOverwrite(
+                read_messages=True, 
+                send_messages=True, 
+                manage_messages=True
+            )
         
         category = await guild.create_category(category_name, overwrites=overwrites)
         logger.info(f"✅ Created ticket category: {category_name}")
@@ -299,14 +606,18 @@ class TicketSystem(commands.Cog):
     async def setup_group(self, ctx):
         """Setup commands for ticket system"""
         if ctx.invoked_subcommand is None:
+            log_channel = self.settings.channel(ctx.guild, 'ticket_log_channel')
+            alert_channel = self.settings.channel(ctx.guild, 'ticket_alert_channel')
             embed = self.create_ticket_embed(
                 "Ticket System Setup",
                 (
                     "**Available Setup Commands:**\n"
                     f"`{ctx.prefix}setup ticketlog <#channel>` - Set ticket log channel\n"
-                    f"`{ctx.prefix}setup ticketpanel` - Create ticket panel\n\n"
+                    f"`{ctx.prefix}setup ticketpanel` - Create ticket panel\n"
+                    f"`{ctx.prefix}setup ticketalerts <#channel>` - Set staff alert channel\n\n"
                     f"**Current Configuration:**\n"
-                    f"📝 **Log Channel:** {f'<#{self.ticket_log_channel}>' if self.ticket_log_channel else 'Not set'}"
+                    f"📝 **Log Channel:** {log_channel.mention if log_channel else 'Not set'}\n"
+                    f"🔔 **Alert Channel:** {alert_channel.mention if alert_channel else 'Not set'}"
                 ),
                 guild=ctx.guild
             )
@@ -319,9 +630,7 @@ class TicketSystem(commands.Cog):
         
         if channel is None:
             # Show current config and instructions
-            current_channel = None
-            if self.ticket_log_channel:
-                current_channel = ctx.guild.get_channel(self.ticket_log_channel)
+            current_channel = self.settings.channel(ctx.guild, 'ticket_log_channel')
             
             embed = self.create_ticket_embed(
                 "🔧 Ticket Log Configuration",
@@ -340,8 +649,7 @@ class TicketSystem(commands.Cog):
             return
         
         # Save the log channel
-        self.ticket_log_channel = channel.id
-        self.save_ticket_config()
+        self.settings.set(ctx.guild.id, 'ticket_log_channel', channel.id)
         
         embed = self.create_ticket_embed(
             "✅ Ticket Log Channel Set",
@@ -357,6 +665,40 @@ class TicketSystem(commands.Cog):
         await ctx.send(embed=embed)
         logger.info(f"✅ Set ticket log channel to {channel.name} ({channel.id})")
     
+    @setup_group.command(name='ticketalerts')
+    @commands.has_permissions(administrator=True)
+    async def setup_ticket_alerts(self, ctx, channel: discord.TextChannel = None):
+        """Set the staff channel where batched ticket alerts are posted"""
+        
+        if channel is None:
+            current_channel = self.settings.channel(ctx.guild, 'ticket_alert_channel')
+            
+            embed = self.create_ticket_embed(
+                "🔧 Ticket Alert Configuration",
+                f"**Current alert channel:** {current_channel.mention if current_channel else 'Not configured'}\n\n"
+                f"**Usage:** `!setup ticketalerts #channel-name`\n"
+                f"**Example:** `!setup ticketalerts #staff-alerts`\n\n"
+                f"Alerts raised within {config.TICKET_CONFIG['alert_digest_window']} seconds of each other "
+                f"are combined into a single digest. Without an alert channel, staff roles are pinged "
+                f"inside the ticket.",
+                color=0xFFAA00,
+                guild=ctx.guild
+            )
+            await ctx.send(embed=embed)
+            return
+        
+        self.settings.set(ctx.guild.id, 'ticket_alert_channel', channel.id)
+        
+        embed = self.create_ticket_embed(
+            "✅ Ticket Alert Channel Set",
+            f"Staff alerts will now be batched into digests in {channel.mention}",
+            color=0x00FF00,
+            guild=ctx.guild
+        )
+        
+        await ctx.send(embed=embed)
+        logger.info(f"✅ Set ticket alert channel to {channel.name} ({channel.id})")
+    
     @setup_group.command(name='ticketpanel')
     @commands.has_permissions(administrator=True)
     async def setup_ticket_panel(self, ctx):
@@ -402,12 +744,12 @@ class TicketSystem(commands.Cog):
         except:
             pass
     
-    @commands.group(name='ticket', aliases=['tickets'], invoke_without_command=True)
+    @commands.group(name='ticket', aliases=['tickets'], invoke_without_command=True, extras={'help_tier': 'support'})
     async def ticket_group(self, ctx):
         """Ticket system - Admin commands"""
         if ctx.invoked_subcommand is None:
             # Only show this to admins, regular users shouldn't see all commands
-            if not any(role.id in config.TICKET_CONFIG['support_roles'] for role in ctx.author.roles):
+            if not self._is_staff(ctx.author):
                 await ctx.send("❌ You don't have permission to view ticket system commands. Use the ticket panel in the designated channel.", delete_after=10)
                 return
             
@@ -417,10 +759,12 @@ class TicketSystem(commands.Cog):
                 f"`{ctx.prefix}ticket close` - Close current ticket\n"
                 f"`{ctx.prefix}ticket add <user>` - Add user to ticket\n"
                 f"`{ctx.prefix}ticket remove <user>` - Remove user from ticket\n"
-                f"`{ctx.prefix}ticket list` - List all open tickets\n\n"
+                f"`{ctx.prefix}ticket list` - List all open tickets\n"
+                f"`{ctx.prefix}ticket stats [days]` - Response and resolution times\n\n"
                 "**Setup Commands:**\n"
                 f"`{ctx.prefix}setup ticketpanel` - Create ticket panel\n"
-                f"`{ctx.prefix}setup ticketlog <#channel>` - Set log channel",
+                f"`{ctx.prefix}setup ticketlog <#channel>` - Set log channel\n"
+                f"`{ctx.prefix}setup ticketalerts <#channel>` - Set staff alert channel",
                 guild=ctx.guild
             )
             await ctx.send(embed=embed)
@@ -448,14 +792,12 @@ class TicketSystem(commands.Cog):
         }
         
         # Add support role permissions
-        for role_id in config.TICKET_CONFIG['support_roles']:
-            role = guild.get_role(role_id)
-            if role:
-                overwrites[role] = discord.PermissionOverwrite(
-                    read_messages=True, 
-                    send_messages=True, 
-                    manage_messages=True
-                )
+        for role in self.settings.roles(guild, 'support_roles'):
+            overwrites[role] = discord.PermissionOverwrite(
+                read_messages=True, 
+                send_messages=True, 
+                manage_messages=True
+            )
         
         # Create the ticket channel
         channel = await guild.create_text_channel(
@@ -484,7 +826,9 @@ class TicketSystem(commands.Cog):
             self.user_tickets[user_id] = []
         self.user_tickets[user_id].append(channel.id)
         
-        self.save_ticket_data()
+        self.save_ticket(channel.id)
+        self.save_user_tickets(user_id)
+        self.analytics.record_created(ticket_type, datetime.now())
         
         # Send welcome message to ticket channel
         ticket_type_info = config.TICKET_CONFIG['ticket_types'].get(ticket_type, {'name': 'General', 'description': 'General support'})
@@ -512,10 +856,14 @@ class TicketSystem(commands.Cog):
         # Pin the welcome message
         await welcome_msg.pin()
         
+        # Hand the ticket to the least-loaded available staffer
+        if config.TICKET_CONFIG.get('auto_assign', True):
+            await self._assign_ticket(guild, channel, ticket_data)
+        
         logger.info(f"✅ Created ticket #{ticket_id:04d} for {user.name} ({user.id})")
         return channel
     
-    @ticket_group.command(name='close')
+    @ticket_group.command(name='close', extras={'help_tier': 'member'})
     async def close_ticket(self, ctx, *, reason: str = "No reason provided"):
         """Close the current ticket"""
         
@@ -561,6 +909,15 @@ class TicketSystem(commands.Cog):
         ticket_data['closed_at'] = datetime.now().isoformat()
         ticket_data['closed_by'] = closed_by.id
         ticket_data['close_reason'] = reason
+        self.analytics.record_closed(
+            ticket_data['ticket_type'],
+            self._get_ticket_age_seconds(ticket_data['created_at']),
+            datetime.now()
+        )
+        
+        self._release_assignment(ticket_data)
+        self.alert_cooldowns.pop(channel.id, None)
+        self.pending_alerts.pop(channel.id, None)
         
         # Remove from user tickets
         user_id = str(ticket_data['user_id'])
@@ -569,28 +926,41 @@ class TicketSystem(commands.Cog):
         
         # Remove from active tickets
         del self.active_tickets[channel_id]
-        self.save_ticket_data()
+        self.save_ticket(channel_id)
+        self.save_user_tickets(user_id)
         
         # Delete channel after short delay
-        await asyncio.sleep(10)
+        self.bot.scheduler.schedule('ticket_delete_channel', delay=10, payload={
+            'channel_id': channel.id,
+            'reason': f"Ticket closed by {closed_by}"
+        })
+        logger.info(f"✅ Closed ticket {channel.name} by {closed_by.name}")
+    
+    async def _delete_channel_job(self, payload):
+        """Scheduled job: delete a closed ticket channel"""
+        channel = self.bot.get_channel(payload['channel_id'])
+        if not channel:
+            return  # Already deleted
+        
         try:
-            await channel.delete(reason=f"Ticket closed by {closed_by}")
-            logger.info(f"✅ Closed ticket {channel.name} by {closed_by.name}")
-        except Exception as e:
-            logger.error(f"❌ Error deleting ticket channel: {e}")
+            await channel.delete(reason=payload['reason'])
+            logger.info(f"✅ Deleted ticket channel {channel.name}")
+        except discord.NotFound:
+            pass
     
     async def _send_transcript_to_logs(self, guild, channel, closed_by, reason, transcript_content):
         """Send transcript to the designated tickets log channel"""
         try:
             # Check if log channel is configured
-            if not self.ticket_log_channel:
+            log_channel_id = self.settings.get(guild.id, 'ticket_log_channel')
+            if not log_channel_id:
                 logger.warning("❌ No ticket log channel configured. Use !setup ticketlog to set one.")
                 return
             
             # Send to configured log channel
-            log_channel = self.bot.get_channel(self.ticket_log_channel)
+            log_channel = guild.get_channel(log_channel_id)
             if not log_channel:
-                logger.warning(f"❌ Configured ticket log channel {self.ticket_log_channel} not found")
+                logger.warning(f"❌ Configured ticket log channel {log_channel_id} not found")
                 return
             
             # Get the ticket user
@@ -666,19 +1036,260 @@ CONVERSATION:
             logger.error(f"❌ Error generating transcript: {e}")
             return f"Error generating transcript: {str(e)}"
     
+    def _get_ticket_age_seconds(self, created_at_str):
+        """Seconds elapsed since a ticket timestamp"""
+        created_at = datetime.fromisoformat(created_at_str)
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone().replace(tzinfo=None)
+        return max((datetime.now() - created_at).total_seconds(), 0.0)
+    
     def _get_ticket_duration(self, created_at_str):
         """Calculate ticket duration"""
         try:
-            created_at = datetime.fromisoformat(created_at_str)
-            duration = datetime.now() - created_at
-            hours = int(duration.total_seconds() // 3600)
-            minutes = int((duration.total_seconds() % 3600) // 60)
-            return f"{hours}h {minutes}m"
+            return self._format_seconds(self._get_ticket_age_seconds(created_at_str))
         except:
             return "Unknown"
     
+    def _format_seconds(self, seconds):
+        """Format a duration in seconds as a short string"""
+        if seconds is None:
+            return "n/a"
+        if seconds < 60:
+            return f"{int(seconds)}s"
+        hours = int(seconds // 3600)
+        minutes = int((seconds % 3600) // 60)
+        return f"{hours}h {minutes}m"
+    
+    def _is_staff(self, member):
+        """Check whether a member holds a support role"""
+        return self.settings.member_has_role(member, 'support_roles')
+    
+    def _is_available(self, member):
+        """Treat staff as available unless presence says they are offline"""
+        if not self.bot.intents.presences:
+            return True  # No presence data, so everyone counts as available
+        return member.status != discord.Status.offline
+    
+    def build_staff_index(self, guild):
+        """Seed the staff load index for a guild from the member cache"""
+        index = StaffLoadIndex()
+        for member in guild.members:
+            if not member.bot and self._is_staff(member):
+                index.add_staff(member.id, self._is_available(member))
+        
+        # Restore load from tickets that were assigned before a restart
+        for channel_id, ticket_data in self.active_tickets.items():
+            assignee = ticket_data.get('assigned_to')
+            if assignee and assignee in index and ticket_data.get('guild_id', guild.id) == guild.id:
+                index.adjust(assignee, 1)
+                self.assigned_tickets.setdefault(assignee, set()).add(int(channel_id))
+        
+        self.staff_indexes[guild.id] = index
+        logger.info(f"✅ Indexed {len(index.load)} staff members for ticket assignment in {guild.name}")
+        return index
+    
+    def _get_staff_index(self, guild):
+        """Get the staff load index for a guild, building it on first use"""
+        index = self.staff_indexes.get(guild.id)
+        if index is None:
+            index = self.build_staff_index(guild)
+        return index
+    
+    async def _assign_ticket(self, guild, channel, ticket_data, exclude=None):
+        """Assign a ticket to the least-loaded available staff member and ping them"""
+        try:
+            index = self._get_staff_index(guild)
+            assignee_id = index.least_loaded(exclude=exclude)
+            if assignee_id is None:
+                logger.warning(f"❌ No available staff to assign {channel.name} to")
+                return None
+            
+            index.adjust(assignee_id, 1)
+            self.assigned_tickets.setdefault(assignee_id, set()).add(channel.id)
+            ticket_data['assigned_to'] = assignee_id
+            ticket_data['guild_id'] = guild.id
+            self.save_ticket(channel.id)
+            
+            assignee = guild.get_member(assignee_id)
+            mention = assignee.mention if assignee else f"<@{assignee_id}>"
+            await channel.send(f"📌 This ticket has been assigned to {mention}.")
+            logger.info(f"✅ Assigned {channel.name} to staff member {assignee_id}")
+            return assignee_id
+        except Exception as e:
+            logger.error(f"❌ Error assigning ticket {channel.name}: {e}")
+            return None
+    
+    def _release_assignment(self, ticket_data):
+        """Drop a closed ticket from its assignee's load"""
+        assignee_id = ticket_data.get('assigned_to')
+        if not assignee_id:
+            return
+        
+        index = self.staff_indexes.get(ticket_data.get('guild_id'))
+        if index:
+            index.adjust(assignee_id, -1)
+        assigned = self.assigned_tickets.get(assignee_id)
+        if assigned:
+            assigned.discard(ticket_data['channel_id'])
+    
+    def alert_cooldown_remaining(self, channel_id):
+        """Seconds left before a ticket may alert staff again (0 if allowed)"""
+        last_alert = self.alert_cooldowns.get(channel_id)
+        if last_alert is None:
+            return 0
+        remaining = config.TICKET_CONFIG['alert_cooldown_seconds'] - (time.monotonic() - last_alert)
+        return max(remaining, 0)
+    
+    def start_alert_cooldown(self, channel_id):
+        """Start the alert cooldown for a ticket"""
+        self.alert_cooldowns[channel_id] = time.monotonic()
+    
+    def queue_staff_alert(self, channel, user):
+        """Queue an alert for the next staff digest"""
+        self.start_alert_cooldown(channel.id)
+        self.pending_alerts[channel.id] = (channel, user, datetime.now(timezone.utc))
+        
+        # The first alert in a window schedules the flush; later ones ride along
+        if self.alert_flush_task is None or self.alert_flush_task.done():
+            self.alert_flush_task = asyncio.create_task(self._flush_staff_alerts())
+    
+    async def _flush_staff_alerts(self):
+        """Wait out the digest window and post one message for all pending alerts"""
+        await asyncio.sleep(config.TICKET_CONFIG['alert_digest_window'])
+        
+        alerts = list(self.pending_alerts.values())
+        self.pending_alerts.clear()
+        # Alerts queued while the digests are sending start a new window
+        self.alert_flush_task = None
+        
+        # Each guild's alerts go to its own alert channel
+        by_guild = {}
+        for alert in alerts:
+            by_guild.setdefault(alert[0].guild, []).append(alert)
+        for guild, guild_alerts in by_guild.items():
+            await self.send_staff_digest(guild, guild_alerts)
+    
+    async def send_staff_digest(self, guild, alerts):
+        """Post one digest message for a guild's pending alerts"""
+        try:
+            alert_channel = self.settings.channel(guild, 'ticket_alert_channel')
+            if not alert_channel:
+                logger.warning(f"❌ Configured ticket alert channel {self.settings.get(guild.id, 'ticket_alert_channel')} not found")
+                return
+            
+            mentions = [role.mention for role in self.settings.roles(guild, 'support_roles')]
+            
+            # Skip tickets closed while waiting for the digest
+            open_alerts = [alert for alert in alerts if str(alert[0].id) in self.active_tickets]
+            if not open_alerts:
+                return
+            
+            lines = []
+            for channel, user, alerted_at in open_alerts[:25]:
+                assignee = self.active_tickets[str(channel.id)].get('assigned_to')
+                line = f"🎫 {channel.mention} • {user.mention} • {discord.utils.format_dt(alerted_at, style='R')}"
+                if assignee:
+                    line += f" • 📌 <@{assignee}>"
+                lines.append(line)
+            
+            if len(open_alerts) > 25:
+                lines.append(f"…and {len(open_alerts) - 25} more")
+            
+            embed = self.create_ticket_embed(
+                f"Staff Alert Digest ({len(open_alerts)})",
+                "🔔 The following tickets need attention:\n\n" + "\n".join(lines),
+                color=0xFFAA00,
+                guild=guild
+            )
+            
+            await alert_channel.send(" ".join(mentions) or None, embed=embed)
+            logger.info(f"🔔 Sent staff alert digest for {len(open_alerts)} ticket(s) in {guild.name}")
+        except Exception as e:
+            logger.error(f"❌ Error sending staff alert digest: {e}")
+    
+    async def rebalance_staff(self, member):
+        """Move a staffer's open tickets to other available staff"""
+        channel_ids = list(self.assigned_tickets.get(member.id, ()))
+        for channel_id in channel_ids:
+            ticket_data = self.active_tickets.get(str(channel_id))
+            channel = self.bot.get_channel(channel_id)
+            if not ticket_data or not channel:
+                continue
+            
+            self._release_assignment(ticket_data)
+            ticket_data.pop('assigned_to', None)
+            new_assignee = await self._assign_ticket(member.guild, channel, ticket_data, exclude=member.id)
+            if new_assignee is None:
+                self.save_ticket(channel_id)
+        
+        if channel_ids:
+            logger.info(f"🔄 Rebalanced {len(channel_ids)} ticket(s) away from {member.name}")
+    
+    @commands.Cog.listener()
+    async def on_presence_update(self, before, after):
+        """Track staff availability and rebalance when a staffer goes offline"""
+        index = self.staff_indexes.get(after.guild.id)
+        if index is None or after.id not in index:
+            return
+        
+        was_available = self._is_available(before)
+        is_available = self._is_available(after)
+        if was_available == is_available:
+            return
+        
+        index.set_available(after.id, is_available)
+        if not is_available:
+            await self.rebalance_staff(after)
+    
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        """Keep the staff index in sync with support role changes"""
+        index = self.staff_indexes.get(after.guild.id)
+        if index is None or after.bot:
+            return
+        
+        was_staff = self._is_staff(before)
+        is_staff = self._is_staff(after)
+        if was_staff == is_staff:
+            return
+        
+        if is_staff:
+            index.add_staff(after.id, self._is_available(after))
+        else:
+            index.remove_staff(after.id)
+            await self.rebalance_staff(after)
+    
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        """Record the first staff reply in a ticket"""
+        if message.author.bot or not message.guild:
+            return
+        
+        ticket_data = self.active_tickets.get(str(message.channel.id))
+        if not ticket_data or ticket_data.get('first_response_at'):
+            return
+        
+        # The ticket creator replying to their own ticket doesn't count
+        if message.author.id == ticket_data['user_id']:
+            return
+        
+        if not self._is_staff(message.author):
+            return
+        
+        try:
+            ticket_data['first_response_at'] = datetime.now().isoformat()
+            ticket_data['first_response_by'] = message.author.id
+            self.save_ticket(message.channel.id)
+            self.analytics.record_first_response(
+                ticket_data['ticket_type'],
+                self._get_ticket_age_seconds(ticket_data['created_at']),
+                datetime.now()
+            )
+        except Exception as e:
+            logger.error(f"❌ Error recording first response: {e}")
+    
     @ticket_group.command(name='add')
-    @commands.has_any_role(*[role_id for role_id in config.TICKET_CONFIG['support_roles']])
+    @support_staff_only()
     async def add_user_to_ticket(self, ctx, user: discord.Member):
         """Add a user to the current ticket (Staff only)"""
         
@@ -701,7 +1312,7 @@ CONVERSATION:
         logger.info(f"✅ Added {user.name} to ticket {ctx.channel.name}")
     
     @ticket_group.command(name='remove')
-    @commands.has_any_role(*[role_id for role_id in config.TICKET_CONFIG['support_roles']])
+    @support_staff_only()
     async def remove_user_from_ticket(self, ctx, user: discord.Member):
         """Remove a user from the current ticket (Staff only)"""
         
@@ -724,7 +1335,7 @@ CONVERSATION:
         logger.info(f"✅ Removed {user.name} from ticket {ctx.channel.name}")
     
     @ticket_group.command(name='list')
-    @commands.has_any_role(*[role_id for role_id in config.TICKET_CONFIG['support_roles']])
+    @support_staff_only()
     async def list_tickets(self, ctx):
         """List all open tickets (Staff only)"""
         
@@ -770,12 +1381,63 @@ CONVERSATION:
         
         await ctx.send(embed=embed)
     
+    @ticket_group.command(name='stats')
+    @support_staff_only()
+    async def ticket_stats(self, ctx, days: int = None):
+        """Show response and resolution percentiles (Staff only)"""
+        
+        if days is not None and days < 1:
+            await ctx.send("❌ **Error:** Days must be at least 1 (leave it out for all time).")
+            return
+        
+        summary = self.analytics.summary(days)
+        period = f"last {days} day(s)" if days else "all time"
+        
+        if not summary:
+            embed = self.create_ticket_embed(
+                "Ticket Statistics",
+                f"📊 No ticket activity recorded for {period}.",
+                guild=ctx.guild
+            )
+            await ctx.send(embed=embed)
+            return
+        
+        embed = self.create_ticket_embed(
+            "Ticket Statistics",
+            f"📊 Service levels for **{period}** (p50 / p90 / p99)",
+            guild=ctx.guild
+        )
+        
+        for ticket_type, bucket in list(summary.items())[:25]:  # Discord field limit
+            type_info = config.TICKET_CONFIG['ticket_types'].get(ticket_type, {'name': 'General'})
+            
+            lines = [f"📥 **Opened:** {bucket['created']} • 📤 **Closed:** {bucket['closed']}"]
+            for metric, label in (('first_response', '💬 **First reply:**'), ('resolution', '🔒 **Resolution:**')):
+                sketch = bucket[metric]
+                if sketch.count:
+                    percentiles = " / ".join(self._format_seconds(sketch.quantile(q)) for q in (0.5, 0.9, 0.99))
+                    lines.append(f"{label} {percentiles}")
+                else:
+                    lines.append(f"{label} n/a")
+            
+            embed.add_field(
+                name=f"{ticket_type} {type_info['name']}",
+                value="\n".join(lines),
+                inline=False
+            )
+        
+        await ctx.send(embed=embed)
+    
     @commands.Cog.listener()
     async def on_ready(self):
         """Set up persistent views when bot starts"""
         # Add the persistent views so dropdowns and buttons work after bot restart
         self.bot.add_view(TicketView(self.bot))
         self.bot.add_view(TicketActionView())
+        
+        # Seed the staff assignment index from the member cache
+        for guild in self.bot.guilds:
+            self.build_staff_index(guild)
     
     @tasks.loop(hours=1)
     async def auto_close_tickets(self):
@@ -783,7 +1445,7 @@ CONVERSATION:
         current_time = datetime.now(timezone.utc)
         tickets_to_close = []
         
-        for channel_id, ticket_data in self.active_tickets.items():
+        for channel_id, ticket_data in list(self.active_tickets.items()):
             try:
                 created_at = datetime.fromisoformat(ticket_data['created_at'])
                 # Make created_at timezone-aware if it isn't
@@ -829,27 +1491,40 @@ CONVERSATION:
                 ticket_data['status'] = 'auto_closed'
                 ticket_data['closed_at'] = current_time.isoformat()
                 ticket_data['close_reason'] = 'Auto-closed due to inactivity'
+                self.analytics.record_closed(
+                    ticket_data['ticket_type'],
+                    self._get_ticket_age_seconds(ticket_data['created_at']),
+                    datetime.now()
+                )
                 
                 # Generate transcript
                 await self._generate_transcript(channel, self.bot.user, "Auto-closed due to inactivity")
                 
                 # Remove from tracking
+                self._release_assignment(ticket_data)
+                self.alert_cooldowns.pop(channel.id, None)
+                self.pending_alerts.pop(channel.id, None)
                 user_id = str(ticket_data['user_id'])
                 if user_id in self.user_tickets and channel.id in self.user_tickets[user_id]:
                     self.user_tickets[user_id].remove(channel.id)
                 
                 del self.active_tickets[str(channel.id)]
+                self.save_ticket(channel.id)
+                self.save_user_tickets(user_id)
                 
                 # Delete channel after delay
-                await asyncio.sleep(300)  # 5 minutes
-                await channel.delete(reason="Auto-closed due to inactivity")
+                self.bot.scheduler.schedule('ticket_delete_channel', delay=300, payload={  # 5 minutes
+                    'channel_id': channel.id,
+                    'reason': "Auto-closed due to inactivity"
+                })
                 
                 logger.info(f"✅ Auto-closed ticket {channel.name}")
                 
             except Exception as e:
                 logger.error(f"❌ Error auto-closing ticket: {e}")
         
-        if tickets_to_close:
+        # Periodic compaction keeps the journal short
+        if self.ticket_store.pending_entries:
             self.save_ticket_data()
     
     @auto_close_tickets.before_loop
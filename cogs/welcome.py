@@ -7,13 +7,22 @@ Features:
 - Rich Discord embeds with corporate theming
 - Server boost detection and thank you messages
 - Member count tracking
+- Ordered join pipeline: invite attribution, auto-role, then one combined welcome card
+- Busy periods and raids: joins are coalesced into one welcome per flush
+- Rate-limited auto-role queue with retries and a resumable backfill
 """
 
 import discord
 from discord.ext import commands
+import asyncio
+import json
+import os
 import random
 import logging
+import time
+from datetime import timedelta
 import config
+from utils.raid import SlidingWindowCounter
 
 logger = logging.getLogger(__name__)
 
@@ -22,64 +31,213 @@ class Welcome(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
+        self.welcome_rates = {}  # channel_id -> SlidingWindowCounter of recent welcomes
+        self.welcome_queues = {}  # channel_id -> [(member, inviter)] waiting for the next flush
+        self.raid_batches = set()  # channel_ids whose pending batch contains raid joins
+        self.flush_tasks = {}  # channel_id -> scheduled flush task
+        self.auto_roles = {}  # guild_id -> validated auto-role (None if unusable), cleared on role changes
+        self.backfill_file = 'role_backfill.json'
+        self.active_backfills = set()  # guild_ids with a running backfill
+        self.role_worker = bot.role_worker  # Shared so all role changes use one rate budget
+        self.settings = bot.settings
+        
+    def cog_unload(self):
+        """Stop pending welcome flushes"""
+        for task in self.flush_tasks.values():
+            task.cancel()
         
     @commands.Cog.listener()
     async def on_member_join(self, member):
-        """Handle new member joins"""
+        """Join pipeline: attribute the invite, assign the auto-role, then send one welcome"""
+        raid = (config.FEATURES.get('raid_protection') and
+                self.bot.join_detector.record_join(member.guild.id, member.id))
+        
+        # Stage 1: invite attribution (queued for a batch during a raid)
+        inviter = None
+        invite_cog = self.bot.get_cog('InviteTracker')
+        if invite_cog:
+            try:
+                inviter = await invite_cog.track_join(member, raid)
+            except Exception as e:
+                logger.error(f"Error tracking invite for {member.name}: {e}")
+        
+        # Stage 2: auto-assign role to new member
+        await self.assign_auto_role(member)
+        
+        # Stage 3: one welcome message carrying the inviter info
         try:
             # Get the welcome channel
-            welcome_channel = self.bot.get_channel(config.WELCOME_CHANNEL_ID)
+            welcome_channel = self.settings.channel(member.guild, 'welcome_channel')
             if not welcome_channel:
                 logger.warning(f"Welcome channel not found for guild {member.guild.name}")
                 return
             
-            # Auto-assign role to new member
-            await self.assign_auto_role(member)
-            
-            # Create welcome embed
-            embed = await self.create_welcome_embed(member)
-            
-            # Send welcome message
-            await welcome_channel.send(embed=embed)
-            logger.info(f"👋 Welcomed new member {member.name} in {member.guild.name}")
+            await self.deliver_welcome(welcome_channel, member, inviter, raid)
             
         except Exception as e:
             logger.error(f"Error in welcome message for {member.name}: {e}")
     
-    async def assign_auto_role(self, member):
-        """Automatically assign role to new members"""
+    async def deliver_welcome(self, channel, member, inviter=None, raid=False):
+        """Send a welcome card now, or queue it when joins are arriving quickly"""
+        rate = self.welcome_rates.get(channel.id)
+        if rate is None:
+            rate = self.welcome_rates[channel.id] = SlidingWindowCounter(config.WELCOME_BATCH_CONFIG['rate_window'])
+        recent = rate.add()
+        
+        # Once a batch is open, later joins join it so ordering is kept
+        if raid or channel.id in self.welcome_queues or recent > config.WELCOME_BATCH_CONFIG['rate_threshold']:
+            self.welcome_queues.setdefault(channel.id, []).append((member, inviter))
+            if raid and channel.id not in self.raid_batches:
+                self.raid_batches.add(channel.id)
+                logger.warning(f"🛡️ Join burst in {member.guild.name}, summarizing welcomes")
+            if channel.id not in self.flush_tasks:
+                delay = config.RAID_CONFIG['batch_interval'] if raid else config.WELCOME_BATCH_CONFIG['flush_delay']
+                self.flush_tasks[channel.id] = asyncio.create_task(self._flush_later(channel, delay))
+            return
+        
+        embed = await self.create_welcome_embed(member, inviter)
+        await channel.send(embed=embed)
+        logger.info(f"👋 Welcomed new member {member.name} in {member.guild.name}")
+    
+    async def _flush_later(self, channel, delay):
+        """Send the channel's queued welcomes after the batching window"""
         try:
-            # Get the auto-assign role
-            auto_role = member.guild.get_role(config.AUTO_ROLE_ID)
-            if not auto_role:
-                logger.warning(f"Auto-assign role {config.AUTO_ROLE_ID} not found in {member.guild.name}")
-                return
-            
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            return
+        
+        # Take the batch before sending so joins during the send start a new one
+        self.flush_tasks.pop(channel.id, None)
+        entries = self.welcome_queues.pop(channel.id, [])
+        raid = channel.id in self.raid_batches
+        self.raid_batches.discard(channel.id)
+        if not entries:
+            return
+        
+        try:
+            await self.send_welcome_batch(channel, entries, raid)
+        except Exception as e:
+            logger.error(f"Error sending batched welcome in {channel}: {e}")
+    
+    async def send_welcome_batch(self, channel, entries, raid=False):
+        """Send one welcome for a batch of (member, inviter) entries"""
+        if len(entries) == 1 and not raid:
+            member, inviter = entries[0]
+            await channel.send(embed=await self.create_welcome_embed(member, inviter))
+            logger.info(f"👋 Welcomed new member {member.name} in {member.guild.name}")
+            return
+        
+        guild = entries[0][0].guild
+        members = [member for member, _ in entries]
+        
+        shown = members[:config.WELCOME_BATCH_CONFIG['max_mentions']]
+        mentions = " ".join(member.mention for member in shown)
+        if len(members) > len(shown):
+            mentions += f" and **{len(members) - len(shown)}** more"
+        
+        if raid:
+            embed = discord.Embed(
+                title=f"🛡️ {config.COMPANY_NAME} - Join Burst",
+                description=(
+                    f"**{len(members)}** members joined in a short time. Welcome to all of you!\n"
+                    "Individual welcomes are paused until joins slow down."
+                ),
+                color=config.EMBED_COLORS['warning']
+            )
+        else:
+            embed = discord.Embed(
+                title=f"⚡ {config.COMPANY_NAME} - New Members",
+                description=f"Please welcome our **{len(members)}** newest members!",
+                color=config.get_random_color()
+            )
+        embed.add_field(name="👥 New Members", value=mentions, inline=False)
+        
+        # Inviters in this batch, most joins first
+        inviter_counts = {}
+        for _, inviter in entries:
+            if inviter:
+                mention, count = inviter_counts.get(inviter.id, (inviter.mention, 0))
+                inviter_counts[inviter.id] = (mention, count + 1)
+        if inviter_counts:
+            ranked = sorted(inviter_counts.values(), key=lambda entry: entry[1], reverse=True)[:5]
+            embed.add_field(
+                name="📨 Invited By",
+                value="\n".join(f"🕵️ {mention} • **{count}**" for mention, count in ranked),
+                inline=True
+            )
+        
+        if raid:
+            cutoff = discord.utils.utcnow() - timedelta(days=config.RAID_CONFIG['new_account_days'])
+            embed.add_field(
+                name=f"🆕 Accounts Under {config.RAID_CONFIG['new_account_days']} Days",
+                value=f"`{sum(1 for member in members if member.created_at > cutoff)}`",
+                inline=True
+            )
+        embed.add_field(name="👥 Total Members", value=f"`{guild.member_count}`", inline=True)
+        embed.set_footer(text=config.BOT_FOOTER, icon_url=guild.icon.url if guild.icon else None)
+        embed.timestamp = discord.utils.utcnow()
+        
+        await channel.send(embed=embed)
+        logger.info(f"👋 Welcomed {len(members)} members in one message in {guild.name}")
+    
+    def get_auto_role(self, guild):
+        """Resolve and validate the auto-assign role, cached until roles change"""
+        if guild.id in self.auto_roles:
+            return self.auto_roles[guild.id]
+        
+        auto_role = self.settings.role(guild, 'auto_role')
+        if not auto_role:
+            logger.warning(f"Auto-assign role {self.settings.get(guild.id, 'auto_role')} not found in {guild.name}")
+            auto_role = None
+        elif not guild.me.guild_permissions.manage_roles:
             # Check if bot has permission to assign roles
-            if not member.guild.me.guild_permissions.manage_roles:
-                logger.error(f"Bot lacks 'Manage Roles' permission in {member.guild.name}")
-                return
-            
+            logger.error(f"Bot lacks 'Manage Roles' permission in {guild.name}")
+            auto_role = None
+        elif auto_role.position >= guild.me.top_role.position:
             # Check if the auto role is below bot's highest role
-            if auto_role.position >= member.guild.me.top_role.position:
-                logger.error(f"Auto-assign role {auto_role.name} is too high in hierarchy in {member.guild.name}")
-                return
+            logger.error(f"Auto-assign role {auto_role.name} is too high in hierarchy in {guild.name}")
+            auto_role = None
+        
+        self.auto_roles[guild.id] = auto_role
+        return auto_role
+    
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before, after):
+        """Revalidate the auto-role after role permission or position changes"""
+        self.auto_roles.pop(after.guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        """Revalidate the auto-role after a role is deleted"""
+        self.auto_roles.pop(role.guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_settings_update(self, guild_id, key, old, new):
+        """Re-resolve the auto-role when a guild changes it"""
+        if key == 'auto_role':
+            self.auto_roles.pop(guild_id, None)
+    
+    async def assign_auto_role(self, member):
+        """Queue the auto-assign role for a member, returning a future for the grant"""
+        try:
+            auto_role = self.get_auto_role(member.guild)
+            if not auto_role or auto_role in member.roles:
+                return None
             
-            # Assign the role
-            await member.add_roles(auto_role, reason="Auto-assigned role for new member")
-            logger.info(f"✅ Assigned role '{auto_role.name}' to new member {member.name}")
+            return self.role_worker.enqueue(member, auto_role, reason="Auto-assigned role for new member")
             
-        except discord.Forbidden:
-            logger.error(f"Bot lacks permission to assign role to {member.name}")
-        except discord.HTTPException as e:
-            logger.error(f"HTTP error while assigning role to {member.name}: {e}")
         except Exception as e:
             logger.error(f"Unexpected error assigning role to {member.name}: {e}")
+            return None
     
     @commands.Cog.listener()
     async def on_member_update(self, before, after):
         """Handle member updates (including server boosts)"""
         try:
+            # The bot's own roles changed, so the auto-role may have become (un)assignable
+            if after.id == self.bot.user.id and before.roles != after.roles:
+                self.auto_roles.pop(after.guild.id, None)
+            
             # Check if member started boosting
             if not before.premium_since and after.premium_since:
                 await self.handle_server_boost(after)
@@ -87,8 +245,8 @@ class Welcome(commands.Cog):
         except Exception as e:
             logger.error(f"Error handling member update for {after.name}: {e}")
     
-    async def create_welcome_embed(self, member):
-        """Create a professional welcome embed"""
+    async def create_welcome_embed(self, member, inviter=None):
+        """Create a professional welcome embed, crediting the inviter if known"""
         # Get random welcome message and color
         welcome_message = config.get_random_welcome_message(member.mention)
         embed_color = config.get_random_color()
@@ -120,6 +278,20 @@ class Welcome(commands.Cog):
             inline=True
         )
         
+        # Credit the inviter (replaces the separate attribution message)
+        invite_cog = self.bot.get_cog('InviteTracker')
+        if inviter and invite_cog:
+            stats = invite_cog.get_user_stats(member.guild.id, inviter.id)
+            embed.add_field(
+                name="📨 Invited By",
+                value=(
+                    f"🕵️ {inviter.mention}\n"
+                    f"📊 **{stats['total_invites']}** invites • 👥 **{stats['current_invites']}** still here\n"
+                    f"{invite_cog.get_recruitment_rank(stats['total_invites'])}"
+                ),
+                inline=False
+            )
+        
         # Add professional footer
         embed.set_footer(
             text=config.BOT_FOOTER,
@@ -135,8 +307,8 @@ class Welcome(commands.Cog):
         """Handle server boost thank you message"""
         try:
             # Get boost channel (fallback to welcome channel)
-            boost_channel = (self.bot.get_channel(config.BOOST_CHANNEL_ID) or 
-                           self.bot.get_channel(config.WELCOME_CHANNEL_ID))
+            boost_channel = (self.settings.channel(member.guild, 'boost_channel') or 
+                           self.settings.channel(member.guild, 'welcome_channel'))
             
             if not boost_channel:
                 logger.warning(f"No boost/welcome channel found for guild {member.guild.name}")
@@ -238,10 +410,12 @@ class Welcome(commands.Cog):
             member = ctx.author
         
         # Test role assignment
-        await self.assign_auto_role(member)
+        grant = await self.assign_auto_role(member)
+        if grant is not None:
+            await grant
         
         # Get the role name for confirmation
-        auto_role = member.guild.get_role(config.AUTO_ROLE_ID)
+        auto_role = self.settings.role(member.guild, 'auto_role')
         role_name = auto_role.name if auto_role else "Unknown Role"
         
         await ctx.send(f"🧪 **Testing auto-role assignment:** Attempted to assign `{role_name}` to {member.mention}")
@@ -258,16 +432,30 @@ class Welcome(commands.Cog):
     
     @commands.command(name='assignrole')
     @commands.has_permissions(administrator=True)
-    async def manual_assign_role(self, ctx, member: discord.Member = None):
-        """Manually assign the auto-role to a member (Admin only)"""
+    async def manual_assign_role(self, ctx, *, target: str = None):
+        """Manually assign the auto-role to a member, or to everyone missing it (Admin only)"""
+        if target and target.strip() == '--all-missing':
+            await self.backfill_auto_role(ctx)
+            return
+        
+        member = None
+        if target:
+            try:
+                member = await commands.MemberConverter().convert(ctx, target)
+            except commands.MemberNotFound:
+                pass
+        
         if member is None:
-            await ctx.send("❌ **Error:** Please mention a member to assign the role to.\n**Usage:** `!assignrole @member`")
+            await ctx.send(
+                "❌ **Error:** Please mention a member to assign the role to.\n"
+                "**Usage:** `!assignrole @member` or `!assignrole --all-missing`"
+            )
             return
         
         # Get the auto-assign role
-        auto_role = ctx.guild.get_role(config.AUTO_ROLE_ID)
+        auto_role = self.settings.role(ctx.guild, 'auto_role')
         if not auto_role:
-            await ctx.send(f"❌ **Error:** Auto-assign role (ID: {config.AUTO_ROLE_ID}) not found in this server.")
+            await ctx.send(f"❌ **Error:** Auto-assign role (ID: {self.settings.get(ctx.guild.id, 'auto_role')}) not found in this server.")
             return
         
         # Check if member already has the role
@@ -275,15 +463,129 @@ class Welcome(commands.Cog):
             await ctx.send(f"ℹ️ **Info:** {member.mention} already has the `{auto_role.name}` role.")
             return
         
-        # Assign the role
-        try:
-            await member.add_roles(auto_role, reason=f"Manual assignment by {ctx.author}")
+        # Assign the role through the rate-limited queue
+        if await self.role_worker.enqueue(member, auto_role, reason=f"Manual assignment by {ctx.author}"):
             await ctx.send(f"✅ **Success:** Assigned `{auto_role.name}` role to {member.mention}")
             logger.info(f"👤 Manually assigned role '{auto_role.name}' to {member.name} by {ctx.author.name}")
-        except discord.Forbidden:
-            await ctx.send("❌ **Error:** I don't have permission to assign roles to this member.")
+        else:
+            await ctx.send("❌ **Error:** Failed to assign role. Check my permissions and role position.")
+    
+    def load_backfill_checkpoints(self):
+        """Load role backfill checkpoints from JSON file"""
+        try:
+            if os.path.exists(self.backfill_file):
+                with open(self.backfill_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading role backfill checkpoints: {e}")
+        return {}
+    
+    def save_backfill_checkpoints(self, checkpoints):
+        """Save role backfill checkpoints to JSON file"""
+        try:
+            with open(self.backfill_file, 'w', encoding='utf-8') as f:
+                json.dump(checkpoints, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving role backfill checkpoints: {e}")
+    
+    def create_backfill_embed(self, guild, auto_role, checkpoint, state):
+        """Status embed for a running or finished backfill"""
+        titles = {
+            'running': ("🔄 Role Backfill Running", config.EMBED_COLORS['info']),
+            'complete': ("✅ Role Backfill Complete", config.EMBED_COLORS['success']),
+            'interrupted': ("⚠️ Role Backfill Interrupted", config.EMBED_COLORS['warning']),
+        }
+        title, color = titles[state]
+        
+        total = max(guild.member_count or 0, checkpoint['scanned'])
+        percent = checkpoint['scanned'] / total * 100 if total else 100
+        embed = discord.Embed(
+            title=title,
+            description=f"Assigning {auto_role.mention} to every member who is missing it.",
+            color=color
+        )
+        embed.add_field(name="👥 Scanned", value=f"`{checkpoint['scanned']}/{total}` ({percent:.0f}%)", inline=True)
+        embed.add_field(name="✅ Granted", value=f"`{checkpoint['granted']}`", inline=True)
+        embed.add_field(name="❌ Failed", value=f"`{checkpoint['failed']}`", inline=True)
+        if state == 'interrupted':
+            embed.add_field(
+                name="🔁 Resume",
+                value="Run `!assignrole --all-missing` again to continue from the last checkpoint.",
+                inline=False
+            )
+        embed.set_footer(text=config.BOT_FOOTER)
+        embed.timestamp = discord.utils.utcnow()
+        return embed
+    
+    async def backfill_auto_role(self, ctx):
+        """Grant the auto-role to all members missing it, checkpointing as it goes"""
+        guild = ctx.guild
+        if guild.id in self.active_backfills:
+            await ctx.send("ℹ️ **Info:** A role backfill is already running in this server.")
+            return
+        
+        self.auto_roles.pop(guild.id, None)
+        auto_role = self.get_auto_role(guild)
+        if not auto_role:
+            await ctx.send("❌ **Error:** The auto-assign role is missing or above my highest role.")
+            return
+        
+        # Resume from the last checkpoint if it was for the same role
+        checkpoints = self.load_backfill_checkpoints()
+        checkpoint = checkpoints.get(str(guild.id))
+        if not checkpoint or checkpoint.get('role_id') != auto_role.id:
+            checkpoint = {'role_id': auto_role.id, 'after': 0, 'scanned': 0, 'granted': 0, 'failed': 0}
+        elif checkpoint['after']:
+            await ctx.send(f"🔁 **Resuming** role backfill after {checkpoint['scanned']} scanned members.")
+        
+        status = await ctx.send(embed=self.create_backfill_embed(guild, auto_role, checkpoint, 'running'))
+        self.active_backfills.add(guild.id)
+        reason = f"Auto-role backfill by {ctx.author}"
+        last_edit = time.monotonic()
+        state = 'interrupted'
+        
+        async def process(chunk):
+            """Grant a chunk, then move the checkpoint past it"""
+            missing = [member for member in chunk if auto_role not in member.roles]
+            results = await asyncio.gather(*(self.role_worker.enqueue(member, auto_role, reason) for member in missing))
+            checkpoint['scanned'] += len(chunk)
+            checkpoint['granted'] += sum(results)
+            checkpoint['failed'] += len(results) - sum(results)
+            checkpoint['after'] = chunk[-1].id
+            checkpoints[str(guild.id)] = checkpoint
+            self.save_backfill_checkpoints(checkpoints)
+        
+        try:
+            chunk = []
+            after = discord.Object(id=checkpoint['after']) if checkpoint['after'] else None
+            async for member in guild.fetch_members(limit=None, after=after):
+                chunk.append(member)
+                if len(chunk) < config.ROLE_WORKER_CONFIG['backfill_chunk']:
+                    continue
+                
+                await process(chunk)
+                chunk = []
+                if time.monotonic() - last_edit >= config.ROLE_WORKER_CONFIG['progress_interval']:
+                    await status.edit(embed=self.create_backfill_embed(guild, auto_role, checkpoint, 'running'))
+                    last_edit = time.monotonic()
+            
+            if chunk:
+                await process(chunk)
+            
+            # Finished, so the next run starts from the beginning
+            checkpoints.pop(str(guild.id), None)
+            self.save_backfill_checkpoints(checkpoints)
+            state = 'complete'
+            logger.info(f"✅ Role backfill in {guild.name}: {checkpoint['granted']} granted, {checkpoint['failed']} failed")
+            
         except discord.HTTPException as e:
-            await ctx.send(f"❌ **Error:** Failed to assign role: {e}")
+            logger.error(f"Role backfill in {guild.name} interrupted: {e}")
+        finally:
+            self.active_backfills.discard(guild.id)
+            try:
+                await status.edit(embed=self.create_backfill_embed(guild, auto_role, checkpoint, state))
+            except discord.HTTPException:
+                pass
     
     @commands.command(name='welcomestats')
     @commands.cooldown(1, 30, commands.BucketType.guild)
@@ -305,12 +607,12 @@ class Welcome(commands.Cog):
         )
         embed.add_field(
             name="🤖 Bots", 
-            value=f"`{len([m for m in guild.members if m.bot])}`", 
+            value=f"`{self.bot.member_counters.bots(guild)}`", 
             inline=True
         )
         embed.add_field(
             name="👤 Humans", 
-            value=f"`{len([m for m in guild.members if not m.bot])}`", 
+            value=f"`{self.bot.member_counters.humans(guild)}`", 
             inline=True
         )
         
@@ -371,8 +673,7 @@ class Welcome(commands.Cog):
                         "• Role management system\n"
                         "• Professional support ticket system\n\n"
                         "**⚙️ Setup Required:**\n"
-                        "Please configure the bot by updating the channel IDs in `config.py` "
-                        "to match your server's channels.\n\n"
+                        "Please configure this server's channels and roles with `!settings`.\n\n"
                         "Use `!help` to see all available commands."
                     ),
                     color=config.EMBED_COLORS['welcome']
@@ -18,6 +18,12 @@ PREFIX = '!'
 # Bot Owner ID (Replace with your Discord user ID)
 OWNER_ID = int(os.getenv('OWNER_ID', '1400112309766062181'))
 
+# Slash command sync: the tree is only re-synced when it changes (force with !synccommands)
+COMMAND_SYNC = {
+    'state_file': 'command_sync.json',  # Hash of the last synced command tree
+    'dev_guild_id': int(os.getenv('DEV_GUILD_ID', '0')) or None,  # Development: sync to this server only (instant)
+}
+
 # ================================
 # BRANDING CONFIGURATION
 # ================================
@@ -45,6 +51,9 @@ THEME_COLORS = {
 # Main Guild ID (Replace with your server ID)
 GUILD_ID = int(os.getenv('GUILD_ID', '1417462654821335050'))
 
+# Channel and role IDs below are GUILD_ID's defaults; each server can override them with !settings
+# (other servers start with nothing set until an admin configures them)
+
 # Channel IDs
 WELCOME_CHANNEL_ID = int(os.getenv('WELCOME_CHANNEL_ID', '1417465985278939220'))
 BOOST_CHANNEL_ID = int(os.getenv('BOOST_CHANNEL_ID', '1417466202883620894'))
@@ -86,6 +95,14 @@ WELCOME_MESSAGES = [
     "⚗️ **{mention}** has joined our operations. Welcome to the corporation.",
 ]
 
+# Welcome batching: above this join rate, welcomes are combined into one message per flush
+WELCOME_BATCH_CONFIG = {
+    'rate_window': 10,  # Seconds of joins counted per welcome channel
+    'rate_threshold': 3,  # Joins per window before welcomes are batched
+    'flush_delay': 5,  # Seconds to collect joins into one combined welcome
+    'max_mentions': 25,  # Members mentioned per combined welcome (the rest are counted)
+}
+
 # ================================
 # BOOST MESSAGES
 # ================================
@@ -117,10 +134,10 @@ EMBED_COLORS = {
 BOT_FOOTER = f"{COMPANY_NAME} • {COMPANY_TAGLINE}"
 
 # ================================
-# DATABASE SETTINGS (for future use)
+# DATABASE SETTINGS
 # ================================
 
-# SQLite database file name
+# SQLite database file name (used by the job scheduler)
 DATABASE_FILE = 'lua_corporation_bot.db'
 
 # Database tables we'll need
@@ -130,6 +147,13 @@ DATABASE_TABLES = [
     'server_config' # Server-specific configuration
 ]
 
+# Delayed job scheduler settings
+SCHEDULER_CONFIG = {
+    'batch_size': 20,  # Maximum overdue jobs run at once (e.g. after a restart)
+    'max_attempts': 5,  # Drop a job after this many failures
+    'retry_delay': 30,  # Seconds before retrying a failed job (multiplied by attempt count)
+}
+
 # ================================
 # FEATURE FLAGS
 # ================================
@@ -142,6 +166,8 @@ FEATURES = {
     'role_selection': True,
     'auto_moderation': False,  # For future implementation
     'ticket_system': True,
+    'raid_protection': True,
+    'news_feeds': True,
 }
 
 # ================================
@@ -151,12 +177,18 @@ FEATURES = {
 # Ticket system settings
 TICKET_CONFIG = {
     'category_name': 'SUPPORT TICKETS',
-    'support_roles': ADMIN_ROLES,  # Roles that can view all tickets
+    'support_roles': ADMIN_ROLES,  # Roles that can view all tickets (default; per server via !settings)
     'auto_close_hours': 72,  # Auto-close inactive tickets after 72 hours
     'max_tickets_per_user': 3,  # Maximum open tickets per user
     'embed_color': THEME_COLORS['primary'],  # Professional black theme
     'server_name': COMPANY_NAME,
-    'log_channel_id': None,  # Will be set via !setup ticketlog command
+    'log_channel_id': None,  # Default; set per server via !setup ticketlog
+    'journal_compact_every': 500,  # Journal entries before tickets_data.json is rewritten (also compacted hourly)
+    'stats_retention_days': 90,  # Days of per-day SLA statistics to keep
+    'stats_save_delay': 30,  # Seconds ticket events are batched before ticket_stats.json is rewritten
+    'alert_cooldown_seconds': 300,  # Minimum time between "Alert Staff" uses per ticket
+    'alert_digest_window': 30,  # Seconds to collect alerts into one staff digest (set via !setup ticketalerts)
+    'auto_assign': True,  # Assign new tickets to the least-loaded staff member (offline staff are skipped via the presence intent)
     'ticket_types': {
         '❓': {'name': 'General Support', 'description': 'Questions about the server or community'},
         '⚠️': {'name': 'Report Issue', 'description': 'Report problematic behavior or content'},
@@ -165,6 +197,105 @@ TICKET_CONFIG = {
     }
 }
 
+# ================================
+# INVITE ANALYTICS CONFIGURATION
+# ================================
+
+# Daily invite rollups (invite_rollups.json)
+INVITE_ROLLUP_CONFIG = {
+    'journal_compact_every': 1000,  # Journal entries before the rollup snapshot is rewritten
+    'max_query_days': 365,  # Longest range accepted by !invites recent
+}
+
+# ================================
+# RAID PROTECTION CONFIGURATION
+# ================================
+
+# Join-burst detection; raid mode batches attribution and summarizes welcomes
+RAID_CONFIG = {
+    'window_seconds': 10,  # Sliding window for join rates
+    'guild_join_threshold': 10,  # Joins per window (whole server) that trip raid mode
+    'code_join_threshold': 6,  # Joins per window through a single invite code that trip raid mode
+    'cooldown_seconds': 120,  # Raid mode ends after this long below the threshold
+    'batch_interval': 15,  # Seconds between batched attributions and welcome summaries
+    'new_account_days': 7,  # Accounts younger than this that join during a raid count as fake invites
+}
+
+# ================================
+# ANNOUNCEMENT PROTECTION
+# ================================
+
+# Unauthorized messages in the announcements channel
+ANNOUNCEMENT_PROTECTION = {
+    'purge_window': 2,  # Seconds to collect messages into one bulk delete
+    'lock_window': 10,  # Sliding window for the flood check
+    'lock_threshold': 15,  # Unauthorized messages per window that lock the channel
+    'lock_seconds': 300,  # How long @everyone loses send permission
+}
+
+# Every announcement is also sent to these channels (e.g. partner guilds), comma-separated IDs
+ANNOUNCEMENT_FANOUT = {
+    'targets': [int(channel_id) for channel_id in os.getenv('ANNOUNCEMENT_TARGETS', '').split(',') if channel_id.strip()],
+    'auto_publish': True,  # Crosspost announcements sent to news channels
+    'sends_per_second': 1,  # Per target channel
+    'send_burst': 5,
+    'publishes_per_hour': 10,  # Discord's crosspost limit per channel
+    'timeout': 30,  # Seconds before a slow target is reported as failed
+}
+
+# Timed posts queued with !announce schedule
+SCHEDULED_ANNOUNCEMENTS = {
+    'min_interval': 600,  # Shortest allowed repeat interval (seconds)
+    'max_pending': 25,  # Scheduled announcements per guild
+    'max_delay_days': 365,  # Furthest a post can be scheduled ahead
+}
+
+# ================================
+# NEWS FEED CONFIGURATION
+# ================================
+
+# Game-news sources polled by the news cog and posted like !addnews
+NEWS_FEEDS = {
+    'poll_minutes': 15,
+    'timeout': 20,  # Seconds per request
+    'max_posts_per_poll': 5,  # Per source; the rest wait for the next poll
+    'seen_limit': 5000,  # Item hashes remembered for deduplication
+    'parser_threads': 2,
+    'sources': [
+        # {'name': 'Game Blog', 'url': 'https://example.com/feed.xml', 'type': 'rss'},
+        # {'name': 'Patch Notes', 'url': 'https://example.com/news', 'type': 'html', 'selector': 'article h2 a'},
+        # Optional per source: 'guild_id' (defaults to GUILD_ID)
+    ],
+}
+
+# ================================
+# DIRECT MESSAGE CONFIGURATION
+# ================================
+
+# Shared DM service (role confirmations, announcement warnings)
+DM_CONFIG = {
+    'merge_window': 2,  # Seconds to collect a user's DMs into one message
+    'dedupe_ttl': 300,  # Seconds before the same notice can be sent to a user again
+    'closed_ttl': 21600,  # Seconds to remember that a user's DMs are closed
+    'channel_cache_size': 5000,  # DM channels kept cached
+}
+
+# ================================
+# ROLE ASSIGNMENT CONFIGURATION
+# ================================
+
+# Queued role changes (auto-role, !assignrole --all-missing backfill and !bulkrole jobs)
+ROLE_WORKER_CONFIG = {
+    'grants_per_second': 2,  # Sustained role changes, kept under Discord's role-modify route limit
+    'burst': 5,  # Changes allowed back-to-back after a quiet period
+    'workers': 4,  # Concurrent requests in flight (they share the rate above)
+    'max_attempts': 5,  # Tries per grant before giving up on HTTP errors
+    'backoff_base': 2,  # Retry delay is backoff_base ** attempt seconds
+    'backoff_max': 300,  # Longest retry delay in seconds
+    'backfill_chunk': 50,  # Members per backfill checkpoint
+    'progress_interval': 10,  # Seconds between backfill and bulk job status message edits
+}
+
 # ================================
 # LOGGING CONFIGURATION
 # ================================
@@ -13,6 +13,13 @@ import logging
 import os
 from pathlib import Path
 import config
+from utils.command_sync import CommandSync
+from utils.counters import MemberCounters
+from utils.dm import DMService
+from utils.raid import JoinBurstDetector
+from utils.role_worker import RoleGrantWorker
+from utils.scheduler import JobScheduler
+from utils.settings import GuildSettings
 
 # Configure logging with UTF-8 encoding support
 logging.basicConfig(
@@ -36,6 +43,7 @@ class LuaCorporationBot(commands.Bot):
         intents.members = True  # Required for welcome messages and role assignment
         intents.invites = True  # Required for invite tracking
         intents.message_content = True  # Required for message commands
+        intents.presences = True  # Required to reassign tickets when staff go offline
         
         super().__init__(
             command_prefix=config.PREFIX,
@@ -48,6 +56,48 @@ class LuaCorporationBot(commands.Bot):
         # Store invite cache for tracking (will be empty without invite intent)
         self.invite_cache = {}
         
+        # Durable delayed actions shared by all cogs
+        self.scheduler = JobScheduler(self)
+        
+        # Per-guild channel and role settings (config.py values are the defaults)
+        self.settings = GuildSettings(self)
+        
+        # Slash command syncing, only when the command tree changes
+        self.command_sync = CommandSync(
+            self,
+            state_file=config.COMMAND_SYNC['state_file'],
+            dev_guild_id=config.COMMAND_SYNC['dev_guild_id']
+        )
+        
+        # Join-rate tracking shared by the welcome and invite cogs
+        self.join_detector = JoinBurstDetector(
+            window=config.RAID_CONFIG['window_seconds'],
+            guild_threshold=config.RAID_CONFIG['guild_join_threshold'],
+            code_threshold=config.RAID_CONFIG['code_join_threshold'],
+            cooldown=config.RAID_CONFIG['cooldown_seconds']
+        )
+        
+        # Human, bot and per-role member counts for statistics commands
+        self.member_counters = MemberCounters()
+        
+        # Rate-limited role changes shared by auto-roles and bulk role jobs
+        self.role_worker = RoleGrantWorker(
+            rate=config.ROLE_WORKER_CONFIG['grants_per_second'],
+            burst=config.ROLE_WORKER_CONFIG['burst'],
+            max_attempts=config.ROLE_WORKER_CONFIG['max_attempts'],
+            backoff_base=config.ROLE_WORKER_CONFIG['backoff_base'],
+            backoff_max=config.ROLE_WORKER_CONFIG['backoff_max'],
+            workers=config.ROLE_WORKER_CONFIG['workers']
+        )
+        
+        # Cached, deduplicated DM delivery shared by all cogs
+        self.dm = DMService(
+            merge_window=config.DM_CONFIG['merge_window'],
+            dedupe_ttl=config.DM_CONFIG['dedupe_ttl'],
+            closed_ttl=config.DM_CONFIG['closed_ttl'],
+            channel_cache_size=config.DM_CONFIG['channel_cache_size']
+        )
+        
     async def setup_hook(self):
         """Called when the bot is starting up"""
         logger.info(f"⚡ {config.COMPANY_NAME} Bot initializing...")
@@ -55,10 +105,13 @@ class LuaCorporationBot(commands.Bot):
         # Load all cogs
         await self.load_cogs()
         
-        # Sync slash commands
+        # Start the job dispatcher (pending jobs run once the bot is ready)
+        self.scheduler.start()
+        self.role_worker.start()
+        
+        # Sync slash commands (skipped when the tree hasn't changed since the last sync)
         try:
-            synced = await self.tree.sync()
-            logger.info(f"✅ Synced {len(synced)} slash command(s)")
+            await self.command_sync.sync()
         except Exception as e:
             logger.error(f"❌ Failed to sync commands: {e}")
     
@@ -82,6 +135,28 @@ class LuaCorporationBot(commands.Bot):
             except Exception as e:
                 logger.error(f"❌ Failed to load cog {cog_name}: {e}")
     
+    async def load_extension(self, name, *, package=None):
+        await super().load_extension(name, package=package)
+        self.dispatch('extension_update', name)
+
+    async def unload_extension(self, name, *, package=None):
+        await super().unload_extension(name, package=package)
+        self.dispatch('extension_update', name)
+
+    async def reload_extension(self, name, *, package=None):
+        await super().reload_extension(name, package=package)
+        self.dispatch('extension_update', name)
+
+    async def close(self):
+        """Disconnect and unload the cogs, then stop the background services they use"""
+        try:
+            await super().close()
+        finally:
+            self.scheduler.stop()
+            self.role_worker.stop()
+            self.dm.stop()
+            self.settings.close()
+    
     async def on_ready(self):
         """Called when the bot is ready and connected"""
         logger.info(f"✅ {self.user} is now online")
@@ -95,9 +170,32 @@ class LuaCorporationBot(commands.Bot):
         )
         await self.change_presence(activity=activity)
         
+        # The member cache was rebuilt, so reseed member counters on next use
+        self.member_counters.clear()
+        
         # Cache invites for all guilds
         await self.cache_invites()
     
+    async def on_member_join(self, member):
+        """Keep member counters current"""
+        self.member_counters.member_joined(member)
+    
+    async def on_member_remove(self, member):
+        """Keep member counters current"""
+        self.member_counters.member_left(member)
+    
+    async def on_member_update(self, before, after):
+        """Keep per-role counters current"""
+        self.member_counters.member_updated(before, after)
+    
+    async def on_guild_role_delete(self, role):
+        """Drop counters for deleted roles"""
+        self.member_counters.role_deleted(role)
+    
+    async def on_guild_remove(self, guild):
+        """Drop counters for guilds the bot left"""
+        self.member_counters.clear(guild.id)
+    
     async def cache_invites(self):
         """Cache current invites for invite tracking"""
         for guild in self.guilds:
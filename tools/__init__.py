@@ -0,0 +1,2 @@
+# Tools package for Lua Corporation Discord Bot
+# Standalone scripts that work on the bot's data files (no Discord connection)
\ No newline at end of file
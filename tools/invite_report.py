@@ -0,0 +1,266 @@
+"""
+Invite Retention Report for Lua Corporation Discord Bot
+Offline, vectorized analysis of the invite tracker's data file
+
+Features:
+- Loads packed invite history from invite_data.json into NumPy arrays
+- Monthly join cohorts with 7/30/90-day retention
+- Time-to-leave distribution for members who left
+- Per-inviter quality scores (smoothed retention, penalized by fakes)
+- Writes CSV tables plus a JSON summary; no Discord connection needed
+
+Usage:
+    python -m tools.invite_report --data invite_data.json --out reports
+"""
+
+import argparse
+import base64
+import csv
+import json
+import os
+import sys
+import time
+import zlib
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, only needed for reporting
+    np = None
+
+DAY = 86400
+RETENTION_DAYS = (7, 30, 90)
+LEAVE_BINS = [0, 3600, DAY, 7 * DAY, 30 * DAY, 90 * DAY]
+LEAVE_BIN_LABELS = ['<1h', '1h-1d', '1d-7d', '7d-30d', '30d-90d', '90d+']
+SMOOTHING_PRIOR = 5  # Pseudo-members pulling small inviters toward the guild average
+
+
+def decode_column(text):
+    """Decode a utils.packing column straight into an int64 array"""
+    if not text:
+        return np.empty(0, dtype=np.int64)
+    deltas = np.frombuffer(zlib.decompress(base64.b64decode(text)), dtype='<i8')
+    return np.cumsum(deltas, dtype=np.int64)
+
+
+def load_guild(guild_stats):
+    """Flatten one guild's per-inviter records into column arrays"""
+    inviter_ids = []
+    counters = []
+    member_inviter, member_joined, member_left = [], [], []
+
+    for index, (user_str, stats) in enumerate(guild_stats.items()):
+        inviter_ids.append(int(user_str))
+        counters.append((
+            stats.get('total_invites', 0),
+            stats.get('current_invites', 0),
+            stats.get('left_members', 0),
+            stats.get('fake_invites', 0)
+        ))
+
+        if 'invited_users' in stats:
+            # Files written before packed storage
+            joined = np.array(
+                [datetime.fromisoformat(user['joined_at']).timestamp() for user in stats['invited_users']],
+                dtype=np.int64
+            )
+            left_joined = left_at = np.empty(0, dtype=np.int64)
+        else:
+            joined = decode_column(stats.get('invited_at'))
+            left_joined = decode_column(stats.get('left_joined_at'))
+            left_at = decode_column(stats.get('left_at'))
+
+        member_inviter.append(np.full(len(joined) + len(left_joined), index, dtype=np.int64))
+        member_joined.append(joined)
+        member_joined.append(left_joined)
+        member_left.append(np.full(len(joined), -1, dtype=np.int64))  # -1 = still a member
+        member_left.append(left_at)
+
+    def concat(parts):
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    counters = np.array(counters, dtype=np.int64).reshape(-1, 4)
+    return {
+        'inviter_ids': np.array(inviter_ids, dtype=np.int64),
+        'total': counters[:, 0],
+        'current': counters[:, 1],
+        'left': counters[:, 2],
+        'fake': counters[:, 3],
+        'inviter': concat(member_inviter),
+        'joined': concat(member_joined),
+        'left_at': concat(member_left),
+    }
+
+
+def retention_masks(data, now, days):
+    """Members old enough to judge, and those of them still present after `days`"""
+    stayed = data['left_at'] < 0
+    tenure = np.where(stayed, now - data['joined'], data['left_at'] - data['joined'])
+    eligible = data['joined'] + days * DAY <= now
+    retained = eligible & (stayed | (tenure > days * DAY))
+    return eligible, retained
+
+
+def safe_ratio(numerator, denominator):
+    """Element-wise ratio with NaN where the denominator is zero"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.full(numerator.shape, np.nan), where=denominator > 0)
+
+
+def cohort_table(data, now):
+    """Retention per monthly join cohort"""
+    if not len(data['joined']):
+        return []
+
+    months = data['joined'].astype('datetime64[s]').astype('datetime64[M]')
+    cohorts, inverse = np.unique(months, return_inverse=True)
+    joined = np.bincount(inverse, minlength=len(cohorts))
+    still_here = np.bincount(inverse, weights=data['left_at'] < 0, minlength=len(cohorts))
+
+    columns = {}
+    for days in RETENTION_DAYS:
+        eligible, retained = retention_masks(data, now, days)
+        columns[days] = safe_ratio(
+            np.bincount(inverse, weights=retained, minlength=len(cohorts)),
+            np.bincount(inverse, weights=eligible, minlength=len(cohorts))
+        )
+
+    rows = []
+    for i, cohort in enumerate(cohorts):
+        row = {'cohort': str(cohort), 'joined': int(joined[i]), 'still_here': int(still_here[i])}
+        for days in RETENTION_DAYS:
+            row[f'retention_{days}d'] = round_or_none(columns[days][i])
+        rows.append(row)
+    return rows
+
+
+def leave_distribution(data):
+    """Histogram and percentiles of time from join to leave"""
+    leavers = data['left_at'] >= 0
+    durations = (data['left_at'][leavers] - data['joined'][leavers]).clip(min=0)
+
+    counts, _ = np.histogram(durations, bins=LEAVE_BINS + [np.iinfo(np.int64).max])
+    histogram = [{'bucket': label, 'leavers': int(count)} for label, count in zip(LEAVE_BIN_LABELS, counts)]
+
+    percentiles = {}
+    if len(durations):
+        for q, value in zip((10, 25, 50, 75, 90), np.percentile(durations, (10, 25, 50, 75, 90))):
+            percentiles[f'p{q}_hours'] = round(float(value) / 3600, 2)
+    return histogram, percentiles
+
+
+def inviter_table(data, now):
+    """Quality score per inviter: smoothed 30-day retention times the share of non-fake invites"""
+    n_inviters = len(data['inviter_ids'])
+    if not n_inviters:
+        return []
+
+    eligible, retained = retention_masks(data, now, 30)
+    eligible_count = np.bincount(data['inviter'], weights=eligible, minlength=n_inviters)
+    retained_count = np.bincount(data['inviter'], weights=retained, minlength=n_inviters)
+
+    guild_rate = retained_count.sum() / eligible_count.sum() if eligible_count.sum() else 0.0
+    smoothed = (retained_count + SMOOTHING_PRIOR * guild_rate) / (eligible_count + SMOOTHING_PRIOR)
+
+    raw_invites = data['total'] + data['fake']  # total_invites already excludes fakes
+    fake_share = np.nan_to_num(safe_ratio(data['fake'], raw_invites))
+    quality = smoothed * (1 - fake_share) * 100
+    # No eligible members means nothing to score; smoothing would just give the guild average
+    quality[eligible_count == 0] = np.nan
+
+    retention = safe_ratio(retained_count, eligible_count)
+    rows = []
+    for i in np.argsort(-quality, kind='stable'):  # Unscored (NaN) inviters sort last
+        rows.append({
+            'inviter_id': int(data['inviter_ids'][i]),
+            'total_invites': int(data['total'][i]),
+            'current_invites': int(data['current'][i]),
+            'left_members': int(data['left'][i]),
+            'fake_invites': int(data['fake'][i]),
+            'retention_30d': round_or_none(retention[i]),
+            'quality_score': round_or_none(quality[i], 2),
+        })
+    return rows
+
+
+def round_or_none(value, digits=4):
+    """Round a float for output, mapping NaN to None"""
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def write_csv(path, rows):
+    """Write a list of dicts as CSV"""
+    if not rows:
+        return
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def build_report(invite_stats, now, guild_filter=None):
+    """Compute all tables for every guild in the data file"""
+    report = {'generated_at': datetime.fromtimestamp(now).isoformat(), 'guilds': {}}
+    tables = {'cohorts': [], 'time_to_leave': [], 'inviters': []}
+
+    for guild_str, guild_stats in invite_stats.items():
+        if guild_filter and guild_str != guild_filter:
+            continue
+
+        data = load_guild(guild_stats)
+        cohorts = cohort_table(data, now)
+        histogram, percentiles = leave_distribution(data)
+        inviters = inviter_table(data, now)
+
+        tables['cohorts'].extend({'guild_id': guild_str, **row} for row in cohorts)
+        tables['time_to_leave'].extend({'guild_id': guild_str, **row} for row in histogram)
+        tables['inviters'].extend({'guild_id': guild_str, **row} for row in inviters)
+
+        eligible, retained = retention_masks(data, now, 30)
+        report['guilds'][guild_str] = {
+            'inviters': len(data['inviter_ids']),
+            'tracked_members': int(len(data['joined'])),
+            'current_members': int((data['left_at'] < 0).sum()),
+            'retention_30d': round_or_none(safe_ratio(retained.sum(), eligible.sum())),
+            'time_to_leave': percentiles,
+            'top_inviters': inviters[:10],
+        }
+
+    return report, tables
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Invite retention report from the bot's invite data file")
+    parser.add_argument('--data', default='invite_data.json', help="Path to invite_data.json")
+    parser.add_argument('--out', default='reports', help="Directory for the CSV and JSON reports")
+    parser.add_argument('--guild', default=None, help="Only report on this guild ID")
+    parser.add_argument('--now', type=float, default=None, help="Reference epoch time (default: current time)")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("❌ NumPy is required for invite reports: pip install numpy", file=sys.stderr)
+        return 1
+
+    if not os.path.exists(args.data):
+        print(f"❌ Invite data file not found: {args.data}", file=sys.stderr)
+        return 1
+
+    with open(args.data, 'r', encoding='utf-8') as f:
+        invite_stats = json.load(f)
+
+    now = args.now if args.now is not None else time.time()
+    report, tables = build_report(invite_stats, now, args.guild)
+
+    os.makedirs(args.out, exist_ok=True)
+    for name, rows in tables.items():
+        write_csv(os.path.join(args.out, f"{name}.csv"), rows)
+    with open(os.path.join(args.out, 'summary.json'), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"✅ Wrote invite reports for {len(report['guilds'])} guild(s) to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# Utilities package for Lua Corporation Discord Bot
+# Shared helpers used by the cogs (not loaded as extensions)
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Slash Command Sync for Lua Corporation Discord Bot
+Syncs the application command tree only when it has changed
+
+Features:
+- The serialized command tree is hashed and compared with the last synced hash
+- Unchanged trees skip the rate-limited sync call at startup
+- Optional development guild: commands are copied there and sync instantly
+- Forced resync for when Discord's copy has drifted
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+class CommandSync:
+    """Hash-gated application command syncing"""
+
+    def __init__(self, bot, state_file='command_sync.json', dev_guild_id=None):
+        self.bot = bot
+        self.state_file = state_file
+        self.dev_guild = discord.Object(id=dev_guild_id) if dev_guild_id else None
+        self.hashes = {}  # scope -> hash of the last synced tree
+        self.load_state()
+
+    def load_state(self):
+        """Load the last synced hashes from JSON file"""
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    self.hashes = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading command sync state: {e}")
+
+    def save_state(self):
+        """Save the last synced hashes to JSON file"""
+        try:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(self.hashes, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving command sync state: {e}")
+
+    @property
+    def scope(self):
+        """Key for the synced tree: application plus guild (or global)"""
+        target = self.dev_guild.id if self.dev_guild else 'global'
+        return f"{self.bot.application_id}:{target}"
+
+    def tree_hash(self):
+        """Hash of the command payload that would be sent to Discord"""
+        tree = self.bot.tree
+        payload = sorted(
+            (command.to_dict(tree) for command in tree.get_commands(guild=self.dev_guild)),
+            key=lambda command: (command.get('type', 1), command['name'])
+        )
+        data = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    async def sync(self, force=False):
+        """Sync the command tree if it changed; returns the synced commands, or None if skipped"""
+        if self.dev_guild:
+            self.bot.tree.copy_global_to(guild=self.dev_guild)
+
+        scope = self.scope
+        tree_hash = self.tree_hash()
+        if not force and self.hashes.get(scope) == tree_hash:
+            logger.info(f"⏭️ Slash commands unchanged, skipping sync ({scope})")
+            return None
+
+        synced = await self.bot.tree.sync(guild=self.dev_guild)
+        self.hashes[scope] = tree_hash
+        self.save_state()
+        logger.info(f"✅ Synced {len(synced)} slash command(s) ({scope})")
+        return synced
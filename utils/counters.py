@@ -0,0 +1,93 @@
+"""
+Member Counters for Lua Corporation Discord Bot
+Precomputed human, bot and per-role member counts
+
+Features:
+- Seeded once per guild from the member cache on first use
+- Kept current from member join, leave and update events
+- O(1) reads for statistics commands
+"""
+
+from collections import Counter
+
+class GuildCounts:
+    """Member counts for one guild"""
+
+    __slots__ = ('humans', 'bots', 'roles')
+
+    def __init__(self):
+        self.humans = 0
+        self.bots = 0
+        self.roles = Counter()  # role_id -> members with the role
+
+    def add(self, member, sign=1):
+        if member.bot:
+            self.bots += sign
+        else:
+            self.humans += sign
+        for role in member.roles:
+            if not role.is_default():
+                self.roles[role.id] += sign
+
+
+class MemberCounters:
+    """Per-guild member counters maintained from gateway events"""
+
+    def __init__(self):
+        self.guilds = {}  # guild_id -> GuildCounts
+
+    def get(self, guild):
+        """Counts for a guild, seeding them from the member cache on first use"""
+        counts = self.guilds.get(guild.id)
+        if counts is None:
+            counts = self.guilds[guild.id] = GuildCounts()
+            for member in guild.members:
+                counts.add(member)
+        return counts
+
+    def humans(self, guild):
+        return self.get(guild).humans
+
+    def bots(self, guild):
+        return self.get(guild).bots
+
+    def role_members(self, role):
+        """Number of members with a role"""
+        if role.is_default():
+            return self.humans(role.guild) + self.bots(role.guild)
+        return self.get(role.guild).roles[role.id]
+
+    def clear(self, guild_id=None):
+        """Forget counts so they are reseeded on next use"""
+        if guild_id is None:
+            self.guilds.clear()
+        else:
+            self.guilds.pop(guild_id, None)
+
+    # Event hooks: unseeded guilds are skipped, seeding later reads the cache
+
+    def member_joined(self, member):
+        counts = self.guilds.get(member.guild.id)
+        if counts is not None:
+            counts.add(member)
+
+    def member_left(self, member):
+        counts = self.guilds.get(member.guild.id)
+        if counts is not None:
+            counts.add(member, -1)
+
+    def member_updated(self, before, after):
+        counts = self.guilds.get(after.guild.id)
+        if counts is None or before.roles == after.roles:
+            return
+        before_ids = {role.id for role in before.roles if not role.is_default()}
+        after_ids = {role.id for role in after.roles if not role.is_default()}
+        for role_id in after_ids - before_ids:
+            counts.roles[role_id] += 1
+        for role_id in before_ids - after_ids:
+            counts.roles[role_id] -= 1
+
+    def role_deleted(self, role):
+        counts = self.guilds.get(role.guild.id)
+        if counts is not None:
+            counts.roles.pop(role.id, None)
@@ -0,0 +1,161 @@
+"""
+DM Delivery Service for Lua Corporation Discord Bot
+Shared direct-message sending with caching and deduplication
+
+Features:
+- Cached DM channels so repeat DMs skip the channel-creation call
+- Per-user merge window: DMs queued close together go out as one message
+- Dedupe keys suppress repeats of the same notice within a TTL; a changed notice always goes out
+- Users with closed DMs are remembered instead of hitting Forbidden again
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+MAX_EMBEDS_PER_MESSAGE = 10  # Discord limit
+
+class DMService:
+    """Sends DMs through a per-user merge window"""
+
+    def __init__(self, merge_window=2.0, dedupe_ttl=300, closed_ttl=21600, channel_cache_size=5000):
+        self.merge_window = merge_window
+        self.dedupe_ttl = dedupe_ttl
+        self.closed_ttl = closed_ttl
+        self.channel_cache_size = channel_cache_size
+        self.channels = OrderedDict()  # user_id -> DMChannel, least recently used first
+        self.closed = {}  # user_id -> monotonic time the "DMs closed" result expires
+        self.recent = {}  # (user_id, key) -> (monotonic expiry, fingerprint of the delivered embed)
+        self.pending = {}  # user_id -> {'user', 'embeds': {key: embed}, 'futures': [...]}
+        self.flush_tasks = {}  # user_id -> flush task
+
+    def stop(self):
+        """Cancel pending flushes"""
+        for task in self.flush_tasks.values():
+            task.cancel()
+        self.flush_tasks.clear()
+        for batch in self.pending.values():
+            for future in batch['futures']:
+                if not future.done():
+                    future.set_result(False)
+        self.pending.clear()
+
+    def dms_closed(self, user_id):
+        """Whether the user recently rejected a DM"""
+        expires = self.closed.get(user_id)
+        if expires is None:
+            return False
+        if time.monotonic() >= expires:
+            del self.closed[user_id]
+            return False
+        return True
+
+    @staticmethod
+    def fingerprint(embed):
+        """Content of an embed, ignoring its timestamp"""
+        data = embed.to_dict()
+        data.pop('timestamp', None)
+        return json.dumps(data, sort_keys=True)
+
+    def _recently_sent(self, user_id, key, fingerprint, now):
+        """Whether this exact notice was delivered under the key within the TTL"""
+        entry = self.recent.get((user_id, key))
+        if entry is None:
+            return False
+        expires, sent_fingerprint = entry
+        if now >= expires:
+            del self.recent[(user_id, key)]
+            return False
+        return sent_fingerprint == fingerprint
+
+    def _prune_recent(self, now):
+        if len(self.recent) > 10000:
+            self.recent = {entry: value for entry, value in self.recent.items() if value[0] > now}
+
+    def send(self, user, embed, key=None):
+        """Queue a DM and return a future resolving to True if it was (or already had been) delivered
+
+        DMs with the same string key replace each other while queued, and the
+        same notice delivered under a key within the dedupe TTL is not sent
+        again. A different notice under the key (e.g. a newer state) is sent.
+        """
+        future = asyncio.get_running_loop().create_future()
+        if self.dms_closed(user.id):
+            future.set_result(False)
+            return future
+
+        now = time.monotonic()
+        if key is not None and self._recently_sent(user.id, key, self.fingerprint(embed), now):
+            # The user already has this notice, so drop any older queued version of the key
+            batch = self.pending.get(user.id)
+            if batch:
+                batch['embeds'].pop(key, None)
+            future.set_result(True)
+            return future
+
+        batch = self.pending.setdefault(user.id, {'user': user, 'embeds': {}, 'futures': []})
+        slot = key if key is not None else object()  # Unkeyed DMs never merge
+        batch['embeds'].pop(slot, None)
+        batch['embeds'][slot] = embed  # Latest version of a key goes last
+        batch['futures'].append(future)
+
+        if user.id not in self.flush_tasks:
+            self.flush_tasks[user.id] = asyncio.create_task(self._flush_later(user.id))
+        return future
+
+    async def get_channel(self, user):
+        """DM channel for a user, creating it only when not cached"""
+        channel = self.channels.get(user.id)
+        if channel is None:
+            channel = user.dm_channel or await user.create_dm()
+            self.channels[user.id] = channel
+            if len(self.channels) > self.channel_cache_size:
+                self.channels.popitem(last=False)
+        else:
+            self.channels.move_to_end(user.id)
+        return channel
+
+    async def _flush_later(self, user_id):
+        try:
+            await asyncio.sleep(self.merge_window)
+        except asyncio.CancelledError:
+            return
+
+        self.flush_tasks.pop(user_id, None)
+        batch = self.pending.pop(user_id, None)
+        if batch:
+            await self._deliver(batch)
+
+    async def _deliver(self, batch):
+        user = batch['user']
+        delivered = False
+        try:
+            channel = await self.get_channel(user)
+            embeds = list(batch['embeds'].values())
+            for start in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+                await channel.send(embeds=embeds[start:start + MAX_EMBEDS_PER_MESSAGE])
+            delivered = True
+
+            now = time.monotonic()
+            for key, embed in batch['embeds'].items():
+                if isinstance(key, str):
+                    self.recent[(user.id, key)] = (now + self.dedupe_ttl, self.fingerprint(embed))
+            self._prune_recent(now)
+        except discord.Forbidden:
+            # DMs closed or the bot is blocked; don't try again for a while
+            self.closed[user.id] = time.monotonic() + self.closed_ttl
+            self.channels.pop(user.id, None)
+        except discord.HTTPException as e:
+            logger.warning(f"⚠️ Failed to DM {user}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error sending DM to {user}: {e}")
+        finally:
+            for future in batch['futures']:
+                if not future.done():
+                    future.set_result(delivered)
@@ -0,0 +1,98 @@
+"""
+Feed Parsing for Lua Corporation Discord Bot
+Turns RSS, Atom and HTML news pages into plain news items
+
+Features:
+- RSS 2.0 and Atom parsing with the standard library
+- HTML pages parsed with a CSS selector (requires beautifulsoup4)
+- Stable item hashes for deduplication across restarts
+- Pure functions, safe to run in a worker thread
+"""
+
+import hashlib
+import html
+import re
+import xml.etree.ElementTree as ET
+from urllib.parse import urljoin
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:  # Optional dependency, only needed for HTML sources
+    BeautifulSoup = None
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+MEDIA = '{http://search.yahoo.com/mrss/}'
+TAG_PATTERN = re.compile(r'<[^>]+>')
+SUMMARY_LENGTH = 1000
+
+def clean_text(text):
+    """Strip markup and collapse whitespace"""
+    text = html.unescape(TAG_PATTERN.sub(' ', text or ''))
+    return ' '.join(text.split())
+
+def shorten(text, length=SUMMARY_LENGTH):
+    return text if len(text) <= length else text[:length - 1].rstrip() + '…'
+
+def item_hash(item):
+    """Stable identity for a news item (its GUID, else its link, else its title)"""
+    key = item.get('id') or item.get('link') or item.get('title') or ''
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+def _rss_image(element):
+    enclosure = element.find('enclosure')
+    if enclosure is not None and enclosure.get('type', '').startswith('image/'):
+        return enclosure.get('url')
+    for tag in (f'{MEDIA}content', f'{MEDIA}thumbnail'):
+        media = element.find(tag)
+        if media is not None and media.get('url'):
+            return media.get('url')
+    return None
+
+def parse_feed(text, base_url=''):
+    """Parse an RSS or Atom document into items, newest first as published"""
+    root = ET.fromstring(text)
+    items = []
+
+    for element in root.iter('item'):  # RSS 2.0
+        link = (element.findtext('link') or '').strip()
+        items.append({
+            'id': (element.findtext('guid') or '').strip() or link,
+            'title': shorten(clean_text(element.findtext('title')), 240),
+            'link': urljoin(base_url, link) if link else None,
+            'summary': shorten(clean_text(element.findtext('description'))),
+            'image': _rss_image(element),
+        })
+
+    for element in root.iter(f'{ATOM}entry'):
+        link = None
+        for candidate in element.findall(f'{ATOM}link'):
+            if candidate.get('rel', 'alternate') == 'alternate':
+                link = urljoin(base_url, candidate.get('href', ''))
+                break
+        summary = element.findtext(f'{ATOM}summary') or element.findtext(f'{ATOM}content')
+        items.append({
+            'id': (element.findtext(f'{ATOM}id') or '').strip() or link,
+            'title': shorten(clean_text(element.findtext(f'{ATOM}title')), 240),
+            'link': link,
+            'summary': shorten(clean_text(summary)),
+            'image': _rss_image(element),
+        })
+
+    return [item for item in items if item['title']]
+
+def parse_html(text, selector, base_url=''):
+    """Parse news links out of an HTML page using a CSS selector"""
+    if BeautifulSoup is None:
+        raise RuntimeError("beautifulsoup4 is required for HTML news sources")
+
+    soup = BeautifulSoup(text, 'html.parser')
+    items = []
+    for element in soup.select(selector):
+        anchor = element if element.name == 'a' else element.find('a')
+        href = anchor.get('href') if anchor else None
+        title = clean_text(element.get_text(' '))
+        if not title:
+            continue
+        link = urljoin(base_url, href) if href else None
+        items.append({'id': link or title, 'title': shorten(title, 240), 'link': link, 'summary': '', 'image': None})
+    return items
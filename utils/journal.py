@@ -0,0 +1,130 @@
+"""
+Journaled Store for Lua Corporation Discord Bot
+Crash-safe JSON state with O(1) writes
+
+Features:
+- Each change appended to a journal as one fsync'd JSON line
+- Periodic compaction into a snapshot written with an atomic rename
+- Startup replays the snapshot plus any journal entries after it
+- Torn trailing lines from a crash are truncated before new appends
+- Corrupt entries are reported and the damaged journal is kept aside
+"""
+
+import json
+import logging
+import os
+import shutil
+
+logger = logging.getLogger(__name__)
+
+class JournaledStore:
+    """Dict-of-dicts state persisted as snapshot + append-only journal"""
+
+    def __init__(self, snapshot_file, journal_file=None, compact_every=500):
+        self.snapshot_file = snapshot_file
+        self.journal_file = journal_file or f"{os.path.splitext(snapshot_file)[0]}.journal"
+        self.compact_every = compact_every
+        self.state = {}  # collection name -> {key: value}
+        self.pending_entries = 0  # journal entries since the last snapshot
+        self._journal = None
+
+    def load(self, collections=()):
+        """Rebuild state from the snapshot and journal"""
+        self.state = {}
+        if os.path.exists(self.snapshot_file):
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+
+        for collection in collections:
+            self.state.setdefault(collection, {})
+
+        replayed = 0
+        corrupt = 0
+        if os.path.exists(self.journal_file):
+            with open(self.journal_file, 'rb') as f:
+                data = f.read()
+
+            # A torn trailing line (crash mid-write) is cut off so the next append starts on a fresh line
+            end = data.rfind(b'\n') + 1
+            if end < len(data):
+                logger.warning(f"⚠️ Dropping torn trailing journal entry ({len(data) - end} bytes) in {self.journal_file}")
+                with open(self.journal_file, 'r+b') as f:
+                    f.truncate(end)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            for line_number, line in enumerate(data[:end].splitlines(), 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.error(f"❌ Corrupt journal entry {line_number} in {self.journal_file}, it could not be replayed")
+                    corrupt += 1
+                    continue
+                self._apply(entry)
+                replayed += 1
+
+        self.pending_entries = replayed
+        if replayed:
+            logger.info(f"📒 Replayed {replayed} journal entries from {self.journal_file}")
+        if corrupt:
+            # Keep the damaged journal for inspection and start clean from what could be replayed
+            shutil.copyfile(self.journal_file, f"{self.journal_file}.corrupt")
+            logger.error(f"❌ Saved damaged journal to {self.journal_file}.corrupt and compacted {self.snapshot_file}")
+            self.compact()
+        return self.state
+
+    def _apply(self, entry):
+        collection = self.state.setdefault(entry['c'], {})
+        if entry['op'] == 'set':
+            collection[entry['k']] = entry['v']
+        elif entry['op'] == 'del':
+            collection.pop(entry['k'], None)
+
+    def _append(self, entry):
+        """Append one entry to the journal and flush it to disk"""
+        if self._journal is None:
+            self._journal = open(self.journal_file, 'a', encoding='utf-8')
+        self._journal.write(json.dumps(entry, separators=(',', ':')) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+        self.pending_entries += 1
+        if self.pending_entries >= self.compact_every:
+            self.compact()
+
+    def set(self, collection, key, value):
+        """Store a value and journal the change"""
+        key = str(key)
+        self.state.setdefault(collection, {})[key] = value
+        self._append({'op': 'set', 'c': collection, 'k': key, 'v': value})
+
+    def delete(self, collection, key):
+        """Remove a value and journal the change"""
+        key = str(key)
+        self.state.setdefault(collection, {}).pop(key, None)
+        self._append({'op': 'del', 'c': collection, 'k': key})
+
+    def compact(self):
+        """Write a full snapshot atomically and start a fresh journal"""
+        temp_file = f"{self.snapshot_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.snapshot_file)
+
+        # Entries are idempotent, so a crash before truncating only replays them again
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        with open(self.journal_file, 'w', encoding='utf-8') as f:
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.pending_entries = 0
+
+    def close(self):
+        """Compact and release the journal file"""
+        self.compact()
@@ -0,0 +1,44 @@
+"""
+Compact Array Packing for Lua Corporation Discord Bot
+Dense storage for large integer histories
+
+Features:
+- 64-bit signed integer arrays (Discord IDs, epoch seconds)
+- Delta + zlib compressed, base64 encoded so it fits in JSON files
+"""
+
+import base64
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+
+
+def int64_array(values=()):
+    """Create a packed array of 64-bit signed integers"""
+    return array('q', values)
+
+
+def pack_int64(values):
+    """Encode 64-bit integers as base64 of zlib-compressed little-endian deltas
+
+    Append-ordered histories (join times, snowflake IDs) have small deltas,
+    which zlib squeezes far better than the raw values.
+    """
+    if not len(values):
+        return ""
+    deltas = int64_array(current - previous for previous, current in zip((0, *values), values))
+    if sys.byteorder == 'big':
+        deltas.byteswap()
+    return base64.b64encode(zlib.compress(deltas.tobytes())).decode('ascii')
+
+
+def unpack_int64(text):
+    """Decode a string produced by pack_int64 back into an array"""
+    if not text:
+        return int64_array()
+    deltas = int64_array()
+    deltas.frombytes(zlib.decompress(base64.b64decode(text)))
+    if sys.byteorder == 'big':
+        deltas.byteswap()
+    return int64_array(accumulate(deltas))
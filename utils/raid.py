@@ -0,0 +1,126 @@
+"""
+Join Burst Detection for Lua Corporation Discord Bot
+Sliding-window join counters that switch guilds into raid mode
+
+Features:
+- O(1) sliding-window counters built from fixed sub-buckets
+- Per-guild and per-invite-code join rates
+- Raid mode that stays active until joins calm down
+- Duplicate-safe: several listeners may report the same join
+- Idle counters are swept once per window so rotating invites don't accumulate
+"""
+
+import time
+from collections import deque
+
+class SlidingWindowCounter:
+    """Counts events in the last `window` seconds using fixed sub-buckets"""
+
+    def __init__(self, window, resolution=1.0):
+        self.window = window
+        self.resolution = resolution
+        self.buckets = deque()  # [bucket_start, count], oldest first
+        self.total = 0
+
+    def _expire(self, now):
+        cutoff = now - self.window
+        while self.buckets and self.buckets[0][0] <= cutoff:
+            self.total -= self.buckets.popleft()[1]
+
+    def add(self, count=1, now=None):
+        """Record `count` events and return the count in the window"""
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+        bucket_start = now - (now % self.resolution)
+        if self.buckets and self.buckets[-1][0] == bucket_start:
+            self.buckets[-1][1] += count
+        else:
+            self.buckets.append([bucket_start, count])
+        self.total += count
+        return self.total
+
+    def count(self, now=None):
+        """Events in the window"""
+        self._expire(time.monotonic() if now is None else now)
+        return self.total
+
+
+class JoinBurstDetector:
+    """Tracks join rates per guild and invite code and flags raids"""
+
+    def __init__(self, window, guild_threshold, code_threshold, cooldown):
+        self.window = window
+        self.guild_threshold = guild_threshold
+        self.code_threshold = code_threshold
+        self.cooldown = cooldown
+        self.guild_counters = {}  # guild_id -> SlidingWindowCounter
+        self.code_counters = {}  # (guild_id, code) -> SlidingWindowCounter
+        self.raid_until = {}  # guild_id -> monotonic time raid mode ends
+        self.recent_joins = {}  # guild_id -> (deque of (time, member_id), set of member_ids)
+        self.next_sweep = 0.0  # monotonic time of the next idle-counter sweep
+
+    def _seen(self, guild_id, member_id, now):
+        """Remember a join, returning True if it was already reported"""
+        order, members = self.recent_joins.setdefault(guild_id, (deque(), set()))
+        while order and order[0][0] <= now - self.window:
+            members.discard(order.popleft()[1])
+        if member_id in members:
+            return True
+        order.append((now, member_id))
+        members.add(member_id)
+        return False
+
+    def _sweep(self, now):
+        """Drop counters with no events left in the window, at most once per window"""
+        if now < self.next_sweep:
+            return
+        self.next_sweep = now + self.window
+        for counters in (self.guild_counters, self.code_counters):
+            for key in [key for key, counter in counters.items() if counter.count(now) == 0]:
+                del counters[key]
+        for guild_id in [guild_id for guild_id, (order, _) in self.recent_joins.items()
+                         if not order or order[-1][0] <= now - self.window]:
+            del self.recent_joins[guild_id]
+
+    def _trip(self, guild_id, now):
+        self.raid_until[guild_id] = now + self.cooldown
+
+    def record_join(self, guild_id, member_id, now=None):
+        """Count a join for the guild and return whether raid mode is active"""
+        now = time.monotonic() if now is None else now
+        self._sweep(now)
+        if not self._seen(guild_id, member_id, now):
+            counter = self.guild_counters.get(guild_id)
+            if counter is None:
+                counter = self.guild_counters[guild_id] = SlidingWindowCounter(self.window)
+            if counter.add(now=now) >= self.guild_threshold:
+                self._trip(guild_id, now)
+        return self.in_raid_mode(guild_id, now)
+
+    def record_code_uses(self, guild_id, code, uses=1, now=None):
+        """Count joins through one invite code and return whether raid mode is active"""
+        now = time.monotonic() if now is None else now
+        self._sweep(now)
+        key = (guild_id, code)
+        counter = self.code_counters.get(key)
+        if counter is None:
+            counter = self.code_counters[key] = SlidingWindowCounter(self.window)
+        if counter.add(uses, now=now) >= self.code_threshold:
+            self._trip(guild_id, now)
+        return self.in_raid_mode(guild_id, now)
+
+    def in_raid_mode(self, guild_id, now=None):
+        """Whether the guild is in raid mode; any join during it extends the window"""
+        now = time.monotonic() if now is None else now
+        until = self.raid_until.get(guild_id)
+        if until is None:
+            return False
+        if now >= until:
+            del self.raid_until[guild_id]
+            return False
+
+        # Keep raid mode alive while joins keep arriving above the threshold
+        counter = self.guild_counters.get(guild_id)
+        if counter and counter.count(now) >= self.guild_threshold:
+            self._trip(guild_id, now)
+        return True
@@ -0,0 +1,137 @@
+"""
+Ranking Structures for Lua Corporation Discord Bot
+Order-statistics containers for leaderboards
+
+Features:
+- Indexable skip list with O(log n) insert, remove, rank and select
+- Page iteration without sorting the whole data set
+"""
+
+import random
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key, level):
+        self.key = key
+        self.next = [None] * level
+        self.width = [1] * level  # Number of level-0 steps each link spans
+
+
+class RankedSkipList:
+    """Sorted collection of unique keys with positional access"""
+
+    MAX_LEVEL = 32
+
+    def __init__(self):
+        self.head = _Node(None, self.MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _random_level(self):
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+    def _find_path(self, key):
+        """Return the last node before `key` on every level and their positions"""
+        update = [self.head] * self.MAX_LEVEL
+        positions = [0] * self.MAX_LEVEL
+        node = self.head
+        position = 0
+        for level in reversed(range(self.level)):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    def insert(self, key):
+        """Insert a key (keys must be unique and comparable)"""
+        update, positions = self._find_path(key)
+        level = self._random_level()
+        if level > self.level:
+            for new_level in range(self.level, level):
+                update[new_level] = self.head
+                positions[new_level] = 0
+                self.head.width[new_level] = self.size + 1
+            self.level = level
+
+        node = _Node(key, level)
+        rank = positions[0]  # Number of keys before the new node
+        for i in range(level):
+            previous = update[i]
+            node.next[i] = previous.next[i]
+            previous.next[i] = node
+            skipped = rank - positions[i]
+            node.width[i] = previous.width[i] - skipped
+            previous.width[i] = skipped + 1
+
+        for i in range(level, self.level):
+            update[i].width[i] += 1
+
+        self.size += 1
+
+    def remove(self, key):
+        """Remove a key, returning True if it was present"""
+        update, _ = self._find_path(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return False
+
+        for i in range(self.level):
+            if update[i].next[i] is node:
+                update[i].width[i] += node.width[i] - 1
+                update[i].next[i] = node.next[i]
+            else:
+                update[i].width[i] -= 1
+
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+
+        self.size -= 1
+        return True
+
+    def rank(self, key):
+        """Return the 0-based position of a key, or None if absent"""
+        update, positions = self._find_path(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return None
+        return positions[0]
+
+    def _node_at(self, index):
+        node = self.head
+        remaining = index + 1
+        for level in reversed(range(self.level)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        return node
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("RankedSkipList index out of range")
+        return self._node_at(index).key
+
+    def slice(self, start, stop):
+        """Return the keys in positions [start, stop)"""
+        start = max(start, 0)
+        stop = min(stop, self.size)
+        if start >= stop:
+            return []
+
+        keys = []
+        node = self._node_at(start)
+        while node is not None and len(keys) < stop - start:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
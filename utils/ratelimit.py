@@ -0,0 +1,60 @@
+"""
+Rate Limiting for Lua Corporation Discord Bot
+Token buckets for pacing calls to individual Discord routes
+
+Features:
+- Token bucket with a steady refill rate and a burst allowance
+- Per-route buckets so one busy channel never slows another
+- Non-blocking try_acquire for budgets too small to wait on
+"""
+
+import asyncio
+import time
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `burst`"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self):
+        """Take a token if one is available right now"""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    async def acquire(self):
+        """Wait for a token"""
+        while not self.try_acquire():
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class RouteLimiter:
+    """Independent token buckets keyed by route (e.g. a channel ID)"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}  # route -> TokenBucket
+
+    def bucket(self, route):
+        bucket = self.buckets.get(route)
+        if bucket is None:
+            bucket = self.buckets[route] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def try_acquire(self, route):
+        return self.bucket(route).try_acquire()
+
+    async def acquire(self, route):
+        await self.bucket(route).acquire()
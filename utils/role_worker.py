@@ -0,0 +1,123 @@
+"""
+Role Grant Worker for Lua Corporation Discord Bot
+Queued role changes paced to Discord's role-modify rate limit
+
+Features:
+- A bounded pool of background workers drains a queue of role grants and removals
+- Token bucket keeps grants within the route budget
+- Transient HTTP errors are retried with exponential backoff
+- Duplicate changes for the same member and role are coalesced
+- Each grant returns a future so callers can track progress
+"""
+
+import asyncio
+import logging
+import time
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+class RoleGrantWorker:
+    """Rate-limited, retrying queue for member.add_roles / remove_roles calls"""
+
+    def __init__(self, rate=2.0, burst=5, max_attempts=5, backoff_base=2.0, backoff_max=300, workers=1):
+        self.rate = rate  # Role changes per second, shared by all workers
+        self.burst = burst
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.queue = asyncio.Queue()
+        self.pending = {}  # (guild_id, member_id, role_id, remove) -> future
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.tasks = []
+
+    def start(self):
+        """Start the worker tasks"""
+        self.tasks = [task for task in self.tasks if not task.done()]
+        while len(self.tasks) < self.workers:
+            self.tasks.append(asyncio.create_task(self._run()))
+
+    def stop(self):
+        """Stop the workers and fail anything still queued"""
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+        for future in self.pending.values():
+            if not future.done():
+                future.set_result(False)
+        self.pending.clear()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def enqueue(self, member, role, reason=None, remove=False):
+        """Queue a grant (or removal) and return a future resolving to True once it succeeds"""
+        key = (member.guild.id, member.id, role.id, remove)
+        future = self.pending.get(key)
+        if future is None:
+            future = self.pending[key] = asyncio.get_running_loop().create_future()
+            self.queue.put_nowait((key, member, role, reason, 1))
+        return future
+
+    async def _acquire(self):
+        """Wait for a token from the bucket"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def _finish(self, key, success):
+        future = self.pending.pop(key, None)
+        if future and not future.done():
+            future.set_result(success)
+
+    def _retry_later(self, item, error):
+        key, member, role, reason, attempt = item
+        if attempt >= self.max_attempts:
+            logger.error(f"❌ Giving up on role '{role.name}' change for {member} after {attempt} attempts: {error}")
+            self._finish(key, False)
+            return
+        delay = min(self.backoff_max, self.backoff_base ** attempt)
+        logger.warning(f"⚠️ Role change for {member} failed ({error}), retrying in {delay:.0f}s")
+        asyncio.get_running_loop().call_later(
+            delay, self.queue.put_nowait, (key, member, role, reason, attempt + 1)
+        )
+
+    async def _run(self):
+        while True:
+            item = await self.queue.get()
+            key, member, role, reason, attempt = item
+            try:
+                if key not in self.pending:
+                    continue  # Stopped or already resolved
+                remove = key[3]
+                if (role in member.roles) != remove:
+                    self._finish(key, True)  # Already in the wanted state
+                    continue
+
+                await self._acquire()
+                if remove:
+                    await member.remove_roles(role, reason=reason)
+                else:
+                    await member.add_roles(role, reason=reason)
+                self._finish(key, True)
+            except (discord.Forbidden, discord.NotFound) as e:
+                # Permanent: missing permissions, or the member/role is gone
+                logger.error(f"❌ Cannot change role '{role.name}' for {member}: {e}")
+                self._finish(key, False)
+            except discord.HTTPException as e:
+                self._retry_later(item, e)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error changing role for {member}: {e}")
+                self._finish(key, False)
+            finally:
+                self.queue.task_done()
@@ -0,0 +1,195 @@
+"""
+Job Scheduler for Lua Corporation Discord Bot
+Durable delayed actions that survive bot restarts
+
+Features:
+- Jobs persisted in the bot's SQLite database
+- Single timer-driven dispatcher sleeping until the next due job
+- Named handlers any cog can register and enqueue into
+- Overdue jobs run in bounded batches after a restart
+- Failed jobs are retried with a delay before being dropped
+- Persistent claim markers let handlers act at most once per occurrence
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import config
+
+logger = logging.getLogger(__name__)
+
+class JobScheduler:
+    """Persistent delayed-job queue with one dispatcher task"""
+
+    def __init__(self, bot, db_file=None):
+        self.bot = bot
+        self.db_file = db_file or config.DATABASE_FILE
+        self.handlers = {}  # job name -> async handler(payload)
+        self.dispatcher_task = None
+        self._wakeup = asyncio.Event()
+
+        self.db = sqlite3.connect(self.db_file)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS scheduled_jobs ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "name TEXT NOT NULL, "
+            "run_at REAL NOT NULL, "
+            "payload TEXT NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, "
+            "created_at REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_run_at ON scheduled_jobs (run_at)")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS job_claims ("
+            "key TEXT PRIMARY KEY, "
+            "claimed_at REAL NOT NULL)"
+        )
+        self.db.commit()
+
+    def register(self, name, handler):
+        """Register the coroutine that runs jobs with this name"""
+        self.handlers[name] = handler
+        self._wakeup.set()  # Jobs waiting on this handler may now be due
+
+    def unregister(self, name):
+        """Remove a job handler (pending jobs are kept until it returns)"""
+        self.handlers.pop(name, None)
+
+    def schedule(self, name, delay=0, payload=None, run_at=None):
+        """Persist a job and return its ID
+
+        Either `delay` (seconds from now) or an absolute `run_at` epoch
+        timestamp may be given.
+        """
+        now = time.time()
+        run_at = run_at if run_at is not None else now + delay
+        cursor = self.db.execute(
+            "INSERT INTO scheduled_jobs (name, run_at, payload, created_at) VALUES (?, ?, ?, ?)",
+            (name, run_at, json.dumps(payload or {}), now)
+        )
+        self.db.commit()
+        self._wakeup.set()
+        return cursor.lastrowid
+
+    def cancel(self, job_id):
+        """Cancel a pending job, returning True if it existed"""
+        cursor = self.db.execute("DELETE FROM scheduled_jobs WHERE id = ?", (job_id,))
+        self.db.commit()
+        return cursor.rowcount > 0
+
+    def claim(self, key, retention=30 * 86400):
+        """Durably mark `key` as handled, returning False if it already was
+
+        Handlers with side effects that must not repeat (e.g. posting a
+        message) claim before acting, so a job re-run after a crash between
+        the side effect and its deletion becomes a no-op.
+        """
+        now = time.time()
+        cursor = self.db.execute("INSERT OR IGNORE INTO job_claims (key, claimed_at) VALUES (?, ?)", (key, now))
+        self.db.execute("DELETE FROM job_claims WHERE claimed_at < ?", (now - retention,))
+        self.db.commit()
+        return cursor.rowcount > 0
+
+    def release(self, key):
+        """Drop a claim so the action can be attempted again"""
+        self.db.execute("DELETE FROM job_claims WHERE key = ?", (key,))
+        self.db.commit()
+
+    def pending(self, name=None):
+        """List pending jobs as (id, name, run_at, payload) tuples"""
+        if name:
+            rows = self.db.execute(
+                "SELECT id, name, run_at, payload FROM scheduled_jobs WHERE name = ? ORDER BY run_at", (name,)
+            )
+        else:
+            rows = self.db.execute("SELECT id, name, run_at, payload FROM scheduled_jobs ORDER BY run_at")
+        return [(job_id, job_name, run_at, json.loads(payload)) for job_id, job_name, run_at, payload in rows]
+
+    def start(self):
+        """Start the dispatcher task"""
+        if self.dispatcher_task is None or self.dispatcher_task.done():
+            count = self.db.execute("SELECT COUNT(*) FROM scheduled_jobs").fetchone()[0]
+            logger.info(f"⏰ Job scheduler starting with {count} pending job(s)")
+            self.dispatcher_task = asyncio.create_task(self._dispatch_loop())
+
+    def stop(self):
+        """Stop the dispatcher task and close the database"""
+        if self.dispatcher_task:
+            self.dispatcher_task.cancel()
+            self.dispatcher_task = None
+        self.db.close()
+
+    def _handler_filter(self):
+        """SQL fragment limiting queries to jobs with a registered handler"""
+        names = list(self.handlers)
+        return f"name IN ({', '.join('?' for _ in names)})", names
+
+    def _fetch_due(self, now, limit):
+        if not self.handlers:
+            return []
+        clause, names = self._handler_filter()
+        return self.db.execute(
+            f"SELECT id, name, payload, attempts FROM scheduled_jobs WHERE run_at <= ? AND {clause} "
+            f"ORDER BY run_at LIMIT ?",
+            (now, *names, limit)
+        ).fetchall()
+
+    def _next_run_at(self):
+        if not self.handlers:
+            return None
+        clause, names = self._handler_filter()
+        row = self.db.execute(f"SELECT MIN(run_at) FROM scheduled_jobs WHERE {clause}", names).fetchone()
+        return row[0] if row else None
+
+    async def _execute(self, job_id, name, payload, attempts):
+        """Run a single job and delete or reschedule it"""
+        handler = self.handlers.get(name)
+        if handler is None:
+            return
+
+        try:
+            await handler(json.loads(payload))
+            self.db.execute("DELETE FROM scheduled_jobs WHERE id = ?", (job_id,))
+        except Exception as e:
+            attempts += 1
+            if attempts >= config.SCHEDULER_CONFIG['max_attempts']:
+                logger.error(f"❌ Job {name} ({job_id}) failed {attempts} times, dropping it: {e}")
+                self.db.execute("DELETE FROM scheduled_jobs WHERE id = ?", (job_id,))
+            else:
+                logger.warning(f"⚠️ Job {name} ({job_id}) failed, retrying: {e}")
+                self.db.execute(
+                    "UPDATE scheduled_jobs SET attempts = ?, run_at = ? WHERE id = ?",
+                    (attempts, time.time() + config.SCHEDULER_CONFIG['retry_delay'] * attempts, job_id)
+                )
+
+    async def _dispatch_loop(self):
+        """Sleep until the next job is due, then run due jobs in bounded batches"""
+        await self.bot.wait_until_ready()
+        batch_size = config.SCHEDULER_CONFIG['batch_size']
+
+        while True:
+            try:
+                self._wakeup.clear()
+                jobs = self._fetch_due(time.time(), batch_size)
+                if jobs:
+                    await asyncio.gather(*(self._execute(*job) for job in jobs))
+                    self.db.commit()
+                    if len(jobs) == batch_size:
+                        # More overdue work may be waiting; let other tasks run first
+                        await asyncio.sleep(0)
+                        continue
+
+                next_run = self._next_run_at()
+                timeout = None if next_run is None else max(next_run - time.time(), 0)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in job dispatcher: {e}")
+                await asyncio.sleep(5)
@@ -0,0 +1,176 @@
+"""
+Guild Settings for Lua Corporation Discord Bot
+Per-guild channel and role settings that can change at runtime
+
+Features:
+- Typed schema of channel, role and list settings with config.py defaults
+- Overrides persisted in the bot's SQLite database
+- Read-through in-memory cache, loaded once per guild
+- A `settings_update` event is dispatched so cogs can react to changes
+"""
+
+import json
+import logging
+import sqlite3
+import time
+import config
+
+logger = logging.getLogger(__name__)
+
+class SettingSpec:
+    """Type, default and description of one setting"""
+
+    __slots__ = ('kind', 'default', 'description')
+
+    KINDS = ('channel', 'role', 'channels', 'roles')
+
+    def __init__(self, kind, default, description):
+        self.kind = kind
+        self.default = default  # callable(guild_id) -> default value
+        self.description = description
+
+    @property
+    def is_list(self):
+        return self.kind in ('channels', 'roles')
+
+    def validate(self, value):
+        """Normalize a value to the setting's type, raising ValueError if it doesn't fit"""
+        if self.is_list:
+            if not isinstance(value, (list, tuple, set)):
+                raise ValueError(f"expected a list of IDs, got {value!r}")
+            return list(dict.fromkeys(int(item) for item in value))
+        return None if value is None else int(value)
+
+
+def _main_guild_only(value, fallback=None):
+    """Default that only applies to the guild configured in config.GUILD_ID"""
+    return lambda guild_id: value() if guild_id == config.GUILD_ID else fallback
+
+
+# Channel and role IDs in config.py are the main guild's defaults; other guilds start unset
+SCHEMA = {
+    'welcome_channel': SettingSpec('channel', _main_guild_only(lambda: config.WELCOME_CHANNEL_ID), "Welcome messages"),
+    'boost_channel': SettingSpec('channel', _main_guild_only(lambda: config.BOOST_CHANNEL_ID), "Server boost thank-yous"),
+    'general_channel': SettingSpec('channel', _main_guild_only(lambda: config.GENERAL_CHANNEL_ID), "Fallback for welcome notices"),
+    'announcements_channel': SettingSpec('channel', _main_guild_only(lambda: config.ANNOUNCEMENTS_CHANNEL_ID), "Protected announcements channel"),
+    'announcement_targets': SettingSpec(
+        'channels', _main_guild_only(lambda: config.ANNOUNCEMENT_FANOUT['targets'], []),
+        "Extra channels announcements are sent to (may be in other servers)"
+    ),
+    'ticket_log_channel': SettingSpec('channel', _main_guild_only(lambda: config.TICKET_CONFIG['log_channel_id']), "Ticket transcripts and closures"),
+    'ticket_alert_channel': SettingSpec('channel', lambda guild_id: None, "Batched staff alert digests"),
+    'auto_role': SettingSpec('role', _main_guild_only(lambda: config.AUTO_ROLE_ID), "Role given to new members"),
+    'admin_roles': SettingSpec('roles', _main_guild_only(lambda: config.ADMIN_ROLES, []), "Staff roles shown admin help"),
+    'support_roles': SettingSpec('roles', _main_guild_only(lambda: config.TICKET_CONFIG['support_roles'], []), "Roles that can see and manage tickets"),
+    'announcement_role': SettingSpec('role', _main_guild_only(lambda: config.ANNOUNCEMENT_ROLE_ID), "Role allowed to post announcements"),
+}
+
+def can_target_channel(user, guild, channel):
+    """Whether `user`, configuring `guild`, may point it at `channel`
+
+    Channels in other servers need the user to manage that channel there;
+    the bot owner and the ANNOUNCEMENT_TARGETS channels are always allowed.
+    """
+    if channel.guild.id == guild.id:
+        return True
+    if user.id == config.OWNER_ID or channel.id in config.ANNOUNCEMENT_FANOUT['targets']:
+        return True
+    member = channel.guild.get_member(user.id)
+    return member is not None and channel.permissions_for(member).manage_channels
+
+class GuildSettings:
+    """Per-guild setting overrides with a read-through cache"""
+
+    def __init__(self, bot, db_file=None):
+        self.bot = bot
+        self.db_file = db_file or config.DATABASE_FILE
+        self.cache = {}  # guild_id -> {key: value} overrides
+
+        self.db = sqlite3.connect(self.db_file)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS guild_settings ("
+            "guild_id INTEGER NOT NULL, "
+            "key TEXT NOT NULL, "
+            "value TEXT NOT NULL, "
+            "updated_at REAL NOT NULL, "
+            "PRIMARY KEY (guild_id, key))"
+        )
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def overrides(self, guild_id):
+        """A guild's overridden settings, loaded from the database on first use"""
+        overrides = self.cache.get(guild_id)
+        if overrides is None:
+            rows = self.db.execute("SELECT key, value FROM guild_settings WHERE guild_id = ?", (guild_id,))
+            overrides = self.cache[guild_id] = {
+                key: json.loads(value) for key, value in rows if key in SCHEMA
+            }
+        return overrides
+
+    def get(self, guild_id, key):
+        """Current value of a setting (raises KeyError for unknown settings)"""
+        spec = SCHEMA[key]
+        overrides = self.overrides(guild_id)
+        if key in overrides:
+            return overrides[key]
+        return spec.default(guild_id)
+
+    def is_overridden(self, guild_id, key):
+        return key in self.overrides(guild_id)
+
+    def set(self, guild_id, key, value):
+        """Validate and store a setting, notifying listeners of the change"""
+        value = SCHEMA[key].validate(value)
+        old = self.get(guild_id, key)
+        self.db.execute(
+            "INSERT OR REPLACE INTO guild_settings (guild_id, key, value, updated_at) VALUES (?, ?, ?, ?)",
+            (guild_id, key, json.dumps(value), time.time())
+        )
+        self.db.commit()
+        self.overrides(guild_id)[key] = value
+        self._notify(guild_id, key, old, value)
+        return value
+
+    def reset(self, guild_id, key):
+        """Drop a guild's override so the config.py default applies again"""
+        old = self.get(guild_id, key)
+        self.db.execute("DELETE FROM guild_settings WHERE guild_id = ? AND key = ?", (guild_id, key))
+        self.db.commit()
+        self.overrides(guild_id).pop(key, None)
+        new = self.get(guild_id, key)
+        self._notify(guild_id, key, old, new)
+        return new
+
+    def _notify(self, guild_id, key, old, new):
+        if old != new:
+            logger.info(f"⚙️ Setting {key} changed in guild {guild_id}")
+            self.bot.dispatch('settings_update', guild_id, key, old, new)
+
+    # Typed lookups resolved within the guild
+
+    def channel(self, guild, key):
+        """Channel for a channel setting, or None if unset or not in this guild"""
+        channel_id = self.get(guild.id, key)
+        return guild.get_channel(channel_id) if channel_id else None
+
+    def role(self, guild, key):
+        """Role for a role setting, or None if unset or not in this guild"""
+        role_id = self.get(guild.id, key)
+        return guild.get_role(role_id) if role_id else None
+
+    def roles(self, guild, key):
+        """Roles for a role-list setting that exist in this guild"""
+        return [role for role in map(guild.get_role, self.get(guild.id, key)) if role]
+
+    def member_has_role(self, member, key):
+        """Whether a member has the role (or one of the roles) in a setting"""
+        guild = getattr(member, 'guild', None)
+        if guild is None:
+            return False
+        value = self.get(guild.id, key)
+        wanted = set(value) if SCHEMA[key].is_list else {value}
+        return any(role.id in wanted for role in member.roles)
@@ -0,0 +1,108 @@
+"""
+Streaming Quantile Sketch for Lua Corporation Discord Bot
+Answers percentile queries without keeping every sample around
+
+Features:
+- Log-bucketed histogram with bounded relative error (DDSketch style)
+- Constant-time inserts, queries proportional to the number of buckets
+- Mergeable, so daily sketches can be combined into any range
+- JSON-friendly serialization for persistence
+"""
+
+import math
+
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch with a fixed relative accuracy"""
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}  # bucket index -> count
+        self.zero_count = 0  # values <= 0 (e.g. instant replies)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Record a single sample"""
+        value = float(value)
+        if value <= 0:
+            self.zero_count += 1
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Fold another sketch with the same accuracy into this one"""
+        if other.count == 0:
+            return
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def quantile(self, q):
+        """Return the approximate value at quantile q (0.0 - 1.0)"""
+        if self.count == 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Midpoint of the bucket keeps the error within relative_accuracy
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+
+        return self.max
+
+    @property
+    def mean(self):
+        """Average of all recorded samples"""
+        return self.total / self.count if self.count else None
+
+    def to_dict(self):
+        """Serialize the sketch for JSON storage"""
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'buckets': {str(key): count for key, count in self.buckets.items()},
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a sketch from its serialized form"""
+        sketch = cls(data.get('relative_accuracy', 0.01))
+        sketch.buckets = {int(key): count for key, count in data.get('buckets', {}).items()}
+        sketch.zero_count = data.get('zero_count', 0)
+        sketch.count = data.get('count', 0)
+        sketch.total = data.get('total', 0.0)
+        sketch.min = data.get('min')
+        sketch.max = data.get('max')
+        return sketch